@@ -14,25 +14,36 @@
 
 """Main entry point for the `launch` package."""
 
-from . import actions
-from . import conditions
-from . import events
-from . import legacy
-from .action import Action
-from .condition import Condition
-from .event import Event
-from .event_handler import EventHandler
-from .launch_context import LaunchContext
-from .launch_description import LaunchDescription
-from .launch_description_entity import LaunchDescriptionEntity
-from .launch_description_source import LaunchDescriptionSource
-from .launch_introspector import LaunchIntrospector
-from .launch_service import LaunchService
-from .some_actions_type import SomeActionsType
-from .some_actions_type import SomeActionsType_types_tuple
-from .some_substitutions_type import SomeSubstitutionsType
-from .some_substitutions_type import SomeSubstitutionsType_types_tuple
-from .substitution import Substitution
+from .utilities import install_lazy_imports
+
+_module_names = {
+    'actions': 'actions',
+    'conditions': 'conditions',
+    'events': 'events',
+    'legacy': 'legacy',
+    'Action': 'action',
+    'Condition': 'condition',
+    'Event': 'event',
+    'EventHandler': 'event_handler',
+    'LaunchContext': 'launch_context',
+    'LaunchDescription': 'launch_description',
+    'LaunchDescriptionEntity': 'launch_description_entity',
+    'LaunchDescriptionIndex': 'launch_description_index',
+    'LaunchDescriptionSource': 'launch_description_source',
+    'LaunchIntrospector': 'launch_introspector',
+    'LaunchPlan': 'launch_plan',
+    'LaunchService': 'launch_service',
+    'ProcessJournal': 'process_journal',
+    'SomeActionsType': 'some_actions_type',
+    'SomeActionsType_types_tuple': 'some_actions_type',
+    'SomeSubstitutionsType': 'some_substitutions_type',
+    'SomeSubstitutionsType_types_tuple': 'some_substitutions_type',
+    'Substitution': 'substitution',
+    # Not in __all__, but historically available after `import launch`.
+    'event_handlers': 'event_handlers',
+    'substitutions': 'substitutions',
+    'utilities': 'utilities',
+}
 
 __all__ = [
     'actions',
@@ -46,12 +57,18 @@ __all__ = [
     'LaunchContext',
     'LaunchDescription',
     'LaunchDescriptionEntity',
+    'LaunchDescriptionIndex',
     'LaunchDescriptionSource',
     'LaunchIntrospector',
+    'LaunchPlan',
     'LaunchService',
+    'ProcessJournal',
     'SomeActionsType',
     'SomeActionsType_types_tuple',
     'SomeSubstitutionsType',
     'SomeSubstitutionsType_types_tuple',
     'Substitution',
 ]
+
+
+install_lazy_imports(globals(), _module_names)
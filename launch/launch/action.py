@@ -55,7 +55,15 @@ class Action(LaunchDescriptionEntity):
 
     def visit(self, context: LaunchContext) -> Optional[List[LaunchDescriptionEntity]]:
         """Override visit from LaunchDescriptionEntity so that it executes."""
-        if self.__condition is None or self.__condition.evaluate(context):
+        if self.__condition is None:
+            return cast(Optional[List[LaunchDescriptionEntity]], self.execute(context))
+        condition_value = self.__condition.evaluate(context)
+        # import here to avoid loop
+        from .launch_plan import get_launch_plan
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            launch_plan.add_condition(self, self.__condition, condition_value)
+        if condition_value:
             return cast(Optional[List[LaunchDescriptionEntity]], self.execute(context))
         return None
 
@@ -14,21 +14,25 @@
 
 """actions Module."""
 
-from .declare_launch_argument import DeclareLaunchArgument
-from .emit_event import EmitEvent
-from .execute_process import ExecuteProcess
-from .group_action import GroupAction
-from .include_launch_description import IncludeLaunchDescription
-from .log_info import LogInfo
-from .opaque_function import OpaqueFunction
-from .pop_launch_configurations import PopLaunchConfigurations
-from .push_launch_configurations import PushLaunchConfigurations
-from .register_event_handler import RegisterEventHandler
-from .set_launch_configuration import SetLaunchConfiguration
-from .shutdown_action import Shutdown
-from .timer_action import TimerAction
-from .unregister_event_handler import UnregisterEventHandler
-from .unset_launch_configuration import UnsetLaunchConfiguration
+from ..utilities import install_lazy_imports
+
+_module_names = {
+    'DeclareLaunchArgument': 'declare_launch_argument',
+    'EmitEvent': 'emit_event',
+    'ExecuteProcess': 'execute_process',
+    'GroupAction': 'group_action',
+    'IncludeLaunchDescription': 'include_launch_description',
+    'LogInfo': 'log_info',
+    'OpaqueFunction': 'opaque_function',
+    'PopLaunchConfigurations': 'pop_launch_configurations',
+    'PushLaunchConfigurations': 'push_launch_configurations',
+    'RegisterEventHandler': 'register_event_handler',
+    'SetLaunchConfiguration': 'set_launch_configuration',
+    'Shutdown': 'shutdown_action',
+    'TimerAction': 'timer_action',
+    'UnregisterEventHandler': 'unregister_event_handler',
+    'UnsetLaunchConfiguration': 'unset_launch_configuration',
+}
 
 __all__ = [
     'DeclareLaunchArgument',
@@ -47,3 +51,6 @@ __all__ = [
     'UnregisterEventHandler',
     'UnsetLaunchConfiguration',
 ]
+
+
+install_lazy_imports(globals(), _module_names)
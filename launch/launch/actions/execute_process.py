@@ -21,6 +21,7 @@ import platform
 import shlex
 import signal
 import threading
+import time
 import traceback
 from typing import Any  # noqa: F401
 from typing import Callable
@@ -33,7 +34,6 @@ from typing import Text
 from typing import Tuple  # noqa: F401
 from typing import Union
 
-from osrf_pycommon.process_utils import async_execute_process
 from osrf_pycommon.process_utils import AsyncSubprocessProtocol
 
 from .emit_event import EmitEvent
@@ -53,20 +53,34 @@ from ..events.process import ProcessStdin
 from ..events.process import ProcessStdout
 from ..events.process import ShutdownProcess
 from ..events.process import SignalProcess
+from ..events.process import SignalProcesses
 from ..launch_context import LaunchContext
 from ..launch_description import LaunchDescription
+from ..launch_plan import get_launch_plan
+from ..process_journal import AdoptedProcess
+from ..process_journal import get_process_journal
+from ..process_journal import hash_process_command
 from ..some_actions_type import SomeActionsType
 from ..some_substitutions_type import SomeSubstitutionsType
 from ..substitution import Substitution  # noqa: F401
 from ..substitutions import LaunchConfiguration
 from ..substitutions import PythonExpression
+from ..utilities import async_execute_process_with_pidfd
 from ..utilities import create_future
 from ..utilities import is_a_subclass
+from ..utilities import is_pidfd_supported
 from ..utilities import normalize_to_list_of_substitutions
+from ..utilities import OutputFilter
+from ..utilities import parse_log_records
 from ..utilities import perform_substitutions
+from ..utilities import perform_substitutions_async
+from ..utilities import RingBuffer
+from ..utilities import RotatingLogFile
 
 _logger = logging.getLogger(name='launch')
 
+_RUNNING_PROCESSES_GLOBAL_NAME = 'launch_running_processes'
+
 _global_process_counter_lock = threading.Lock()
 _global_process_counter = 0  # in Python3, this number is unbounded (no rollover)
 
@@ -88,6 +102,12 @@ class ExecuteProcess(Action):
             'sigkill_timeout', default=5),
         prefix: Optional[SomeSubstitutionsType] = None,
         output: Optional[Text] = None,
+        output_filter: Optional[Dict[Text, Iterable[Text]]] = None,
+        output_rate_limit: Optional[float] = None,
+        output_tail_size: int = 8192,
+        output_log: Optional[Dict[Text, Any]] = None,
+        output_records: bool = False,
+        process_group: bool = True,
         log_cmd: bool = False,
         on_exit: Optional[Union[
             SomeActionsType,
@@ -166,6 +186,41 @@ class ExecuteProcess(Action):
             to stdout and stdout is printed to the screen; if 'log' stderr is
             directed to the screen and both stdout and stderr are directed to
             a log file; the default is 'log'
+        :param: output_filter a dictionary with the regular expressions of the
+            lines of output to 'keep' and to 'drop', see
+            :class:`launch.utilities.OutputFilter`; the output is filtered in
+            the process protocol, so the dropped lines never become events
+        :param: output_rate_limit the maximum number of lines of output per
+            second, for each of stdout and stderr, with a summary of the number
+            of lines which were suppressed; like the output filter, this is
+            applied before the output becomes events
+        :param: output_tail_size the number of bytes of the last output of
+            the process, from both stdout and stderr, which are kept in a ring
+            buffer and passed to the ProcessExited event, or 0 to keep none;
+            the last output is also logged if the process dies and its output
+            did not go to the screen
+        :param: output_log a dictionary with the 'directory' to write the
+            output of the process to, from both stdout and stderr, after
+            filtering, and optionally the 'max_bytes', 'max_age',
+            'compression' and 'index_interval' of the segments of the log
+            file, see :class:`launch.utilities.RotatingLogFile`; the log file
+            is named after the process, and closed when it exits
+        :param: output_records if True, the output is split in lines, which are
+            stamped with the monotonic time they were received at and parsed,
+            if they are in the console output format of rcutils, and the
+            ProcessStdout and ProcessStderr events carry the records of their
+            lines, see :class:`launch.utilities.LogRecord`; incomplete lines
+            are held back until they are completed or the stream is closed
+        :param: process_group if True, the process is started in a new process
+            group, and signals are sent to the whole process group, so that
+            they reach the processes it starts too, e.g. with `shell=True`
+            or with a prefix; the processes left behind in the group when the
+            process exits after shutdown started are killed; since it does not
+            receive the ctrl-c of the terminal either, SIGINT is sent to it
+            on shutdown instead; this should be False for a process which
+            must run in the foreground of the terminal, e.g. gdb, and it is
+            ignored on Windows, and for processes adopted from a process
+            journal, which are signalled by themselves
         :param: log_cmd if True, prints the final cmd before executing the
             process, which is useful for debugging when substitutions are
             involved.
@@ -197,22 +252,107 @@ class ExecuteProcess(Action):
                     allowed_output_options,
                 )
             )
+        self.__output_filter = None  # type: Optional[Dict[Text, List[Text]]]
+        if output_filter is not None:
+            unknown_keys = set(output_filter) - {'keep', 'drop'}
+            if unknown_keys:
+                raise ValueError(
+                    "output_filter argument to ExecuteProcess has keys {}, expected 'keep' "
+                    "and/or 'drop'".format(sorted(unknown_keys)))
+            self.__output_filter = {
+                key: list(patterns) for key, patterns in output_filter.items()
+            }
+        self.__output_rate_limit = output_rate_limit
+        if output_tail_size < 0:
+            raise ValueError(
+                "output_tail_size argument to ExecuteProcess is '{}', expected at least 0"
+                .format(output_tail_size))
+        self.__output_tail_size = output_tail_size
+        self.__output_log = None  # type: Optional[Dict[Text, Any]]
+        if output_log is not None:
+            unknown_keys = set(output_log) - {
+                'directory', 'max_bytes', 'max_age', 'compression', 'index_interval'}
+            if unknown_keys or 'directory' not in output_log:
+                raise ValueError(
+                    "output_log argument to ExecuteProcess has keys {}, expected 'directory' "
+                    "and optionally 'max_bytes', 'max_age', 'compression' and/or "
+                    "'index_interval'".format(sorted(output_log)))
+            self.__output_log = dict(output_log)
+        self.__output_records = output_records
+        self.__process_group = process_group
+        # Check the arguments of the output filters and log file right away.
+        self.__create_output_filter()
+        self.__create_output_log('check')
         self.__log_cmd = log_cmd
         self.__on_exit = on_exit
 
         self.__process_event_args = None  # type: Optional[Dict[Text, Any]]
+        self.__expanded_name = None  # type: Optional[Text]
         self._subprocess_protocol = None  # type: Optional[Any]
         self._subprocess_transport = None
+        self.__process_number = None  # type: Optional[int]
         self.__completed_future = None  # type: Optional[asyncio.Future]
         self.__sigterm_timer = None  # type: Optional[TimerAction]
         self.__sigkill_timer = None  # type: Optional[TimerAction]
         self.__shutdown_received = False
+        self.__running_processes = None  # type: Optional[Dict[ExecuteProcess, None]]
 
     @property
     def output(self):
         """Getter for output."""
         return self.__output
 
+    @property
+    def output_filter(self):
+        """Getter for output_filter."""
+        return self.__output_filter
+
+    @property
+    def output_rate_limit(self):
+        """Getter for output_rate_limit."""
+        return self.__output_rate_limit
+
+    @property
+    def output_tail_size(self):
+        """Getter for output_tail_size."""
+        return self.__output_tail_size
+
+    @property
+    def output_log(self):
+        """Getter for output_log."""
+        return self.__output_log
+
+    @property
+    def output_records(self):
+        """Getter for output_records."""
+        return self.__output_records
+
+    @property
+    def process_group(self):
+        """Getter for process_group."""
+        return self.__process_group
+
+    def __create_output_filter(self) -> Optional[OutputFilter]:
+        if (
+            self.__output_filter is None and self.__output_rate_limit is None and
+            not self.__output_records
+        ):
+            return None
+        # Without any patterns nor rate limit, the filter only splits the output in lines.
+        output_filter = {} if self.__output_filter is None else self.__output_filter
+        return OutputFilter(
+            keep=output_filter.get('keep', []),
+            drop=output_filter.get('drop', []),
+            rate_limit=self.__output_rate_limit,
+        )
+
+    def __create_output_log(self, name: Text) -> Optional[RotatingLogFile]:
+        if self.__output_log is None:
+            return None
+        options = dict(self.__output_log)
+        directory = options.pop('directory')
+        return RotatingLogFile(os.path.join(directory, name), **options)
+
     @property
     def process_details(self):
         """Getter for the process details, e.g. name, pid, cmd, etc., or None if not started."""
@@ -230,11 +370,19 @@ class ExecuteProcess(Action):
         if self.__completed_future.done():
             # If already done, then nothing to do.
             return None
+        if self.process_details is None:
+            # Substitutions are still being expanded, and self.__shutdown_received will prevent
+            # the process from being started once they are.
+            return None
         # Otherwise process is still running, start the shutdown procedures.
         context.extend_locals({'process_name': self.process_details['name']})
         actions_to_return = self.__get_shutdown_timer_actions()
         if send_sigint:
-            actions_to_return.append(self.__get_sigint_event())
+            if self._subprocess_transport is not None:
+                # Signal right away, rather than through an event which every process handles.
+                self.__send_signal(signal.SIGINT)
+            else:
+                actions_to_return.append(self.__get_sigint_event())
         return actions_to_return
 
     def __on_shutdown_process_event(
@@ -255,28 +403,89 @@ class ExecuteProcess(Action):
             raise RuntimeError('Signal event received before execution.')
         if self._subprocess_transport is None:
             raise RuntimeError('Signal event received before subprocess transport available.')
+        self.__send_signal(typed_event.signal)
+        return None
+
+    @staticmethod
+    def __on_signal_processes_event(
+        context: LaunchContext,
+        running_processes: Dict['ExecuteProcess', None]
+    ) -> Optional[LaunchDescription]:
+        typed_event = cast(SignalProcesses, context.locals.event)
+        for action in list(running_processes):
+            # Skip the processes which were not started yet.
+            if action._subprocess_transport is not None and typed_event.process_matcher(action):
+                action.__send_signal(typed_event.signal)
+        return None
+
+    @staticmethod
+    def __get_running_processes(context: LaunchContext) -> Dict['ExecuteProcess', None]:
+        # The running processes of the launch run, in order, with a single event handler
+        # which signals them in bulk, see SignalProcesses.
+        running_processes = context.get_locals_as_dict().get(_RUNNING_PROCESSES_GLOBAL_NAME)
+        if running_processes is None:
+            running_processes = {}
+            context.extend_globals({_RUNNING_PROCESSES_GLOBAL_NAME: running_processes})
+            context.register_event_handler(EventHandler(
+                matcher=lambda event: is_a_subclass(event, SignalProcesses),
+                entities=OpaqueFunction(
+                    function=ExecuteProcess.__on_signal_processes_event,
+                    args=[running_processes]),
+            ))
+        return running_processes
+
+    def __starts_process_group(self) -> bool:
+        return self.__process_group and platform.system() != 'Windows'
+
+    def __send_signal(self, signal_number: Union[Text, signal.Signals]) -> None:
+        name = self.process_details['name']
+        signal_name = signal_number if isinstance(signal_number, str) else signal_number.name
         if self._subprocess_protocol.complete.done():
             # the process is done or is cleaning up, no need to signal
             _logger.debug("signal '{}' not set to '{}' because it is already closing".format(
-                typed_event.signal_name, self.process_details['name']
+                signal_name, name
             ))
-            return None
-        if platform.system() == 'Windows' and typed_event.signal_name == 'SIGINT':
+            return
+        if platform.system() == 'Windows' and signal_name == 'SIGINT':
             # TODO(wjwwood): remove this when/if SIGINT is fixed on Windows
             _logger.warn(
                 "'SIGINT' sent to process[{}] not supported on Windows, escalating to 'SIGTERM'"
-                .format(self.process_details['name']))
-            typed_event = SignalProcess(
-                signal_number=signal.SIGTERM,
-                process_matcher=lambda process: True)
-        _logger.info("sending signal '{}' to process[{}]".format(
-            typed_event.signal_name, self.process_details['name']
-        ))
-        if typed_event.signal_name == 'SIGKILL':
+                .format(name))
+            signal_number = signal.SIGTERM
+            signal_name = signal_number.name
+        _logger.info("sending signal '{}' to process[{}]".format(signal_name, name))
+        pid = self._subprocess_transport.get_pid()
+        if self.__starts_process_group() and not self.__is_adopted():
+            try:
+                if os.getpgid(pid) == pid:
+                    os.killpg(pid, signal.SIGKILL if signal_name == 'SIGKILL' else signal_number)
+                    return
+            except ProcessLookupError:
+                # The process exited, but that wasn't handled yet.
+                return
+        if signal_name == 'SIGKILL':
             self._subprocess_transport.kill()  # works on both Windows and POSIX
-            return None
-        self._subprocess_transport.send_signal(typed_event.signal)
-        return None
+            return
+        self._subprocess_transport.send_signal(signal_number)
+
+    def __is_adopted(self) -> bool:
+        # Adopted processes are signalled through their pidfd only, since they are not children
+        # of this process, so their pid, and the process group it names, may be reused anytime.
+        return isinstance(self._subprocess_transport, AdoptedProcess)
+
+    def __kill_process_group_leftovers(self, pid: int) -> None:
+        # The process exited, but processes it started in its process group may still be running.
+        try:
+            os.killpg(pid, 0)
+        except (ProcessLookupError, PermissionError):
+            return
+        _logger.warning(
+            'process[{}]: killing the processes left behind in its process group'.format(
+                self.process_details['name']))
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
 
     def __on_process_stdin_event(
         self,
@@ -290,7 +499,8 @@ class ExecuteProcess(Action):
     def __on_shutdown(self, event: Event, context: LaunchContext) -> Optional[SomeActionsType]:
         return self.__shutdown_process(
             context,
-            send_sigint=(not cast(Shutdown, event).due_to_sigint),
+            send_sigint=(
+                not cast(Shutdown, event).due_to_sigint or self.__starts_process_group()),
         )
 
     def __get_shutdown_timer_actions(self) -> List[Action]:
@@ -354,6 +564,8 @@ class ExecuteProcess(Action):
             self.__sigterm_timer.cancel()
         if self.__sigkill_timer is not None:
             self.__sigkill_timer.cancel()
+        if self.__running_processes is not None:
+            self.__running_processes.pop(self, None)
         # Signal that we're done to the launch system.
         self.__completed_future.set_result(None)
 
@@ -363,47 +575,105 @@ class ExecuteProcess(Action):
             action: 'ExecuteProcess',
             context: LaunchContext,
             process_event_args: Dict,
+            stdout_filter: Optional[OutputFilter],
+            stderr_filter: Optional[OutputFilter],
+            output_tail: Optional[RingBuffer],
+            output_log: Optional[RotatingLogFile],
+            output_records: bool,
             **kwargs
         ) -> None:
             super().__init__(**kwargs)
             self.__context = context
             self.__action = action
             self.__process_event_args = process_event_args
+            self.__stdout_filter = stdout_filter
+            self.__stderr_filter = stderr_filter
+            self.__output_tail = output_tail
+            self.__output_log = output_log
+            self.__output_records = output_records
 
         def connection_made(self, transport):
-            _logger.info('process[{}]: started with pid [{}]'.format(
-                self.__process_event_args['name'],
-                transport.get_pid(),
-            ))
+            if not isinstance(transport, AdoptedProcess):
+                _logger.info('process[{}]: started with pid [{}]'.format(
+                    self.__process_event_args['name'],
+                    transport.get_pid(),
+                ))
             super().connection_made(transport)
             self.__process_event_args['pid'] = transport.get_pid()
             self.__action._subprocess_transport = transport
 
+        def __handle_output(self, data: bytes) -> Dict[Text, Any]:
+            # Return the arguments of the event of the output.
+            if self.__output_tail is not None:
+                self.__output_tail.write(data)
+            if self.__output_log is not None:
+                self.__output_log.write(data)
+            if not self.__output_records:
+                return self.__process_event_args
+            return dict(
+                self.__process_event_args,
+                records=parse_log_records(data, time.monotonic()))
+
         def on_stdout_received(self, data: bytes) -> None:
-            self.__context.emit_event_sync(ProcessStdout(text=data, **self.__process_event_args))
+            if self.__stdout_filter is not None:
+                data = self.__stdout_filter.filter(data)
+                if not data:
+                    return
+            self.__context.emit_event_sync(ProcessStdout(text=data, **self.__handle_output(data)))
 
         def on_stderr_received(self, data: bytes) -> None:
-            self.__context.emit_event_sync(ProcessStderr(text=data, **self.__process_event_args))
-
-    def __expand_substitutions(self, context):
-        # expand substitutions in arguments to async_execute_process()
-        cmd = [perform_substitutions(context, x) for x in self.__cmd]
-        name = os.path.basename(cmd[0]) if self.__name is None \
-            else perform_substitutions(context, self.__name)
-        cmd = shlex.split(perform_substitutions(context, self.__prefix)) + cmd
-        with _global_process_counter_lock:
-            global _global_process_counter
-            _global_process_counter += 1
-            name = '{}-{}'.format(name, _global_process_counter)
-        cwd = None
-        if self.__cwd is not None:
-            cwd = ''.join([context.perform_substitution(x) for x in self.__cwd])
+            if self.__stderr_filter is not None:
+                data = self.__stderr_filter.filter(data)
+                if not data:
+                    return
+            self.__context.emit_event_sync(ProcessStderr(text=data, **self.__handle_output(data)))
+
+        def pipe_connection_lost(self, fd, exc):
+            if self.__stdout_filter is None:
+                return
+            # Pass on what the output filters held back, as no more output will follow.
+            stdout = self.stdout if isinstance(self.stdout, int) else 1
+            if fd == stdout:
+                data = self.__stdout_filter.flush()
+                if data:
+                    self.__context.emit_event_sync(
+                        ProcessStdout(text=data, **self.__handle_output(data)))
+            elif fd == 2:
+                data = self.__stderr_filter.flush()
+                if data:
+                    self.__context.emit_event_sync(
+                        ProcessStderr(text=data, **self.__handle_output(data)))
+
+    async def _expand_substitutions(self, context: LaunchContext) -> None:
+        """
+        Expand the substitutions in the arguments of this action concurrently.
+
+        This is awaited by the task that executes the process, with a snapshot
+        of the context taken when the action was executed.
+        Derived classes may extend it in order to expand their own
+        substitutions, but they must await this implementation as well.
+        """
+        async def perform_if_not_none(subs):
+            return None if subs is None else await perform_substitutions_async(context, subs)
+
+        env_items = [] if self.__env is None else self.__env
+        # expand substitutions in arguments to async_execute_process_with_pidfd()
+        cmd, name, prefix, cwd, env_keys, env_values = await asyncio.gather(
+            asyncio.gather(*[perform_substitutions_async(context, x) for x in self.__cmd]),
+            perform_if_not_none(self.__name),
+            perform_substitutions_async(context, self.__prefix),
+            perform_if_not_none(self.__cwd),
+            asyncio.gather(*[perform_substitutions_async(context, k) for k, _ in env_items]),
+            asyncio.gather(*[perform_substitutions_async(context, v) for _, v in env_items]),
+        )
+        if name is None:
+            name = os.path.basename(cmd[0])
+        cmd = shlex.split(prefix) + cmd
+        self.__expanded_name = name
+        name = '{}-{}'.format(name, self.__process_number)
         env = None
         if self.__env is not None:
-            env = {}
-            for key, value in self.__env:
-                env[''.join([context.perform_substitution(x) for x in key])] = \
-                    ''.join([context.perform_substitution(x) for x in value])
+            env = dict(zip(env_keys, env_values))
 
         # store packed kwargs for all ProcessEvent based events
         self.__process_event_args = {
@@ -415,7 +685,67 @@ class ExecuteProcess(Action):
             # pid is added to the dictionary in the connection_made() method of the protocol.
         }
 
+    def _get_launch_plan_entry(self, context: LaunchContext) -> Dict[Text, Any]:
+        """
+        Return the expanded arguments of this action, to be recorded in a launch plan.
+
+        This is called instead of launching the process when a
+        :class:`launch.LaunchPlan` is being created, once the substitutions
+        have been expanded.
+        Derived classes may extend the returned dictionary with the files
+        their substitutions read, as 'inputs', or the files they generated
+        for the process, as 'files'.
+        """
+        process_event_args = cast(Dict[Text, Any], self.__process_event_args)
+        return {
+            'name': self.__expanded_name,
+            'cmd': process_event_args['cmd'],
+            'cwd': process_event_args['cwd'],
+            'env': process_event_args['env'],
+            'shell': self.__shell,
+            'sigterm_timeout': perform_substitutions(context, self.__sigterm_timeout),
+            'sigkill_timeout': perform_substitutions(context, self.__sigkill_timeout),
+            'output': self.__output,
+            'output_filter': self.__output_filter,
+            'output_rate_limit': self.__output_rate_limit,
+            'output_tail_size': self.__output_tail_size,
+            'output_log': self.__output_log,
+            'output_records': self.__output_records,
+            'process_group': self.__process_group,
+            'log_cmd': self.__log_cmd,
+            'inputs': [],
+            'files': [],
+        }
+
     async def __execute_process(self, context: LaunchContext) -> None:
+        try:
+            start = time.perf_counter()
+            await self._expand_substitutions(context)
+            launch_plan = get_launch_plan(context)
+            if launch_plan is not None:
+                launch_plan.add_timing(self, 'expansion', time.perf_counter() - start)
+                # Record the process in the launch plan being created, instead of launching it.
+                launch_plan.add_process(self._get_launch_plan_entry(context))
+                if self.__on_exit is not None:
+                    launch_plan.add_uncacheable_reason(
+                        "process '{}' has on_exit actions".format(self.__expanded_name))
+                self.__cleanup()
+                return
+        except Exception as exc:
+            self.__cleanup()
+            # Let the launch service know about the failure, and shutdown as it would have if
+            # the exception had been raised while the action was being visited.
+            context.asyncio_loop.call_exception_handler({
+                'message': 'exception occurred while expanding substitutions for {}'.format(self),
+                'exception': exc,
+            })
+            await context.emit_event(Shutdown(
+                reason='failed to expand substitutions for {}: {}'.format(self, exc)))
+            return
+        if self.__shutdown_received:
+            # Shutdown started while the substitutions were being expanded, so don't start.
+            self.__cleanup()
+            return
         process_event_args = self.__process_event_args
         if process_event_args is None:
             raise RuntimeError('process_event_args unexpectedly None')
@@ -427,38 +757,94 @@ class ExecuteProcess(Action):
             _logger.info("process[{}] details: cmd=[{}], cwd='{}', custom_env?={}".format(
                 name, ', '.join(cmd), cwd, 'True' if env is not None else 'False'
             ))
-        try:
-            transport, self._subprocess_protocol = await async_execute_process(
-                lambda **kwargs: self.__ProcessProtocol(
-                    self, context, process_event_args, **kwargs
-                ),
-                cmd=cmd,
-                cwd=cwd,
-                env=env,
-                shell=self.__shell,
-                emulate_tty=False,
-                stderr_to_stdout=(self.__output == 'screen'),
+        output_tail = None
+        if self.__output_tail_size > 0:
+            output_tail = RingBuffer(self.__output_tail_size)
+        output_log = self.__create_output_log(name)
+
+        def protocol_factory(**kwargs):
+            return self.__ProcessProtocol(
+                self, context, process_event_args,
+                # Each stream is filtered separately, so that their lines are not mixed.
+                self.__create_output_filter(), self.__create_output_filter(),
+                output_tail, output_log, self.__output_records,
+                **kwargs
             )
-        except Exception:
-            _logger.error('exception occurred while executing process[{}]:\n{}'.format(
-                name,
-                traceback.format_exc()
-            ))
-            self.__cleanup()
-            return
+
+        stderr_to_stdout = self.__output == 'screen'
+        process_journal = get_process_journal(context)
+        adopted = None
+        output_files = None
+        if process_journal is not None:
+            cmd_hash = hash_process_command(cmd, cwd, env)
+            adopted = process_journal.adopt(
+                name=self.__expanded_name, cmd_hash=cmd_hash, protocol_factory=protocol_factory,
+                loop=context.asyncio_loop)
+        if adopted is not None:
+            # The adopted process can be signalled and awaited like the ones started here.
+            transport, self._subprocess_protocol = adopted
+            _logger.info('process[{}]: adopted running process with pid [{}]'.format(
+                name, transport.get_pid()))
+        else:
+            try:
+                if process_journal is not None and is_pidfd_supported():
+                    # So that the process can keep writing its output once this one exits.
+                    output_files = process_journal.create_output_files(
+                        name=name, stderr_to_stdout=stderr_to_stdout)
+                transport, self._subprocess_protocol = await async_execute_process_with_pidfd(
+                    protocol_factory,
+                    cmd=cmd,
+                    cwd=cwd,
+                    env=env,
+                    shell=self.__shell,
+                    emulate_tty=False,
+                    stderr_to_stdout=stderr_to_stdout,
+                    new_process_group=self.__process_group,
+                    output_files=output_files,
+                )
+            except Exception:
+                _logger.error('exception occurred while executing process[{}]:\n{}'.format(
+                    name,
+                    traceback.format_exc()
+                ))
+                for path in (output_files or {}).values():
+                    if os.path.exists(path):
+                        os.unlink(path)
+                if output_log is not None:
+                    output_log.close()
+                self.__cleanup()
+                return
+            if process_journal is not None:
+                process_journal.record_started(
+                    name=self.__expanded_name, pid=transport.get_pid(), cmd_hash=cmd_hash,
+                    output_files=output_files)
 
         pid = transport.get_pid()
 
         await context.emit_event(ProcessStarted(**process_event_args))
 
         returncode = await self._subprocess_protocol.complete
+        if process_journal is not None:
+            process_journal.record_exited(pid=pid)
+        if self.__shutdown_received and self.__starts_process_group() and not self.__is_adopted():
+            self.__kill_process_group_leftovers(pid)
         if returncode == 0:
             _logger.info('process[{}]: process has finished cleanly'.format(name))
+        elif returncode is None:
+            _logger.info('process[{}]: adopted process has exited'.format(name))
         else:
             _logger.error("process[{}] process has died [pid {}, exit code {}, cmd '{}'].".format(
                 name, pid, returncode, ' '.join(cmd)
             ))
-        await context.emit_event(ProcessExited(returncode=returncode, **process_event_args))
+        if output_log is not None:
+            # The last segment is compressed in the background.
+            output_log.close()
+        tail = None if output_tail is None else output_tail.getvalue()
+        if returncode != 0 and tail and self.__output != 'screen':
+            _logger.error('process[{}] last output:\n{}'.format(
+                name, tail.decode(errors='replace').rstrip('\n')))
+        await context.emit_event(ProcessExited(
+            returncode=returncode, output_tail=tail, **process_event_args))
         self.__cleanup()
 
     def execute(self, context: LaunchContext) -> Optional[List['Action']]:
@@ -498,11 +884,21 @@ class ExecuteProcess(Action):
         ]
         for event_handler in event_handlers:
             context.register_event_handler(event_handler)
+        self.__running_processes = ExecuteProcess.__get_running_processes(context)
+        self.__running_processes[self] = None
+
+        # Number the process now, rather than once its substitutions are expanded, so that
+        # process names do not depend on the order in which concurrent expansions finish.
+        with _global_process_counter_lock:
+            global _global_process_counter
+            _global_process_counter += 1
+            self.__process_number = _global_process_counter
 
         try:
             self.__completed_future = create_future(context.asyncio_loop)
-            self.__expand_substitutions(context)
-            context.asyncio_loop.create_task(self.__execute_process(context))
+            # Substitutions are expanded asynchronously, so give the task a snapshot of the
+            # context, since the locals and launch configurations may change in the meantime.
+            context.asyncio_loop.create_task(self.__execute_process(context._snapshot()))
         except Exception:
             for event_handler in event_handlers:
                 context.unregister_event_handler(event_handler)
@@ -25,6 +25,7 @@ from typing import Text
 
 from ..action import Action
 from ..launch_context import LaunchContext
+from ..launch_plan import get_launch_plan
 from ..utilities import ensure_argument_type
 
 
@@ -71,4 +72,10 @@ class OpaqueFunction(Action):
 
     def execute(self, context: LaunchContext) -> Optional[List[Action]]:
         """Execute the action."""
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            # The side effects of the function can't be replayed.
+            launch_plan.add_uncacheable_reason(
+                "function '{}' is called".format(getattr(
+                    self.__function, '__qualname__', repr(self.__function))))
         return self.__function(context, *self.__args, **self.__kwargs)
@@ -17,6 +17,7 @@
 from ..action import Action
 from ..event_handler import EventHandler
 from ..launch_context import LaunchContext
+from ..launch_plan import get_launch_plan
 
 
 class RegisterEventHandler(Action):
@@ -44,4 +45,9 @@ class RegisterEventHandler(Action):
 
     def execute(self, context: LaunchContext):
         """Execute the action."""
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            launch_plan.add_event_handler(self.__event_handler)
+            launch_plan.add_uncacheable_reason(
+                'event handler {} is registered'.format(self.__event_handler.describe()[0]))
         context.register_event_handler(self.__event_handler)
@@ -34,6 +34,7 @@ from ..events import Shutdown
 from ..events import TimerEvent
 from ..launch_context import LaunchContext
 from ..launch_description_entity import LaunchDescriptionEntity
+from ..launch_plan import get_launch_plan
 from ..some_actions_type import SomeActionsType
 from ..some_substitutions_type import SomeSubstitutionsType
 from ..some_substitutions_type import SomeSubstitutionsType_types_tuple
@@ -150,6 +151,13 @@ class TimerAction(Action):
             ))
             setattr(context, '_TimerAction__event_handler_has_been_installed', True)
 
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            # Nothing is launched while creating a launch plan, so there is no need to wait.
+            launch_plan.add_uncacheable_reason('{} defers actions'.format(self.describe()))
+            self.__completed_future.set_result(None)
+            return list(self.__actions)
+
         # Capture the current context locals so the yielded actions can make use of them too.
         self.__context_locals = dict(context.get_locals_as_dict())  # Capture a copy
         context.asyncio_loop.create_task(self.__wait_to_fire_event(context))
@@ -14,27 +14,36 @@
 
 """Module for OnIncludeLaunchDescription class."""
 
+from typing import cast
+from typing import Optional
 from typing import Text
 
+from ..event import Event
 from ..event_handler import EventHandler
 from ..events import IncludeLaunchDescription
+from ..some_actions_type import SomeActionsType
 from ..utilities import is_a_subclass
 
+if False:
+    from ..launch_context import LaunchContext  # noqa: F401
+
 
 class OnIncludeLaunchDescription(EventHandler):
     """Event handler used to handle asynchronous requests to include LaunchDescriptions."""
 
     def __init__(self, **kwargs):
         """Constructor."""
-        from ..actions import OpaqueFunction
         super().__init__(
             matcher=lambda event: is_a_subclass(event, IncludeLaunchDescription),
-            entities=OpaqueFunction(
-                function=lambda context: [context.locals.event.launch_description]
-            ),
             **kwargs,
         )
 
+    def handle(self, event: Event, context: 'LaunchContext') -> Optional[SomeActionsType]:
+        """Handle the given event."""
+        # Not through an OpaqueFunction, which would make launch plans uncacheable.
+        super().handle(event, context)
+        return [cast(IncludeLaunchDescription, event).launch_description]
+
     @property
     def handler_description(self) -> Text:
         """Return the string description of the handler."""
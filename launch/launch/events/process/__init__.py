@@ -28,6 +28,7 @@ from .process_targeted_event import ProcessTargetedEvent
 from .running_process_event import RunningProcessEvent
 from .shutdown_process import ShutdownProcess
 from .signal_process import SignalProcess
+from .signal_processes import SignalProcesses
 
 __all__ = [
     'matches_action',
@@ -44,4 +45,5 @@ __all__ = [
     'RunningProcessEvent',
     'ShutdownProcess',
     'SignalProcess',
+    'SignalProcesses',
 ]
@@ -14,6 +14,8 @@
 
 """Module for ProcessExited event."""
 
+from typing import Optional
+
 from .running_process_event import RunningProcessEvent
 
 
@@ -25,7 +27,8 @@ class ProcessExited(RunningProcessEvent):
     def __init__(
         self,
         *,
-        returncode: int,
+        returncode: Optional[int],
+        output_tail: Optional[bytes] = None,
         **kwargs
     ) -> None:
         """
@@ -34,12 +37,21 @@ class ProcessExited(RunningProcessEvent):
         Unmatched keyword arguments are passed to RunningProcessEvent, see it
         for details on those arguments.
 
-        :param: returncode is the returncode of the process
+        :param: returncode is the returncode of the process, or None if it is
+            unknown, i.e. if the process was adopted, see :class:`launch.ProcessJournal`
+        :param: output_tail is the last output of the process, from both
+            stdout and stderr, or None if it was not kept
         """
         super().__init__(**kwargs)
         self.__returncode = returncode
+        self.__output_tail = output_tail
 
     @property
-    def returncode(self) -> int:
+    def returncode(self) -> Optional[int]:
         """Getter for returncode."""
         return self.__returncode
+
+    @property
+    def output_tail(self) -> Optional[bytes]:
+        """Getter for output_tail."""
+        return self.__output_tail
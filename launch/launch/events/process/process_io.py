@@ -14,15 +14,29 @@
 
 """Module for ProcessIO event."""
 
+from typing import List  # noqa: F401
+from typing import Optional
+
 from .running_process_event import RunningProcessEvent
 
+if False:
+    # imports here would cause loops, but are only used as forward-references for type-checking
+    from ...utilities import LogRecord  # noqa
+
 
 class ProcessIO(RunningProcessEvent):
     """Event emitted when a process generates output on stdout or stderr, or if stdin is used."""
 
     name = 'launch.events.process.ProcessIO'
 
-    def __init__(self, *, text: bytes, fd: int, **kwargs) -> None:
+    def __init__(
+        self,
+        *,
+        text: bytes,
+        fd: int,
+        records: Optional[List['LogRecord']] = None,
+        **kwargs
+    ) -> None:
         """
         Constructor.
 
@@ -31,9 +45,12 @@ class ProcessIO(RunningProcessEvent):
 
         :param: text is the unicode data associated with the event
         :param: fd is an integer that indicates which file descriptor the text is from
+        :param: records is the list of the records of the lines of the text,
+            if the process was asked for them
         """
         super().__init__(**kwargs)
         self.__text = text
+        self.__records = records
         self.__from_stdin = fd == 0
         self.__from_stdout = fd == 1
         self.__from_stderr = fd == 2
@@ -57,3 +74,8 @@ class ProcessIO(RunningProcessEvent):
     def from_stderr(self) -> bool:
         """Getter for from_stderr."""
         return self.__from_stderr
+
+    @property
+    def records(self) -> Optional[List['LogRecord']]:
+        """Getter for records, see :class:`launch.utilities.LogRecord`."""
+        return self.__records
@@ -0,0 +1,76 @@
+# Copyright 2018 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for SignalProcesses event."""
+
+import signal as signal_module  # to avoid confusion with .signal property in type annotations
+from typing import Callable
+from typing import Text
+from typing import Union
+
+from ...event import Event
+from ...utilities import ensure_argument_type
+
+if False:
+    # imports here would cause loops, but are only used as forward-references for type-checking
+    from ...actions import ExecuteProcess  # noqa
+
+
+class SignalProcesses(Event):
+    """
+    Event emitted when a signal should be sent to all of the processes which match.
+
+    Unlike :class:`launch.events.process.SignalProcess`, which is handled by
+    each running process separately, this event is handled once for all of
+    the running processes, which is faster when signalling many processes.
+    """
+
+    name = 'launch.events.process.SignalProcesses'
+
+    def __init__(
+        self, *,
+        signal_number: Union[Text, signal_module.Signals],
+        process_matcher: Callable[['ExecuteProcess'], bool] = lambda process: True
+    ) -> None:
+        """
+        Constructor.
+
+        Like for :class:`launch.events.process.SignalProcess`, the string
+        'SIGKILL' can be given instead of `signal.SIGKILL`.
+
+        :param: signal_number either the string 'SIGKILL' or a signal.Signals
+        :param: process_matcher is a predicate which determines if an
+            ExecuteProcess action is signalled, all are by default
+        """
+        super().__init__()
+        ensure_argument_type(
+            signal_number, (str, signal_module.Signals), 'signal_number', 'SignalProcesses')
+        self.__signal = signal_number
+        self.__process_matcher = process_matcher
+
+    @property
+    def signal(self) -> Union[Text, signal_module.Signals]:
+        """Getter for signal, it will be 'SIGKILL' or match something from the signal module."""
+        return self.__signal
+
+    @property
+    def signal_name(self) -> Text:
+        """Getter for signal_name, e.g. 'SIGINT'."""
+        return self.__signal if isinstance(self.__signal, str) else self.__signal.name
+
+    @property
+    def process_matcher(self) -> Callable[['ExecuteProcess'], bool]:
+        """Getter for process_matcher."""
+        return self.__process_matcher
@@ -16,6 +16,7 @@
 
 import asyncio
 import collections
+import copy
 import logging
 from typing import Any
 from typing import Dict
@@ -45,6 +46,12 @@ class LaunchContext:
         self._event_queue = asyncio.Queue()  # type: asyncio.Queue
         self._event_handlers = collections.deque()  # type: collections.deque
         self._completion_futures = []  # type: List[asyncio.Future]
+        # Results memoized by substitutions for the duration of the launch, e.g. see Command.
+        self._substitution_cache = {}  # type: Dict[Any, Any]
+        # The launch.LaunchPlan being created with this context, see launch.LaunchService.plan().
+        self._launch_plan = None  # type: Optional[Any]
+        # The launch.ProcessJournal of the launch service, see launch.LaunchService.
+        self._process_journal = None  # type: Optional[Any]
 
         self.__globals = {}  # type: Dict[Text, Any]
         self.__locals_stack = []  # type: List[Dict[Text, Any]]
@@ -177,3 +184,27 @@ class LaunchContext:
     def perform_substitution(self, substitution: Substitution) -> Text:
         """Perform substitution on given Substitution."""
         return substitution.perform(self)
+
+    async def perform_substitution_async(self, substitution: Substitution) -> Text:
+        """Perform substitution on given Substitution asynchronously."""
+        return await substitution.perform_async(self)
+
+    def _snapshot(self) -> 'LaunchContext':
+        """
+        Return a copy of this context with the current locals and launch configurations.
+
+        The locals and launch configurations of the copy are not affected by
+        later changes to this context, which makes it possible to perform
+        substitutions after the entity which uses them has been visited, e.g.
+        asynchronously from a task created during the visit.
+        Everything else, like the event queue and the event handlers, is
+        shared with this context.
+        """
+        snapshot = copy.copy(self)
+        snapshot.__globals = dict(self.__globals)
+        snapshot.__locals_stack = []
+        snapshot.__locals = dict(self.__locals)
+        snapshot.__combined_locals_cache = None
+        snapshot.__launch_configurations_stack = []
+        snapshot.__launch_configurations = dict(self.__launch_configurations)
+        return snapshot
@@ -23,6 +23,10 @@ from .actions import DeclareLaunchArgument
 from .launch_context import LaunchContext
 from .launch_description_entity import LaunchDescriptionEntity
 
+if False:
+    # imports here would cause loops, but are only used as forward-references for type-checking
+    from .launch_description_index import LaunchDescriptionIndex  # noqa
+
 
 class LaunchDescription(LaunchDescriptionEntity):
     """
@@ -48,6 +52,7 @@ class LaunchDescription(LaunchDescriptionEntity):
     ) -> None:
         """Constructor."""
         self.__entities = list(initial_entities) if initial_entities is not None else []
+        self.__index = None  # type: Optional[LaunchDescriptionIndex]
 
     def visit(self, context: LaunchContext) -> Optional[List[LaunchDescriptionEntity]]:
         """Override visit from LaunchDescriptionEntity to visit contained entities."""
@@ -57,13 +62,30 @@ class LaunchDescription(LaunchDescriptionEntity):
         """Override describe_sub_entities from LaunchDescriptionEntity to return sub entities."""
         return self.__entities
 
+    def get_index(self) -> 'LaunchDescriptionIndex':
+        """
+        Return the index of the entities of this launch description.
+
+        The index is built on first use, by a single pass through this launch
+        description, see :py:class:`launch.LaunchDescriptionIndex`, and it is
+        cached until an entity is added with :py:meth:`add_entity` or
+        :py:meth:`add_action`.
+        Modifying the list returned by :py:attr:`entities`, or any of the
+        entities, does not invalidate the cached index.
+        """
+        if self.__index is None:
+            # import here to avoid loop
+            from .launch_description_index import LaunchDescriptionIndex
+            self.__index = LaunchDescriptionIndex(self.__entities)
+        return self.__index
+
     def get_launch_arguments(self, conditional_inclusion=False) -> List[DeclareLaunchArgument]:
         """
         Return a list of :py:class:`launch.actions.DeclareLaunchArgument` actions.
 
-        This list is generated (never cached) by searching through this launch
-        description for any instances of the action that declares launch
-        arguments.
+        This list is generated by searching through this launch description
+        for any instances of the action that declares launch arguments, and
+        the search is cached, see :py:meth:`get_index`.
 
         It will use :py:meth:`launch.LaunchDescriptionEntity.describe_sub_entities`
         and :py:meth:`launch.LaunchDescriptionEntity.describe_conditional_sub_entities`
@@ -83,27 +105,17 @@ class LaunchDescription(LaunchDescriptionEntity):
         default value and description from the first instance of the argument
         declaration is used.
         """
-        declared_launch_arguments = []  # type: List[DeclareLaunchArgument]
-
-        def process_entities(entities, *, _conditional_inclusion):
-            for entity in entities:
-                if isinstance(entity, DeclareLaunchArgument):
-                    # Avoid duplicate entries with the same name.
-                    if entity.name in [e.name for e in declared_launch_arguments]:
-                        continue
-                    # Stuff this contextual information into the class for
-                    # potential use in command-line descriptions or errors.
-                    entity._conditionally_included = _conditional_inclusion
-                    entity._conditionally_included |= entity.condition is not None
-                    declared_launch_arguments.append(entity)
-                else:
-                    process_entities(
-                        entity.describe_sub_entities(), _conditional_inclusion=False)
-                    process_entities(
-                        entity.describe_conditional_sub_entities(), _conditional_inclusion=True)
-
-        process_entities(self.entities, _conditional_inclusion=conditional_inclusion)
-
+        if conditional_inclusion:
+            # import here to avoid loop
+            from .launch_description_index import LaunchDescriptionIndex
+            index = LaunchDescriptionIndex(self.__entities, conditional_inclusion=True)
+        else:
+            index = self.get_index()
+        declared_launch_arguments = index.launch_arguments
+        for argument in declared_launch_arguments:
+            # Stuff this contextual information into the class for
+            # potential use in command-line descriptions or errors.
+            argument._conditionally_included = index.is_conditionally_included(argument.name)
         return declared_launch_arguments
 
     @property
@@ -114,6 +126,7 @@ class LaunchDescription(LaunchDescriptionEntity):
     def add_entity(self, entity: LaunchDescriptionEntity) -> None:
         """Add an entity to the LaunchDescription."""
         self.__entities.append(entity)
+        self.__index = None
 
     def add_action(self, action: Action) -> None:
         """Add an action to the LaunchDescription."""
@@ -0,0 +1,124 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the LaunchDescriptionIndex class."""
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator  # noqa: F401
+from typing import List
+from typing import Set  # noqa: F401
+from typing import Text
+from typing import Tuple  # noqa: F401
+from typing import Type
+
+from .action import Action
+from .actions import DeclareLaunchArgument
+from .actions import IncludeLaunchDescription
+from .launch_description_entity import LaunchDescriptionEntity
+
+
+class LaunchDescriptionIndex:
+    """
+    Index of the entities which can be described without a launch context.
+
+    The index is built in a single depth-first pass over the given entities,
+    their :py:meth:`launch.LaunchDescriptionEntity.describe_sub_entities`
+    and their :py:meth:`launch.LaunchDescriptionEntity.describe_conditional_sub_entities`,
+    which includes the launch descriptions of
+    :py:class:`launch.actions.IncludeLaunchDescription` actions, if they can
+    be loaded without a launch context.
+
+    Sub-entities of conditional sub-entities, and launch arguments which have
+    a condition themselves, are recorded as conditionally included.
+
+    Use :py:meth:`launch.LaunchDescription.get_index` to get the cached index
+    of a launch description, rather than building one directly.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[LaunchDescriptionEntity],
+        *,
+        conditional_inclusion: bool = False
+    ) -> None:
+        """Constructor."""
+        self.__launch_arguments = {}  # type: Dict[Text, DeclareLaunchArgument]
+        self.__conditionally_included_launch_arguments = set()  # type: Set[Text]
+        self.__actions_by_type = {}  # type: Dict[Type[Action], List[Action]]
+        self.__includes = []  # type: List[IncludeLaunchDescription]
+        self.__number_of_entities = 0
+
+        stack = [(iter(entities), conditional_inclusion)]  # type: List[Tuple[Iterator, bool]]
+        while stack:
+            iterator, conditional = stack[-1]
+            try:
+                entity = next(iterator)
+            except StopIteration:
+                stack.pop()
+                continue
+            self.__number_of_entities += 1
+            if isinstance(entity, Action):
+                self.__actions_by_type.setdefault(type(entity), []).append(entity)
+            if isinstance(entity, DeclareLaunchArgument):
+                # Avoid duplicate entries with the same name, the first declaration is used.
+                if entity.name not in self.__launch_arguments:
+                    self.__launch_arguments[entity.name] = entity
+                    if conditional or entity.condition is not None:
+                        self.__conditionally_included_launch_arguments.add(entity.name)
+                continue
+            if isinstance(entity, IncludeLaunchDescription):
+                self.__includes.append(entity)
+            # Push the conditional sub-entities first, so that they are visited last.
+            for _, conditional_sub_entities in reversed(
+                entity.describe_conditional_sub_entities()
+            ):
+                stack.append((iter(conditional_sub_entities), True))
+            stack.append((iter(entity.describe_sub_entities()), conditional))
+
+    @property
+    def launch_arguments(self) -> List[DeclareLaunchArgument]:
+        """Getter for launch_arguments, the first declaration of each launch argument."""
+        return list(self.__launch_arguments.values())
+
+    def is_conditionally_included(self, launch_argument_name: Text) -> bool:
+        """Return True if the declaration of the given launch argument is conditional."""
+        return launch_argument_name in self.__conditionally_included_launch_arguments
+
+    @property
+    def actions_by_type(self) -> Dict[Type[Action], List[Action]]:
+        """Getter for actions_by_type, the actions, in order, by their exact type."""
+        return self.__actions_by_type
+
+    def get_actions(self, action_type: Type[Action]) -> List[Action]:
+        """
+        Return the actions which are instances of the given type, or of a subclass of it.
+
+        The actions are grouped by their exact type, see :py:attr:`actions_by_type`.
+        """
+        result = []  # type: List[Action]
+        for type_, actions in self.__actions_by_type.items():
+            if issubclass(type_, action_type):
+                result.extend(actions)
+        return result
+
+    @property
+    def includes(self) -> List[IncludeLaunchDescription]:
+        """Getter for includes, the IncludeLaunchDescription actions."""
+        return self.__includes
+
+    @property
+    def number_of_entities(self) -> int:
+        """Getter for number_of_entities, the number of entities indexed."""
+        return self.__number_of_entities
@@ -14,6 +14,7 @@
 
 """Package for launch_description_sources."""
 
+from .prefetch_python_launch_files_impl import prefetch_python_launch_files
 from .python_launch_description_source import PythonLaunchDescriptionSource
 from .python_launch_file_utilities import get_launch_description_from_python_launch_file
 from .python_launch_file_utilities import InvalidPythonLaunchFileError
@@ -23,5 +24,6 @@ __all__ = [
     'get_launch_description_from_python_launch_file',
     'InvalidPythonLaunchFileError',
     'load_python_launch_file_as_module',
+    'prefetch_python_launch_files',
     'PythonLaunchDescriptionSource',
 ]
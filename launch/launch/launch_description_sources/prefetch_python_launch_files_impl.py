@@ -0,0 +1,167 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the prefetch_python_launch_files() function."""
+
+import concurrent.futures
+from importlib.machinery import SourceFileLoader
+import logging
+import os
+import threading
+from typing import Iterator
+from typing import List  # noqa: F401
+from typing import Optional
+from typing import Text
+
+from . import python_launch_file_utilities
+from .python_launch_description_source import PythonLaunchDescriptionSource
+from .python_launch_file_utilities import _compile_code
+from ..actions import IncludeLaunchDescription
+from ..launch_context import LaunchContext
+from ..launch_description import LaunchDescription
+from ..launch_description_entity import LaunchDescriptionEntity
+from ..substitutions import TextSubstitution
+from ..substitutions import ThisLaunchFileDir
+from ..utilities import perform_substitutions
+
+_logger = logging.getLogger('launch.launch_description_sources.prefetch_python_launch_files')
+
+# The thread pool shared by all prefetches, created when first needed.
+_executor_lock = threading.Lock()
+_executor = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix='prefetch_python_launch_files')
+        return _executor
+
+
+def _find_includes(entity: LaunchDescriptionEntity) -> Iterator[IncludeLaunchDescription]:
+    """Yield the includes among the described sub-entities, without loading any of them."""
+    stack = [entity]
+    while stack:
+        entity = stack.pop()
+        if isinstance(entity, IncludeLaunchDescription):
+            yield entity
+            continue
+        sub_entities = list(entity.describe_sub_entities())
+        for _, conditional_sub_entities in entity.describe_conditional_sub_entities():
+            sub_entities.extend(conditional_sub_entities)
+        stack.extend(reversed(sub_entities))
+
+
+def _resolve_statically(
+    include: IncludeLaunchDescription,
+    launch_file_directory: Optional[Text]
+) -> Optional[Text]:
+    """Return the path of the included Python launch file, if it is known without a context."""
+    source = include.launch_description_source
+    if not isinstance(source, PythonLaunchDescriptionSource):
+        return None
+    context = LaunchContext()
+    for sub in source.launch_file_path:
+        if isinstance(sub, ThisLaunchFileDir):
+            if launch_file_directory is None:
+                return None
+        elif not isinstance(sub, TextSubstitution):
+            return None
+    if launch_file_directory is not None:
+        context.extend_locals({'current_launch_file_directory': launch_file_directory})
+    return os.path.realpath(perform_substitutions(context, source.launch_file_path))
+
+
+def _compile(path: Text) -> bool:
+    try:
+        _compile_code(SourceFileLoader('python_launch_file', path))
+    except Exception as exc:
+        # The error will be raised again, and reported properly, if the file is ever visited.
+        _logger.debug("Failed to prefetch launch file '{}': {}".format(path, exc))
+        return False
+    finally:
+        with python_launch_file_utilities._code_cache_lock:
+            python_launch_file_utilities._pending_compilations.pop(path, None)
+    return True
+
+
+def _submit(path: Text) -> concurrent.futures.Future:
+    """Compile the file in the background, unless it is being compiled already."""
+    with python_launch_file_utilities._code_cache_lock:
+        pending = python_launch_file_utilities._pending_compilations.get(path)
+        if pending is None:
+            pending = _get_executor().submit(_compile, path)
+            # The future can't be done yet, as the lock is needed to finish compiling.
+            python_launch_file_utilities._pending_compilations[path] = pending
+    return pending
+
+
+def prefetch_python_launch_files(
+    launch_description: LaunchDescription,
+    *,
+    launch_file_directory: Optional[Text] = None
+) -> concurrent.futures.Future:
+    """
+    Read and compile the Python launch files included by a launch description, in the background.
+
+    Only includes whose path can be resolved without a runtime context are
+    prefetched, i.e. paths made up of text and
+    :class:`launch.substitutions.ThisLaunchFileDir` substitutions.
+    The files are read and compiled in a thread pool shared by all
+    prefetches, but not executed, and this returns right away.
+    The compiled code is cached, see :func:`load_python_launch_file_as_module`,
+    so that when the launch description is visited later, loading the
+    included launch files only requires executing them, after waiting for
+    them to be compiled if they are still being compiled.
+
+    Only the launch files included directly are prefetched, as the launch
+    files they include are only known once they are executed.
+    :class:`launch.launch_description_sources.PythonLaunchDescriptionSource`
+    prefetches the includes of each launch file it loads, so that the next
+    level of the include tree is compiled while the launch file is visited.
+
+    Failures are ignored, as they will be raised again if and when the
+    include is actually visited.
+
+    :param launch_description: the launch description whose includes should be prefetched
+    :param launch_file_directory: the directory of the launch file from
+        which the launch description was loaded, if any, which is used for
+        :class:`launch.substitutions.ThisLaunchFileDir`
+    :returns: a future of the paths of the launch files which were
+        prefetched successfully, in order
+    """
+    paths = []  # type: List[Text]
+    for include in _find_includes(launch_description):
+        path = _resolve_statically(include, launch_file_directory)
+        if path is not None and path not in paths:
+            paths.append(path)
+    futures = [_submit(path) for path in paths]
+    result = concurrent.futures.Future()  # type: concurrent.futures.Future
+    lock = threading.Lock()
+    remaining = [len(futures)]
+
+    def on_done(future: concurrent.futures.Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] > 0:
+                return
+        result.set_result([path for path, future in zip(paths, futures) if future.result()])
+
+    if not futures:
+        result.set_result([])
+    for future in futures:
+        future.add_done_callback(on_done)
+    return result
@@ -15,19 +15,45 @@
 """Module for the PythonLaunchDescriptionSource class."""
 
 import logging
+import os
+import threading
 import traceback
+from typing import Dict  # noqa: F401
+from typing import List
 from typing import Optional
 from typing import Text  # noqa: F401
+from typing import Tuple  # noqa: F401
 
+from .python_launch_file_utilities import _get_file_stamp
 from .python_launch_file_utilities import get_launch_description_from_python_launch_file
 from ..launch_context import LaunchContext
 from ..launch_description import LaunchDescription
+from ..launch_plan import get_launch_plan
 from ..some_substitutions_type import SomeSubstitutionsType
+from ..substitution import Substitution
 from ..utilities import normalize_to_list_of_substitutions
 from ..utilities import perform_substitutions
 
 _logger = logging.getLogger('launch.launch_description_sources.PythonLaunchDescriptionSource')
 
+# Launch descriptions loaded without a context, i.e. for introspection, keyed by real path.
+_launch_descriptions_without_context_lock = threading.Lock()
+_launch_descriptions_without_context = \
+    {}  # type: Dict[Text, Tuple[Tuple[int, int], LaunchDescription]]
+
+
+def _get_launch_description_without_context(launch_file_path: Text) -> LaunchDescription:
+    path = os.path.realpath(launch_file_path)
+    stamp = _get_file_stamp(path)
+    with _launch_descriptions_without_context_lock:
+        cached = _launch_descriptions_without_context.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    launch_description = get_launch_description_from_python_launch_file(path)
+    with _launch_descriptions_without_context_lock:
+        _launch_descriptions_without_context[path] = (stamp, launch_description)
+    return launch_description
+
 
 class PythonLaunchDescriptionSource:
     """Encapsulation of a Python launch file, which can be loaded during launch."""
@@ -55,14 +81,20 @@ class PythonLaunchDescriptionSource:
         self.__launch_description = None  # type: Optional[LaunchDescription]
 
     def try_get_launch_description_without_context(self) -> Optional[LaunchDescription]:
-        """Get the LaunchDescription, attempting to load it if necessary."""
+        """
+        Get the LaunchDescription, attempting to load it if necessary.
+
+        Launch descriptions loaded this way are only meant to be introspected,
+        so they are cached and shared by all sources of the same file, until
+        the file changes.
+        """
         if self.__launch_description is None:
             # Try to expand the launch file path and load the launch file with a local context.
             try:
                 context = LaunchContext()
                 expanded_launch_file_path = \
                     perform_substitutions(context, self.__launch_file_path)
-                return get_launch_description_from_python_launch_file(expanded_launch_file_path)
+                return _get_launch_description_without_context(expanded_launch_file_path)
             except Exception as exc:
                 _logger.debug(traceback.format_exc())
                 _logger.debug('Failed to load the launch file without a context: ' + str(exc))
@@ -76,8 +108,23 @@ class PythonLaunchDescriptionSource:
         if self.__launch_description is None:
             self.__launch_description = \
                 get_launch_description_from_python_launch_file(self.__expanded_launch_file_path)
+            # Compile the launch files it includes in the background, while it is visited.
+            # import here to avoid loop
+            from .prefetch_python_launch_files_impl import prefetch_python_launch_files
+            prefetch_python_launch_files(
+                self.__launch_description,
+                launch_file_directory=os.path.dirname(
+                    os.path.abspath(self.__expanded_launch_file_path)))
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            launch_plan.add_input(self.__expanded_launch_file_path)
         return self.__launch_description
 
+    @property
+    def launch_file_path(self) -> List[Substitution]:
+        """Getter for launch_file_path."""
+        return self.__launch_file_path
+
     @property
     def location(self) -> str:
         """
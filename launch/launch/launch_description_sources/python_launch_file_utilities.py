@@ -14,14 +14,26 @@
 
 """Python package utility functions related to loading Python Launch Files."""
 
+import concurrent.futures
 from importlib.machinery import SourceFileLoader
 from importlib.util import module_from_spec
 from importlib.util import spec_from_loader
+import os
+import threading
+from types import CodeType
 from types import ModuleType
+from typing import Dict  # noqa: F401
 from typing import Text
+from typing import Tuple
 
 from ..launch_description import LaunchDescription
 
+# Compiled code of the Python launch files which have been loaded so far, keyed by real path.
+_code_cache_lock = threading.Lock()
+_code_cache = {}  # type: Dict[Text, Tuple[Tuple[int, int], CodeType]]
+# Compilations in progress in the background, see prefetch_python_launch_files(), by real path.
+_pending_compilations = {}  # type: Dict[Text, concurrent.futures.Future]
+
 
 class InvalidPythonLaunchFileError(Exception):
     """Exception raised when the given Python launch file is not valid."""
@@ -29,12 +41,46 @@ class InvalidPythonLaunchFileError(Exception):
     ...
 
 
+def _get_file_stamp(path: Text) -> Tuple[int, int]:
+    """Return the modification time and size of the file, used to detect changes to it."""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_code(loader: SourceFileLoader) -> CodeType:
+    """Return the compiled code of the loader's file, compiling it only if it has changed."""
+    with _code_cache_lock:
+        pending = _pending_compilations.get(os.path.realpath(loader.path))
+    if pending is not None:
+        # Wait for the file to be compiled in the background, rather than compiling it twice.
+        concurrent.futures.wait([pending])
+    return _compile_code(loader)
+
+
+def _compile_code(loader: SourceFileLoader) -> CodeType:
+    path = os.path.realpath(loader.path)
+    stamp = _get_file_stamp(path)
+    with _code_cache_lock:
+        cached = _code_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    code = loader.get_code(loader.name)
+    with _code_cache_lock:
+        _code_cache[path] = (stamp, code)
+    return code
+
+
 def load_python_launch_file_as_module(python_launch_file_path: Text) -> ModuleType:
-    """Load a given Python launch file (by path) as a Python module."""
+    """
+    Load a given Python launch file (by path) as a Python module.
+
+    The module is executed every time, but the compiled code is reused for as
+    long as the modification time and size of the file do not change.
+    """
     loader = SourceFileLoader('python_launch_file', python_launch_file_path)
     spec = spec_from_loader(loader.name, loader)
     mod = module_from_spec(spec)
-    loader.exec_module(mod)
+    exec(_get_code(loader), mod.__dict__)
     return mod
 
 
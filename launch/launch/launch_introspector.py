@@ -14,19 +14,25 @@
 
 """Module for the LaunchIntrospector class."""
 
+import json
 import logging
+from typing import Any
 from typing import cast
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional  # noqa: F401
 from typing import Text
+from typing import TextIO
+from typing import Tuple
 
 from .action import Action
 from .actions import EmitEvent
 from .actions import ExecuteProcess
 from .actions import LogInfo
 from .actions import RegisterEventHandler
-from .event_handler import EventHandler
 from .launch_description import LaunchDescription
-from .launch_description_entity import LaunchDescriptionEntity
 from .some_substitutions_type import SomeSubstitutionsType
 from .utilities import is_a
 from .utilities import normalize_to_list_of_substitutions
@@ -39,62 +45,12 @@ def indent(lines: List[Text], indention: Text = '    ') -> List[Text]:
     return ['{}{}'.format(indention, line) for line in lines]
 
 
-def tree_like_indent(lines: List[Text]) -> List[Text]:
-    """Replace whitespace with "tree"-like indentation symbols."""
-    result = []
-    previous_first_non_whitespace = None
-    for old_line in lines:
-        if not old_line.startswith('    '):
-            continue
-        line = str(old_line)
-        line = '│' + line[1:]
-        first_non_whitespace = len(old_line) - len(old_line.lstrip())
-        if previous_first_non_whitespace is not None and '└' in result[-1]:
-            if previous_first_non_whitespace <= first_non_whitespace:
-                result[-1] = result[-1].replace('└', '├', 1)
-        previous_first_non_whitespace = first_non_whitespace
-        line = line[0:first_non_whitespace - 4] + '└── ' + line[first_non_whitespace:]
-        result.append(line)
-    if result[-1].startswith('│'):
-        result[-1] = ' ' + result[-1][1:]
-    # TODO(wjwwood): figure out how to handle remaining cases like how to fix this sample:
-    # ├── OnProcessExit(...)
-    # │   └── Action(...)
-    # ├── OnProcessExit(...)
-    #     └── Action(...)
-    # ^ this dangling stub
-    return result
-
-
-def format_entities(entities: List[LaunchDescriptionEntity]) -> List[Text]:
-    """Return a list of lines of text that represent of a list of LaunchDescriptionEntity's."""
-    result = []
-    for entity in entities:
-        if is_a(entity, Action):
-            result.extend(format_action(cast(Action, entity)))
-        else:
-            result.append("Unknown entity('{}')".format(entity))
-    return result
-
-
 def format_substitutions(substitutions: SomeSubstitutionsType) -> Text:
     """Return a text representation of some set of substitutions."""
     normalized_substitutions = normalize_to_list_of_substitutions(substitutions)
     return ' + '.join([sub.describe() for sub in normalized_substitutions])
 
 
-def format_event_handler(event_handler: EventHandler) -> List[Text]:
-    """Return a text representation of an event handler."""
-    if hasattr(event_handler, 'describe'):
-        # TODO(wjwwood): consider supporting mode complex descriptions of branching
-        description, entities = event_handler.describe()  # type: ignore
-        result = [description]
-        result.extend(indent(format_entities(entities)))
-        return result
-    else:
-        return ["EventHandler('{}')".format(hex(id(event_handler)))]
-
-
 def format_action(action: Action) -> List[Text]:
     """Return a text representation of an action."""
     if is_a(action, LogInfo):
@@ -110,26 +66,203 @@ def format_action(action: Action) -> List[Text]:
             ),
             typed_action.env if typed_action.env is None else '{' + ', '.join(
                 ['{}: {}'.format(format_substitutions(k), format_substitutions(v))
-                 for k, v in typed_action.env.items()]) + '}',
+                 for k, v in typed_action.env]) + '}',
             typed_action.shell,
         )
         return [msg]
     elif is_a(action, RegisterEventHandler):
-        # Different variable name used to assist with type checking.
-        typed_action2 = cast(RegisterEventHandler, action)
-        result = ["RegisterEventHandler('{}'):".format(typed_action2.event_handler)]
-        result.extend(indent(format_event_handler(typed_action2.event_handler)))
-        return result
+        # The event handler is described by its own nodes, see _describe_node().
+        return ["RegisterEventHandler('{}'):".format(
+            cast(RegisterEventHandler, action).event_handler)]
     else:
         return ["Action('{}')".format(action)]
 
 
+def _iterate_with_is_last(iterable: Iterable[Any]) -> Iterator[Tuple[Any, bool]]:
+    """Yield each item together with whether or not it is the last one."""
+    iterator = iter(iterable)
+    try:
+        previous = next(iterator)
+    except StopIteration:
+        return
+    for item in iterator:
+        yield previous, False
+        previous = item
+    yield previous, True
+
+
+def _describe_node(kind: Text, node: Any) -> Tuple[Text, List[Tuple[Text, Any]]]:
+    """Return a one line description of an entity or event handler, and its children."""
+    if kind == 'event_handler':
+        if hasattr(node, 'describe'):
+            description, entities = node.describe()
+            return description, [('entity', entity) for entity in entities]
+        return "EventHandler('{}')".format(hex(id(node))), []
+    if is_a(node, Action):
+        children = []  # type: List[Tuple[Text, Any]]
+        if is_a(node, RegisterEventHandler):
+            children.append(('event_handler', cast(RegisterEventHandler, node).event_handler))
+        return format_action(cast(Action, node))[0], children
+    return "Unknown entity('{}')".format(node), []
+
+
 class LaunchIntrospector:
-    """Provides an interface through which you can visit all entities of a LaunchDescription."""
+    """
+    Provides an interface through which you can visit all entities of a LaunchDescription.
+
+    The entities of a launch description, and the event handlers registered
+    by them along with the entities of those, form a tree which can be
+    iterated as nodes, see :py:meth:`iterate_launch_description_nodes`, and
+    formatted as text, JSON or GraphViz, incrementally.
+    """
+
+    def iterate_launch_description_nodes(
+        self,
+        launch_description: LaunchDescription
+    ) -> Iterator[Dict[Text, Any]]:
+        """
+        Yield the nodes of the tree of a LaunchDescription, depth-first.
+
+        Each node is a dictionary with:
+
+        - 'id', an integer which is unique within the tree
+        - 'parent', the id of the parent node, or None for the entities of
+          the launch description itself
+        - 'depth', the depth of the node, 0 for the entities of the launch
+          description itself
+        - 'is_last', whether or not the node is the last child of its parent
+        - 'kind', either 'entity' or 'event_handler'
+        - 'type', the name of the type of the entity or event handler
+        - 'description', a one line description of the entity or event handler
+
+        The nodes are generated as they are yielded, so the tree is never
+        held in memory.
+        """
+        next_id = 0
+        stack = [(_iterate_with_is_last(
+            ('entity', entity) for entity in launch_description.entities
+        ), None, 0)]  # type: List[Tuple[Iterator[Tuple[Any, bool]], Optional[int], int]]
+        while stack:
+            iterator, parent, depth = stack[-1]
+            try:
+                (kind, node), is_last = next(iterator)
+            except StopIteration:
+                stack.pop()
+                continue
+            description, children = _describe_node(kind, node)
+            yield {
+                'id': next_id,
+                'parent': parent,
+                'depth': depth,
+                'is_last': is_last,
+                'kind': kind,
+                'type': type(node).__name__,
+                'description': description,
+            }
+            if children:
+                stack.append((_iterate_with_is_last(children), next_id, depth + 1))
+            next_id += 1
+
+    def iterate_launch_description_lines(
+        self,
+        launch_description: LaunchDescription
+    ) -> Iterator[Text]:
+        """Yield the lines of the string representation of a LaunchDescription."""
+        yield '{}'.format(launch_description)
+        # The prefix of the children of the last node at each depth.
+        prefixes = ['']
+        for node in self.iterate_launch_description_nodes(launch_description):
+            depth = node['depth']
+            prefix = prefixes[depth]
+            del prefixes[depth + 1:]
+            if node['is_last']:
+                yield '{}└── {}'.format(prefix, node['description'])
+                prefixes.append(prefix + '    ')
+            else:
+                yield '{}├── {}'.format(prefix, node['description'])
+                prefixes.append(prefix + '│   ')
 
     def format_launch_description(self, launch_description: LaunchDescription) -> Text:
         """Return a string representation of a LaunchDescription."""
-        result = '{}\n'.format(launch_description)
-        entity_descriptions = format_entities(launch_description.entities)
-        result += '\n'.join(tree_like_indent(indent(entity_descriptions)))
-        return result
+        return '\n'.join(self.iterate_launch_description_lines(launch_description))
+
+    def format_launch_description_index(self, launch_description: LaunchDescription) -> Text:
+        """
+        Return a summary of a LaunchDescription, from its index.
+
+        The summary lists the declared arguments, the included launch
+        descriptions and the number of actions of each type, including the
+        ones of the included launch descriptions which could be loaded, see
+        :py:meth:`launch.LaunchDescription.get_index`.
+        """
+        index = launch_description.get_index()
+        lines = ['Arguments:']
+        lines.extend(indent([
+            "'{}'{}".format(
+                argument.name, ' (conditional)' if index.is_conditionally_included(
+                    argument.name) else '')
+            for argument in index.launch_arguments
+        ] or ['None']))
+        lines.append('Includes:')
+        lines.extend(indent([
+            "'{}'".format(include.launch_description_source.location)
+            for include in index.includes
+        ] or ['None']))
+        lines.append('Actions:')
+        lines.extend(indent(sorted(
+            '{}: {}'.format(action_type.__name__, len(actions))
+            for action_type, actions in index.actions_by_type.items()
+        ) or ['None']))
+        return '\n'.join(lines)
+
+    def write_launch_description_json(
+        self,
+        launch_description: LaunchDescription,
+        stream: TextIO
+    ) -> None:
+        """
+        Write the tree of a LaunchDescription to a stream as JSON, incrementally.
+
+        The JSON object has the description of the launch description, as
+        'launch_description', and the list of nodes of the tree, as 'nodes',
+        see :py:meth:`iterate_launch_description_nodes`.
+        """
+        stream.write('{{"launch_description": {}, "nodes": ['.format(
+            json.dumps('{}'.format(launch_description))))
+        separator = '\n'
+        for node in self.iterate_launch_description_nodes(launch_description):
+            stream.write(separator)
+            stream.write(json.dumps(node))
+            separator = ',\n'
+        stream.write('\n]}\n')
+
+    def write_launch_description_dot(
+        self,
+        launch_description: LaunchDescription,
+        stream: TextIO
+    ) -> None:
+        """
+        Write the tree of a LaunchDescription to a stream as a GraphViz graph, incrementally.
+
+        Entities are drawn as boxes and event handlers as ellipses, and the
+        edges from event handlers to the entities they return are dashed.
+        """
+        stream.write('digraph launch_description {\n')
+        stream.write('    root [label={}, shape=box, style=bold];\n'.format(
+            json.dumps('{}'.format(launch_description), ensure_ascii=False)))
+        # The kind of the last node at each depth.
+        kinds = []  # type: List[Text]
+        for node in self.iterate_launch_description_nodes(launch_description):
+            depth = node['depth']
+            del kinds[depth:]
+            kinds.append(node['kind'])
+            stream.write('    node{} [label={}, shape={}];\n'.format(
+                node['id'], json.dumps(node['description'], ensure_ascii=False),
+                'ellipse' if node['kind'] == 'event_handler' else 'box'))
+            if node['parent'] is None:
+                stream.write('    root -> node{};\n'.format(node['id']))
+            else:
+                stream.write('    node{} -> node{}{};\n'.format(
+                    node['parent'], node['id'],
+                    ' [style=dashed]' if kinds[depth - 1] == 'event_handler' else ''))
+        stream.write('}\n')
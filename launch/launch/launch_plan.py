@@ -0,0 +1,349 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the LaunchPlan class."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+from .condition import Condition
+from .event_handler import EventHandler
+from .launch_context import LaunchContext
+from .launch_description import LaunchDescription
+from .launch_description_entity import LaunchDescriptionEntity
+
+LAUNCH_PLAN_FORMAT_VERSION = 1
+
+# Environment variables which are maintained by shells and do not affect launching.
+_VOLATILE_ENVIRONMENT_VARIABLES = frozenset(['_', 'OLDPWD', 'PWD', 'SHLVL'])
+
+
+def _hash_file(path: Text) -> Text:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def get_launch_plan_key(
+    *,
+    launch_file_path: Text,
+    launch_arguments: Iterable[Text],
+    environment: Optional[Mapping[Text, Text]] = None
+) -> Text:
+    """
+    Return the key of the launch plan of a launch file, given its arguments and environment.
+
+    The key does not cover the contents of the launch file, or of any other
+    file read while creating the launch plan, see :meth:`LaunchPlan.is_up_to_date`.
+
+    :param launch_file_path: path of the launch file
+    :param launch_arguments: arguments passed to the launch file
+    :param environment: environment in which the launch file is launched,
+        defaults to `os.environ`, the variables maintained by shells are ignored
+    """
+    environment = os.environ if environment is None else environment
+    key = json.dumps({
+        'version': LAUNCH_PLAN_FORMAT_VERSION,
+        'launch_file_path': os.path.abspath(launch_file_path),
+        'launch_arguments': list(launch_arguments),
+        'cwd': os.getcwd(),
+        'environment': sorted(
+            (name, value) for name, value in environment.items()
+            if name not in _VOLATILE_ENVIRONMENT_VARIABLES),
+    })
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _remove_restored_files(paths: List[Text]) -> None:
+    for path in paths:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def get_launch_plan(context: LaunchContext) -> Optional['LaunchPlan']:
+    """Return the launch plan being created with the given context, if any."""
+    # Contexts which are not a LaunchContext, e.g. test doubles, are never used to plan.
+    return getattr(context, '_launch_plan', None)
+
+
+class LaunchPlan:
+    """
+    Fully expanded set of processes launched by a launch description.
+
+    A launch plan is created by running the launch description without
+    launching any processes, see :meth:`create`, and it can be saved and
+    loaded, so that later the same processes can be launched again without
+    evaluating the launch description, see :meth:`to_launch_description`.
+
+    Only processes which are launched unconditionally can be replayed, so a
+    plan is not cacheable if the launch description does anything which
+    depends on events or time, e.g. registering event handlers or using
+    timers, see :attr:`uncacheable_reasons`.
+
+    A plan also records the files read while creating it, e.g. the included
+    launch files, so that it can be checked for being up to date, see
+    :meth:`is_up_to_date`, and it stores the contents of the files generated
+    for the processes, e.g. parameter files, so they can be restored.
+    """
+
+    def __init__(
+        self,
+        *,
+        key: Optional[Text] = None,
+        inputs: Optional[Dict[Text, Text]] = None,
+        processes: Optional[List[Dict[Text, Any]]] = None,
+        files: Optional[Dict[Text, Text]] = None,
+        uncacheable_reasons: Optional[List[Text]] = None
+    ) -> None:
+        """Constructor."""
+        self.__key = key
+        self.__inputs = {} if inputs is None else inputs
+        self.__processes = [] if processes is None else processes
+        self.__files = {} if files is None else files
+        self.__uncacheable_reasons = [] if uncacheable_reasons is None else uncacheable_reasons
+        self.__conditions = []  # type: List[Tuple[LaunchDescriptionEntity, Condition, bool]]
+        self.__event_handlers = []  # type: List[EventHandler]
+        self.__timings = []  # type: List[Tuple[LaunchDescriptionEntity, Text, float]]
+
+    @property
+    def key(self) -> Optional[Text]:
+        """Getter for key."""
+        return self.__key
+
+    @property
+    def inputs(self) -> Dict[Text, Text]:
+        """Getter for inputs, the SHA-256 hash of the files read while creating the plan."""
+        return self.__inputs
+
+    @property
+    def processes(self) -> List[Dict[Text, Any]]:
+        """Getter for processes, the expanded arguments of each process."""
+        return self.__processes
+
+    @property
+    def files(self) -> Dict[Text, Text]:
+        """Getter for files, the contents of the files generated for the processes."""
+        return self.__files
+
+    @property
+    def uncacheable_reasons(self) -> List[Text]:
+        """Getter for uncacheable_reasons."""
+        return self.__uncacheable_reasons
+
+    @property
+    def conditions(self) -> List[Tuple[LaunchDescriptionEntity, Condition, bool]]:
+        """Getter for conditions, the evaluated conditions and whether they were True."""
+        return self.__conditions
+
+    @property
+    def event_handlers(self) -> List[EventHandler]:
+        """Getter for event_handlers, the event handlers registered by actions."""
+        return self.__event_handlers
+
+    @property
+    def timings(self) -> List[Tuple[LaunchDescriptionEntity, Text, float]]:
+        """
+        Getter for timings, the time spent on each entity, in seconds.
+
+        The time spent visiting each entity is recorded as the 'visit' phase,
+        and the time spent expanding the substitutions of each process
+        asynchronously is recorded as the 'expansion' phase.
+        """
+        return self.__timings
+
+    @property
+    def is_cacheable(self) -> bool:
+        """Return True if the plan can be used instead of the launch description."""
+        return not self.__uncacheable_reasons
+
+    def add_input(self, path: Text) -> None:
+        """Record a file read while creating the plan."""
+        path = os.path.abspath(path)
+        if path not in self.__inputs:
+            self.__inputs[path] = _hash_file(path)
+
+    def add_process(self, process: Dict[Text, Any]) -> None:
+        """
+        Record a process, described by the expanded arguments of ExecuteProcess.
+
+        The files listed as 'inputs' are recorded with :meth:`add_input`, and
+        the contents of the files listed as 'files' are stored.
+        """
+        process = dict(process)
+        for path in process.pop('inputs', []):
+            self.add_input(path)
+        for path in process['files']:
+            with open(path, 'r') as f:
+                self.__files[path] = f.read()
+        self.__processes.append(process)
+
+    def add_uncacheable_reason(self, reason: Text) -> None:
+        """Record why the launch description can't be replaced by this plan."""
+        self.__uncacheable_reasons.append(reason)
+
+    def add_condition(
+        self,
+        entity: LaunchDescriptionEntity,
+        condition: Condition,
+        value: bool
+    ) -> None:
+        """Record the evaluation of the condition of an entity."""
+        self.__conditions.append((entity, condition, value))
+
+    def add_event_handler(self, event_handler: EventHandler) -> None:
+        """Record the registration of an event handler."""
+        self.__event_handlers.append(event_handler)
+
+    def add_timing(self, entity: LaunchDescriptionEntity, phase: Text, seconds: float) -> None:
+        """Record the time spent on an entity, see :attr:`timings`."""
+        self.__timings.append((entity, phase, seconds))
+
+    def is_up_to_date(self) -> bool:
+        """Return True if none of the files read while creating the plan changed since."""
+        for path, digest in self.__inputs.items():
+            try:
+                if _hash_file(path) != digest:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def to_launch_description(self) -> LaunchDescription:
+        """
+        Return a launch description which launches the processes of this plan.
+
+        Generated files which no longer exist are restored first, and they
+        are removed again, along with the directories created for them, when
+        the launch system shuts down.
+        """
+        # import here to avoid loop
+        from .actions import ExecuteProcess
+        from .actions import RegisterEventHandler
+        from .event_handlers import OnShutdown
+        restored_paths = []  # type: List[Text]
+        for path, contents in self.__files.items():
+            if not os.path.exists(path):
+                # Remove the outermost directory created for the file, if any, rather than it.
+                restored_path = path
+                directory = os.path.dirname(path)
+                while not os.path.exists(directory):
+                    restored_path = directory
+                    directory = os.path.dirname(directory)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'w') as f:
+                    f.write(contents)
+                restored_paths.append(restored_path)
+        entities = []  # type: List[LaunchDescriptionEntity]
+        if restored_paths:
+            entities.append(RegisterEventHandler(OnShutdown(
+                on_shutdown=lambda event, context: _remove_restored_files(restored_paths))))
+        entities.extend(
+            ExecuteProcess(
+                name=process['name'],
+                cmd=process['cmd'],
+                cwd=process['cwd'],
+                env=process['env'],
+                shell=process['shell'],
+                sigterm_timeout=process['sigterm_timeout'],
+                sigkill_timeout=process['sigkill_timeout'],
+                # The prefix is already part of the recorded command.
+                prefix='',
+                output=process['output'],
+                # Not recorded by older plans.
+                output_filter=process.get('output_filter'),
+                output_rate_limit=process.get('output_rate_limit'),
+                output_tail_size=process.get('output_tail_size', 8192),
+                output_log=process.get('output_log'),
+                output_records=process.get('output_records', False),
+                process_group=process.get('process_group', True),
+                log_cmd=process['log_cmd'],
+            )
+            for process in self.__processes
+        )
+        return LaunchDescription(entities)
+
+    def save(self, path: Text) -> None:
+        """Save the plan, atomically, as JSON."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode='w', dir=directory, prefix='.launch_plan_', delete=False
+        ) as h:
+            json.dump({
+                'version': LAUNCH_PLAN_FORMAT_VERSION,
+                'key': self.__key,
+                'inputs': self.__inputs,
+                'processes': self.__processes,
+                'files': self.__files,
+                'uncacheable_reasons': self.__uncacheable_reasons,
+            }, h)
+        os.replace(h.name, path)
+
+    @classmethod
+    def load(cls, path: Text) -> Optional['LaunchPlan']:
+        """Load a plan saved with :meth:`save`, or return None if missing or invalid."""
+        try:
+            with open(path, 'r') as h:
+                data = json.load(h)
+            if data['version'] != LAUNCH_PLAN_FORMAT_VERSION:
+                return None
+            return cls(
+                key=data['key'],
+                inputs=data['inputs'],
+                processes=data['processes'],
+                files=data['files'],
+                uncacheable_reasons=data['uncacheable_reasons'],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def create(
+        cls,
+        launch_description: LaunchDescription,
+        *,
+        key: Optional[Text] = None,
+        argv: Optional[Iterable[Text]] = None
+    ) -> 'LaunchPlan':
+        """
+        Create the plan of a launch description, see :meth:`launch.LaunchService.plan`.
+
+        The launch description is run to create the plan, so it must not be
+        launched afterwards, as its actions were already executed.
+
+        :param launch_description: the launch description to plan
+        :param key: the key of the plan, see :func:`get_launch_plan_key`
+        :param argv: passed to the launch service
+        :raises: RuntimeError if running the launch description failed
+        """
+        # import here to avoid loop
+        from .launch_service import LaunchService
+        launch_service = LaunchService(argv=argv)
+        launch_service.include_launch_description(launch_description)
+        return launch_service.plan(key=key)
@@ -38,12 +38,14 @@ from .events import Shutdown
 from .launch_context import LaunchContext
 from .launch_description import LaunchDescription
 from .launch_description_entity import LaunchDescriptionEntity
+from .launch_plan import LaunchPlan
+from .process_journal import ProcessJournal
 from .some_actions_type import SomeActionsType
 from .utilities import install_signal_handlers
 from .utilities import on_sigint
 from .utilities import on_sigquit
 from .utilities import on_sigterm
-from .utilities import visit_all_entities_and_collect_futures
+from .utilities import visit_all_entities_and_iterate_futures
 
 _logger = logging.getLogger('launch.LaunchService')
 _g_loops_used = set()  # type: Set
@@ -68,7 +70,8 @@ class LaunchService:
         self,
         *,
         argv: Optional[Iterable[Text]] = None,
-        debug: bool = False
+        debug: bool = False,
+        process_journal: Optional[Text] = None
     ) -> None:
         """
         Constructor.
@@ -80,6 +83,11 @@ class LaunchService:
 
         :param: argv stored in the context for access by the entities, None results in []
         :param: debug if True (not default), asyncio the logger are seutp for debug
+        :param: process_journal the path of a :class:`launch.ProcessJournal` of
+            the processes launched, so that the processes which are still
+            running after the launch service died can be adopted by the next
+            launch service with the same journal, rather than started again;
+            the journal is closed when :meth:`run` returns
         """
         # Install signal handlers if not already installed, will raise if not
         # in main-thread, call manually in main-thread to avoid this.
@@ -102,6 +110,8 @@ class LaunchService:
         self.__context = LaunchContext(argv=self.__argv)
         self.__context.register_event_handler(OnIncludeLaunchDescription())
         self.__context.register_event_handler(OnShutdown(on_shutdown=self.__on_shutdown))
+        if process_journal is not None:
+            self.__context._process_journal = ProcessJournal(process_journal)
 
         # Setup storage for state.
         self._entity_future_pairs = \
@@ -195,8 +205,9 @@ class LaunchService:
                             "expected a LaunchDescriptionEntity from event_handler, got '{}'"
                             .format(entity)
                         )
+                    # Stream the futures in as the entities are visited.
                     self._entity_future_pairs.extend(
-                        visit_all_entities_and_collect_futures(entity, self.__context))
+                        visit_all_entities_and_iterate_futures(entity, self.__context))
                 self.__context._pop_locals()
             else:
                 pass
@@ -205,6 +216,7 @@ class LaunchService:
                 #     "processing event: '{}' x '{}'".format(event, event_handler))
 
     async def __run_loop(self) -> None:
+        process_one_event_task = None  # type: Optional[asyncio.Task]
         while True:
             # Check if we're idle, i.e. no on-going entities (actions) or events in the queue
             is_idle = self._is_idle()  # self._entity_future_pairs is pruned here
@@ -215,8 +227,9 @@ class LaunchService:
 
             if self.__loop_from_run_thread is None:
                 raise RuntimeError('__loop_from_run_thread unexpectedly None')
-            process_one_event_task = self.__loop_from_run_thread.create_task(
-                self._process_one_event())
+            if process_one_event_task is None or process_one_event_task.done():
+                process_one_event_task = self.__loop_from_run_thread.create_task(
+                    self._process_one_event())
             if self.__shutting_down:
                 # If shutting down and idle then we're done.
                 if is_idle:
@@ -236,7 +249,17 @@ class LaunchService:
                         if not done:
                             _logger.debug('still waiting on futures: {}'.format(entity_futures))
             else:
-                await process_one_event_task
+                # Entities may complete without emitting an event, so wake up when any of them
+                # completes as well, in order to check if the launch service became idle.
+                entity_futures = [pair[1] for pair in self._entity_future_pairs]
+                entity_futures.extend(self.__context._completion_futures)
+                await asyncio.wait(
+                    [process_one_event_task] + entity_futures,
+                    loop=self.__loop_from_run_thread,
+                    return_when=asyncio.FIRST_COMPLETED)
+                if process_one_event_task.done():
+                    # Raise any exception which occurred while processing the event.
+                    process_one_event_task.result()
 
     def run(self, *, shutdown_when_idle=True) -> int:
         """
@@ -318,7 +341,12 @@ class LaunchService:
 
                 # TODO(wjwwood): try to terminate running subprocesses before exiting.
                 _logger.error('using SIGTERM or SIGQUIT can result in orphaned processes')
-                _logger.error('make sure no processes launched are still running')
+                if self.__context._process_journal is not None:
+                    _logger.error(
+                        'processes still running can be adopted by launching again with the '
+                        "process journal '{}'".format(self.__context._process_journal.path))
+                else:
+                    _logger.error('make sure no processes launched are still running')
                 nonlocal run_loop_task
                 self.__loop_from_run_thread.call_soon_threadsafe(run_loop_task.cancel)
 
@@ -363,6 +391,10 @@ class LaunchService:
                 self.__loop_from_run_thread = None
                 self.__context._set_asyncio_loop(None)
 
+            if self.__context._process_journal is not None:
+                self.__context._process_journal.report_orphans()
+                self.__context._process_journal.close()
+
             # Unset the signal handlers while not running.
             on_sigint(None)
             on_sigterm(None)
@@ -373,8 +405,34 @@ class LaunchService:
 
         return self.__return_code
 
+    def plan(self, *, key: Optional[Text] = None) -> LaunchPlan:
+        """
+        Run the included launch descriptions without launching any processes.
+
+        Every entity is visited and every process is fully expanded, as in
+        :meth:`run`, but the processes are recorded in a
+        :class:`launch.LaunchPlan` instead of being launched.
+        The plan also records the conditions evaluated, the event handlers
+        registered and the time spent visiting and expanding each entity.
+
+        :param: key the key of the plan, see :func:`launch.launch_plan.get_launch_plan_key`
+        :returns: the plan
+        :raises: RuntimeError if running the launch descriptions failed
+        """
+        launch_plan = LaunchPlan(key=key)
+        self.__context._launch_plan = launch_plan
+        try:
+            return_code = self.run()
+        finally:
+            self.__context._launch_plan = None
+        if return_code != 0:
+            raise RuntimeError(
+                'failed to plan the launch description, return code {}'.format(return_code))
+        return launch_plan
+
     def __on_shutdown(self, event: Event, context: LaunchContext) -> Optional[SomeActionsType]:
         self.__shutting_down = True
+        self.__context._set_is_shutdown(True)
         return None
 
     def _shutdown(self, *, reason, due_to_sigint, force_sync=False):
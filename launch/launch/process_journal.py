@@ -0,0 +1,394 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for the ProcessJournal class."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import signal
+import tempfile
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+from .launch_context import LaunchContext
+from .utilities.pidfd_subprocess_impl import _OutputFilesReader
+
+_logger = logging.getLogger('launch.ProcessJournal')
+
+
+def get_process_journal(context: LaunchContext) -> Optional['ProcessJournal']:
+    """Return the process journal of the launch service of the given context, if any."""
+    # Contexts which are not a LaunchContext, e.g. test doubles, have no journal.
+    return getattr(context, '_process_journal', None)
+
+
+def get_process_start_time(pid: int) -> Optional[int]:
+    """
+    Return the start time of a process, in clock ticks since boot, or None if not running.
+
+    Together with the pid, the start time identifies a process, even if its
+    pid is reused later on.
+    This needs the `/proc` file system, i.e. Linux, and returns None otherwise.
+    """
+    try:
+        with open('/proc/{}/stat'.format(pid), 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # The name of the executable is in parentheses and may contain spaces, so skip it first.
+    fields = stat[stat.rindex(b')') + 2:].split()
+    # The start time is the 22nd field, and the state, the 3rd field, is the first one here.
+    return int(fields[22 - 3])
+
+
+def hash_process_command(
+    cmd: List[Text],
+    cwd: Optional[Text],
+    env: Optional[Mapping[Text, Text]]
+) -> Text:
+    """Return the SHA-256 hash of the command, working directory and environment of a process."""
+    return hashlib.sha256(json.dumps([
+        cmd, cwd, None if env is None else sorted(env.items()),
+    ]).encode()).hexdigest()
+
+
+class AdoptedProcess(asyncio.SubprocessTransport):
+    """
+    Process started by a previous launch service, which was adopted from a process journal.
+
+    The process is not a child of this process, so it is watched for exiting
+    through a pidfd, and its exit code is unknown, i.e. the return code is
+    None once it exited.
+    It is signalled through the pidfd as well, so that a pid which was
+    reused in the meantime is never signalled.
+    Its output is read from the files it writes it to, from where they end
+    when it is adopted, see :meth:`ProcessJournal.create_output_files`.
+    """
+
+    def __init__(
+        self,
+        pidfd: int,
+        pid: int,
+        output_files: Dict[int, Text],
+        loop: asyncio.AbstractEventLoop,
+        protocol: asyncio.SubprocessProtocol
+    ) -> None:
+        """Constructor."""
+        self.__pidfd = pidfd
+        self.__pid = pid
+        self.__loop = loop
+        self.__protocol = protocol
+        self.__closed = False
+        self.__output_files_reader = _OutputFilesReader(
+            loop, output_files, protocol.pipe_data_received, protocol.pipe_connection_lost,
+            from_end=True)
+        protocol.connection_made(self)
+        # The pidfd becomes readable once the process exits.
+        loop.add_reader(pidfd, self.__on_exited)
+
+    def __on_exited(self) -> None:
+        self.__loop.remove_reader(self.__pidfd)
+        os.close(self.__pidfd)
+        self.__pidfd = -1
+        self.__output_files_reader.close()
+        self.__protocol.process_exited()
+        self.__protocol.connection_lost(None)
+
+    def get_pid(self) -> int:
+        """Return the pid of the process."""
+        return self.__pid
+
+    def get_returncode(self) -> Optional[int]:
+        """Return None, as the exit code of the process is unknown."""
+        return None
+
+    def get_pipe_transport(self, fd: int) -> Optional[asyncio.BaseTransport]:
+        """Return None, as the process has no pipes."""
+        return None
+
+    def send_signal(self, signal_number: int) -> None:
+        """Send a signal to the process, unless it exited already."""
+        if self.__pidfd == -1:
+            return
+        try:
+            signal.pidfd_send_signal(self.__pidfd, signal_number)
+        except ProcessLookupError:
+            # The process exited, but that wasn't handled yet.
+            pass
+
+    def terminate(self) -> None:
+        """Send SIGTERM to the process, unless it exited already."""
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        """Send SIGKILL to the process, unless it exited already."""
+        self.send_signal(signal.SIGKILL)
+
+    def is_closing(self) -> bool:
+        """Return True if the transport is closed."""
+        return self.__closed
+
+    def close(self) -> None:
+        """Kill the process, unless it exited already."""
+        if self.__closed:
+            return
+        self.__closed = True
+        self.kill()
+
+
+class ProcessJournal:
+    """
+    Crash safe journal of the processes started by a launch service.
+
+    The journal is an append-only file of JSON lines, with a line for each
+    process which is started, with its pid, its start time, see
+    :func:`get_process_start_time`, the hash of its command, see
+    :func:`hash_process_command`, and the name of its action, and a line for
+    each process which exits.
+    The lines are written right away, and the file is synced at most every
+    `sync_period` seconds, rather than for each line, when written from a
+    running asyncio loop.
+
+    When the journal is opened, the processes which were started but didn't
+    exit, e.g. because the launch service which started them was killed,
+    and which are still running, are its orphans.
+    :class:`launch.actions.ExecuteProcess` adopts an orphan with the same
+    action name and command, if any, see :meth:`adopt`, instead of starting
+    the process again, which needs pidfd support, i.e. Linux 5.3 and Python
+    3.9 or later.
+    The journal is then rewritten with only the orphans, so it stays small.
+    Orphans which are not adopted are left running, and reported when the
+    launch service finishes, see :meth:`report_orphans`.
+
+    Pipes do not outlive the launch service which reads from them, and
+    processes writing to a pipe nobody reads from anymore get SIGPIPE, so
+    journaled processes write their output to files instead, see
+    :meth:`create_output_files`, which are read until the process exits,
+    by the launch service which started it, then by the one which adopted it.
+    The files grow for as long as the process runs, as it may be writing to
+    them at any time.
+    """
+
+    def __init__(self, path: Text, *, sync_period: float = 0.1) -> None:
+        """
+        Constructor.
+
+        :param: path the path of the journal, which is created if it does not exist
+        :param: sync_period the maximum time, in seconds, a line is not synced to disk
+        """
+        self.__path = path
+        self.__sync_period = sync_period
+        self.__sync_handle = None  # type: Optional[asyncio.Handle]
+        self.__running = {}  # type: Dict[int, Dict[Text, Any]]
+        self.__orphans = self.__read()
+        self.__compact()
+        # Opened on the first write, so that the journal can be written again once closed.
+        self.__fd = -1
+        if self.__orphans:
+            _logger.info('found {} running processes of a previous launch in {}'.format(
+                len(self.__orphans), path))
+
+    @property
+    def path(self) -> Text:
+        """Getter for path."""
+        return self.__path
+
+    @property
+    def orphans(self) -> List[Dict[Text, Any]]:
+        """Getter for orphans, the running processes of previous launches not adopted yet."""
+        return self.__orphans
+
+    def report_orphans(self) -> None:
+        """Log a warning for each orphan which was not adopted, if it is still running."""
+        for orphan in self.__orphans:
+            if get_process_start_time(orphan['pid']) != orphan['start_time']:
+                continue
+            _logger.warning(
+                "process '{}' [pid {}] of a previous launch was not adopted and is still "
+                "running, it is kept in the process journal '{}'".format(
+                    orphan['name'], orphan['pid'], self.__path))
+
+    def __read(self) -> List[Dict[Text, Any]]:
+        started = {}  # type: Dict[Any, Dict[Text, Any]]
+        try:
+            with open(self.__path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line.decode())
+                    except ValueError:
+                        # The last line may be incomplete, if the launch service was killed.
+                        continue
+                    key = (entry['pid'], entry['start_time'])
+                    if entry['event'] == 'started':
+                        started[key] = entry
+                    else:
+                        started.pop(key, None)
+        except OSError:
+            return []
+        orphans = []
+        for (pid, start_time), entry in started.items():
+            if start_time is not None and get_process_start_time(pid) == start_time:
+                orphans.append(entry)
+                continue
+            # Nobody removed the output files of the process when it exited.
+            for path in entry.get('output_files', {}).values():
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+        return orphans
+
+    def __compact(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode='w', dir=directory, prefix='.launch_journal_', delete=False
+        ) as h:
+            for entry in self.__orphans:
+                h.write(json.dumps(entry) + '\n')
+            h.flush()
+            os.fsync(h.fileno())
+        os.replace(h.name, self.__path)
+
+    def __append(self, entry: Dict[Text, Any]) -> None:
+        if self.__fd == -1:
+            self.__fd = os.open(self.__path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(self.__fd, (json.dumps(entry) + '\n').encode())
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not loop.is_running():
+            self.sync()
+        elif self.__sync_handle is None:
+            self.__sync_handle = loop.call_later(self.__sync_period, self.sync)
+
+    def sync(self) -> None:
+        """Sync the lines written so far to disk."""
+        if self.__sync_handle is not None:
+            self.__sync_handle.cancel()
+            self.__sync_handle = None
+        if self.__fd != -1:
+            os.fsync(self.__fd)
+
+    def close(self) -> None:
+        """Sync and close the journal, which is opened again if written to."""
+        self.sync()
+        if self.__fd != -1:
+            os.close(self.__fd)
+            self.__fd = -1
+
+    def create_output_files(self, *, name: Text, stderr_to_stdout: bool) -> Dict[int, Text]:
+        """
+        Create the files a process with the given action name writes its output to.
+
+        The files are created in the directory named after the journal with
+        an '.output' suffix, for stdout, with the key 1, and stderr, with the
+        key 2, unless it is written to stdout, and are meant to be passed to
+        :func:`launch.utilities.async_execute_process_with_pidfd`, then to
+        :meth:`record_started`.
+
+        :returns: the paths of the files, by the fd they replace
+        """
+        directory = self.__path + '.output'
+        os.makedirs(directory, exist_ok=True)
+        prefix = '{}-'.format(name.replace(os.sep, '_'))
+        output_files = {}
+        for fd, suffix in ((1, '.stdout'), (2, '.stderr')):
+            if fd == 2 and stderr_to_stdout:
+                continue
+            file_fd, output_files[fd] = tempfile.mkstemp(
+                suffix=suffix, prefix=prefix, dir=directory)
+            os.close(file_fd)
+        return output_files
+
+    def record_started(
+        self,
+        *,
+        name: Text,
+        pid: int,
+        cmd_hash: Text,
+        output_files: Optional[Dict[int, Text]] = None
+    ) -> None:
+        """Record that a process was started, along with the files it writes its output to."""
+        entry = {
+            'event': 'started',
+            'pid': pid,
+            'start_time': get_process_start_time(pid),
+            'cmd_hash': cmd_hash,
+            'name': name,
+            # JSON objects only have string keys.
+            'output_files': {str(fd): path for fd, path in (output_files or {}).items()},
+        }
+        self.__running[pid] = entry
+        self.__append(entry)
+
+    def record_exited(self, *, pid: int) -> None:
+        """Record that a process, which was recorded as started or adopted, exited."""
+        entry = self.__running.pop(pid, None)
+        if entry is not None:
+            self.__append({'event': 'exited', 'pid': pid, 'start_time': entry['start_time']})
+
+    def adopt(
+        self,
+        *,
+        name: Text,
+        cmd_hash: Text,
+        protocol_factory: Callable[[], asyncio.SubprocessProtocol],
+        loop: asyncio.AbstractEventLoop
+    ) -> Optional[Tuple[AdoptedProcess, asyncio.SubprocessProtocol]]:
+        """
+        Adopt the first orphan with the given action name and command hash, if any.
+
+        The adopted process is recorded as running, so its exit must be
+        recorded with :meth:`record_exited`.
+        Its output and exit are passed to a protocol created with the given
+        factory, like for :func:`launch.utilities.async_execute_process_with_pidfd`.
+
+        :returns: the adopted process and its protocol, or None if there is
+            no such orphan or adopting is not supported
+        """
+        if not hasattr(os, 'pidfd_open'):
+            return None
+        for orphan in self.__orphans:
+            if orphan['name'] != name or orphan['cmd_hash'] != cmd_hash:
+                continue
+            try:
+                pidfd = os.pidfd_open(orphan['pid'])
+            except OSError:
+                continue
+            # Check that the pid was not reused after opening the pidfd, which pins it.
+            if get_process_start_time(orphan['pid']) != orphan['start_time']:
+                os.close(pidfd)
+                continue
+            self.__orphans.remove(orphan)
+            self.__running[orphan['pid']] = orphan
+            # The output of the process is not read if its files were removed.
+            output_files = {
+                int(fd): path for fd, path in orphan.get('output_files', {}).items()
+                if os.path.exists(path)
+            }
+            protocol = protocol_factory()
+            return AdoptedProcess(pidfd, orphan['pid'], output_files, loop, protocol), protocol
+        return None
@@ -44,3 +44,19 @@ class Substitution:
         :raises: NotImplementedError
         """
         raise NotImplementedError('perform() not implemented for Substitution base class.')
+
+    async def perform_async(self, context: 'LaunchContext') -> Text:
+        """
+        Perform the substitution asynchronously, and return it as a string.
+
+        This allows substitutions which need to do I/O, e.g. look something up
+        on the filesystem, to do so without blocking the asyncio loop, so that
+        many of them can be performed concurrently.
+
+        The default falls back to calling :meth:`perform` synchronously, so
+        derived classes only need to override it if they would block.
+        Blocking work can be moved off of the loop with the `run_in_executor()`
+        method of `context.asyncio_loop`, but anything that reads the context
+        should be done in the loop's thread, i.e. before handing off the work.
+        """
+        return self.perform(context)
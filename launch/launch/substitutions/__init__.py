@@ -14,16 +14,22 @@
 
 """Package for substitutions."""
 
-from .environment_variable import EnvironmentVariable
-from .find_executable import FindExecutable
-from .launch_configuration import LaunchConfiguration
-from .local_substitution import LocalSubstitution
-from .python_expression import PythonExpression
-from .substitution_failure import SubstitutionFailure
-from .text_substitution import TextSubstitution
-from .this_launch_file_dir import ThisLaunchFileDir
+from ..utilities import install_lazy_imports
+
+_module_names = {
+    'Command': 'command',
+    'EnvironmentVariable': 'environment_variable',
+    'FindExecutable': 'find_executable',
+    'LaunchConfiguration': 'launch_configuration',
+    'LocalSubstitution': 'local_substitution',
+    'PythonExpression': 'python_expression',
+    'SubstitutionFailure': 'substitution_failure',
+    'TextSubstitution': 'text_substitution',
+    'ThisLaunchFileDir': 'this_launch_file_dir',
+}
 
 __all__ = [
+    'Command',
     'EnvironmentVariable',
     'FindExecutable',
     'LaunchConfiguration',
@@ -33,3 +39,6 @@ __all__ = [
     'TextSubstitution',
     'ThisLaunchFileDir',
 ]
+
+
+install_lazy_imports(globals(), _module_names)
@@ -0,0 +1,267 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the Command substitution."""
+
+import asyncio
+import hashlib
+import json
+import os
+import shlex
+import subprocess
+import tempfile
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+from .substitution_failure import SubstitutionFailure
+from ..launch_context import LaunchContext
+from ..launch_plan import get_launch_plan
+from ..some_substitutions_type import SomeSubstitutionsType
+from ..substitution import Substitution
+
+
+def get_default_cache_directory() -> Text:
+    """Return the directory in which the persistent cache of the Command substitution is kept."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'launch', 'command')
+
+
+def _hash_file(path: Text) -> Text:
+    sha = hashlib.sha256()
+    with open(path, 'rb') as h:
+        for chunk in iter(lambda: h.read(1 << 16), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _run_command(
+    command: Text,
+    cwd: Optional[Text],
+    env: Optional[Tuple[Tuple[Text, Text], ...]],
+    inputs: Optional[Tuple[Text, ...]],
+    *,
+    timeout: Optional[float],
+    cache_directory: Text
+) -> Text:
+    """Run the command and return its output, using the persistent cache if there are inputs."""
+    cache_file = None
+    if inputs is not None:
+        key = json.dumps([command, cwd, env, [(path, _hash_file(path)) for path in inputs]])
+        cache_file = os.path.join(
+            cache_directory, hashlib.sha256(key.encode()).hexdigest() + '.out')
+        try:
+            with open(cache_file, 'r') as h:
+                return h.read()
+        except FileNotFoundError:
+            pass
+    try:
+        result = subprocess.run(
+            shlex.split(command),
+            cwd=cwd,
+            env=None if env is None else dict(env),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+            universal_newlines=True,
+        )
+    except subprocess.TimeoutExpired:
+        raise SubstitutionFailure(
+            "command '{}' timed out after '{}' seconds".format(command, timeout))
+    except OSError as exc:
+        raise SubstitutionFailure("command '{}' failed to run: {}".format(command, exc))
+    if result.returncode != 0:
+        raise SubstitutionFailure("command '{}' failed with exit code '{}': {}".format(
+            command, result.returncode, result.stderr))
+    if cache_file is not None:
+        # Write to a temporary file first, so that a partially written cache file is never read.
+        os.makedirs(cache_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode='w', dir=cache_directory, prefix='.command_', delete=False
+        ) as h:
+            h.write(result.stdout)
+        os.replace(h.name, cache_file)
+    return result.stdout
+
+
+class Command(Substitution):
+    """
+    Substitution that runs a command and gets its output (stdout) as a string.
+
+    The command is split into arguments with :func:`shlex.split` and it is not
+    run in a shell.
+    If the command exits with a non-zero exit code, or if it does not finish
+    before the timeout (if given), an error is raised.
+
+    The output is memoized for the duration of the launch, so the same
+    command, with the same working directory and environment, is only run
+    once, no matter how many times the substitution is used.
+    When performed asynchronously, the command is run in the loop's executor.
+
+    Additionally, if `cache_inputs` is given, the output is cached on disk
+    across launches, keyed by the command, the working directory, the
+    environment and the contents of the given input files.
+    Only use this for commands whose output depends on nothing else, e.g. the
+    generation of a robot description from a xacro file.
+
+    :raise: SubstitutionFailure when the command fails or times out
+    """
+
+    def __init__(
+        self,
+        command: SomeSubstitutionsType,
+        *,
+        cwd: Optional[SomeSubstitutionsType] = None,
+        env: Optional[Dict[SomeSubstitutionsType, SomeSubstitutionsType]] = None,
+        timeout: Optional[float] = None,
+        cache_inputs: Optional[Iterable[SomeSubstitutionsType]] = None,
+        cache_directory: Optional[Text] = None
+    ) -> None:
+        """
+        Constructor.
+
+        :param: command the command to run, e.g. 'xacro /path/to/robot.urdf.xacro'
+        :param: cwd the directory in which to run the command
+        :param: env dictionary of environment variables to be used, or None to
+            use the environment of the launch process
+        :param: timeout time in seconds after which the command is considered
+            to have failed, or None to wait for it indefinitely
+        :param: cache_inputs paths to the files on which the output of the
+            command depends, which enables the persistent cache if not None
+        :param: cache_directory where the persistent cache is kept, defaults
+            to :func:`get_default_cache_directory`
+        """
+        super().__init__()
+
+        from ..utilities import normalize_to_list_of_substitutions  # import here to avoid loop
+        self.__command = normalize_to_list_of_substitutions(command)
+        self.__cwd = cwd if cwd is None else normalize_to_list_of_substitutions(cwd)
+        self.__env = None  # type: Optional[List[Tuple[List[Substitution], List[Substitution]]]]
+        if env is not None:
+            self.__env = []
+            for key, value in env.items():
+                self.__env.append((
+                    normalize_to_list_of_substitutions(key),
+                    normalize_to_list_of_substitutions(value)))
+        self.__timeout = timeout
+        self.__cache_inputs = None  # type: Optional[List[List[Substitution]]]
+        if cache_inputs is not None:
+            self.__cache_inputs = [normalize_to_list_of_substitutions(x) for x in cache_inputs]
+        self.__cache_directory = \
+            cache_directory if cache_directory is not None else get_default_cache_directory()
+
+    @property
+    def command(self) -> List[Substitution]:
+        """Getter for command."""
+        return self.__command
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """Getter for timeout."""
+        return self.__timeout
+
+    def describe(self) -> Text:
+        """Return a description of this substitution as a string."""
+        return 'Command({})'.format(' + '.join([sub.describe() for sub in self.command]))
+
+    def __get_key(self, expanded):
+        command, cwd, env_keys, env_values, inputs = expanded
+        env = None if self.__env is None else tuple(sorted(zip(env_keys, env_values)))
+        inputs = None if self.__cache_inputs is None else tuple(inputs)
+        return (type(self), command, cwd, env, inputs)
+
+    def __record_plan_inputs(self, context, key):
+        launch_plan = get_launch_plan(context)
+        if launch_plan is None:
+            return
+        inputs = key[-1]
+        if inputs is None:
+            # The output may depend on anything, so it can't be replayed.
+            launch_plan.add_uncacheable_reason(
+                '{} has no cache inputs'.format(self.describe()))
+            return
+        for path in inputs:
+            launch_plan.add_input(path)
+
+    def __run(self, key):
+        _, command, cwd, env, inputs = key
+        return _run_command(
+            command, cwd, env, inputs,
+            timeout=self.__timeout, cache_directory=self.__cache_directory)
+
+    def perform(self, context: LaunchContext) -> Text:
+        """Perform the substitution by running the command, unless it has already been run."""
+        from ..utilities import perform_substitutions  # import here to avoid loop
+
+        def perform_if_not_none(subs):
+            return None if subs is None else perform_substitutions(context, subs)
+
+        env_items = [] if self.__env is None else self.__env
+        key = self.__get_key((
+            perform_substitutions(context, self.__command),
+            perform_if_not_none(self.__cwd),
+            [perform_substitutions(context, k) for k, _ in env_items],
+            [perform_substitutions(context, v) for _, v in env_items],
+            [perform_substitutions(context, x) for x in self.__cache_inputs or []],
+        ))
+        self.__record_plan_inputs(context, key)
+        result = context._substitution_cache.get(key)
+        if not isinstance(result, str):
+            # Either not run yet, or still running asynchronously, which can't be waited on here.
+            result = self.__run(key)
+            context._substitution_cache[key] = result
+        return result
+
+    async def perform_async(self, context: LaunchContext) -> Text:
+        """Perform the substitution by running the command in the loop's executor."""
+        from ..utilities import perform_substitutions_async  # import here to avoid loop
+
+        async def perform_if_not_none(subs):
+            return None if subs is None else await perform_substitutions_async(context, subs)
+
+        env_items = [] if self.__env is None else self.__env
+        key = self.__get_key(await asyncio.gather(
+            perform_substitutions_async(context, self.__command),
+            perform_if_not_none(self.__cwd),
+            asyncio.gather(*[perform_substitutions_async(context, k) for k, _ in env_items]),
+            asyncio.gather(*[perform_substitutions_async(context, v) for _, v in env_items]),
+            asyncio.gather(*[
+                perform_substitutions_async(context, x) for x in self.__cache_inputs or []
+            ]),
+        ))
+        self.__record_plan_inputs(context, key)
+        cache = context._substitution_cache
+        result = cache.get(key)
+        if isinstance(result, str):
+            return result
+        if result is None:
+            # Share the future, so that concurrent uses of the same command only run it once.
+            result = context.asyncio_loop.run_in_executor(None, self.__run, key)
+            cache[key] = result
+
+            def on_done(future):
+                if cache.get(key) is not future:
+                    return
+                if future.cancelled() or future.exception() is not None:
+                    # Failures are not memoized, so that the command is retried if used again.
+                    del cache[key]
+                else:
+                    cache[key] = future.result()
+            result.add_done_callback(on_done)
+        # Shield the shared future, so that one of the users being canceled doesn't cancel it.
+        return await asyncio.shield(result)
@@ -55,3 +55,12 @@ class FindExecutable(Substitution):
         if result is None:
             raise SubstitutionFailure("executable '{}' not found on the PATH".format(self.name))
         return result
+
+    async def perform_async(self, context: LaunchContext) -> Text:
+        """Perform the substitution, searching the PATH in the loop's executor."""
+        from ..utilities import perform_substitutions_async  # import here to avoid loop
+        name = await perform_substitutions_async(context, self.name)
+        result = await context.asyncio_loop.run_in_executor(None, which, name)
+        if result is None:
+            raise SubstitutionFailure("executable '{}' not found on the PATH".format(self.name))
+        return result
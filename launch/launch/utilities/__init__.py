@@ -14,16 +14,33 @@
 
 """Package for utilties."""
 
-from .class_tools_impl import is_a, is_a_subclass, isclassinstance
-from .create_future_impl import create_future
-from .ensure_argument_type_impl import ensure_argument_type
-from .normalize_to_list_of_substitutions_impl import normalize_to_list_of_substitutions
-from .perform_substitutions_impl import perform_substitutions
-from .signal_management import install_signal_handlers
-from .signal_management import on_sigint
-from .signal_management import on_sigquit
-from .signal_management import on_sigterm
-from .visit_all_entities_and_collect_futures_impl import visit_all_entities_and_collect_futures
+from .lazy_import_impl import install_lazy_imports
+
+_module_names = {
+    'is_a': 'class_tools_impl',
+    'is_a_subclass': 'class_tools_impl',
+    'isclassinstance': 'class_tools_impl',
+    'create_future': 'create_future_impl',
+    'ensure_argument_type': 'ensure_argument_type_impl',
+    'install_lazy_imports': 'lazy_import_impl',
+    'LogRecord': 'log_record_impl',
+    'parse_log_records': 'log_record_impl',
+    'normalize_to_list_of_substitutions': 'normalize_to_list_of_substitutions_impl',
+    'OutputFilter': 'output_filter_impl',
+    'perform_substitutions': 'perform_substitutions_impl',
+    'perform_substitutions_async': 'perform_substitutions_impl',
+    'async_execute_process_with_pidfd': 'pidfd_subprocess_impl',
+    'is_pidfd_supported': 'pidfd_subprocess_impl',
+    'RingBuffer': 'ring_buffer_impl',
+    'read_log_index': 'rotating_log_file_impl',
+    'RotatingLogFile': 'rotating_log_file_impl',
+    'install_signal_handlers': 'signal_management',
+    'on_sigint': 'signal_management',
+    'on_sigquit': 'signal_management',
+    'on_sigterm': 'signal_management',
+    'visit_all_entities_and_collect_futures': 'visit_all_entities_and_collect_futures_impl',
+    'visit_all_entities_and_iterate_futures': 'visit_all_entities_and_collect_futures_impl',
+}
 
 __all__ = [
     'is_a',
@@ -31,11 +48,25 @@ __all__ = [
     'isclassinstance',
     'create_future',
     'ensure_argument_type',
+    'install_lazy_imports',
     'perform_substitutions',
+    'perform_substitutions_async',
+    'RingBuffer',
+    'read_log_index',
+    'RotatingLogFile',
     'install_signal_handlers',
     'on_sigint',
     'on_sigquit',
     'on_sigterm',
+    'LogRecord',
+    'parse_log_records',
     'normalize_to_list_of_substitutions',
+    'OutputFilter',
+    'async_execute_process_with_pidfd',
+    'is_pidfd_supported',
     'visit_all_entities_and_collect_futures',
+    'visit_all_entities_and_iterate_futures',
 ]
+
+
+install_lazy_imports(globals(), _module_names)
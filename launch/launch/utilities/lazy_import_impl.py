@@ -0,0 +1,60 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for the install_lazy_imports() function."""
+
+import importlib
+import sys
+from typing import Any
+from typing import Dict
+from typing import Text
+
+
+def install_lazy_imports(module_globals: Dict[Text, Any], module_names: Dict[Text, Text]) -> None:
+    """
+    Make the members of a package importable lazily, on first use, see PEP 562.
+
+    This defines `__getattr__()` and `__dir__()` in the package, which is
+    meant to be called from its `__init__` module with its globals.
+    Each member is imported, from the module it is mapped to, the first time
+    it is accessed, and then stored in the package globals.
+    Modules which are mapped to themselves are imported as is.
+    Without support for a module level `__getattr__()`, i.e. before Python
+    3.7, every member in the `__all__` of the package is imported eagerly.
+
+    :param module_globals: the globals of the package, with `__name__` and `__all__` set
+    :param module_names: the name of the module which defines each member,
+        relative to the package
+    """
+    package_name = module_globals['__name__']
+
+    def __getattr__(name):
+        try:
+            module_name = module_names[name]
+        except KeyError:
+            raise AttributeError("module '{}' has no attribute '{}'".format(package_name, name))
+        module = importlib.import_module('.' + module_name, package_name)
+        value = module if module_name == name else getattr(module, name)
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(module_globals['__all__']))
+
+    module_globals['__getattr__'] = __getattr__
+    module_globals['__dir__'] = __dir__
+    if sys.version_info < (3, 7):
+        for name in module_globals['__all__']:
+            __getattr__(name)
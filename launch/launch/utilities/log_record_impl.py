@@ -0,0 +1,130 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for the LogRecord class."""
+
+import re
+from typing import List
+from typing import Optional
+from typing import Text
+
+# The default format of rcutils, i.e. '[{severity}] [{time}] [{name}]: {message}',
+# possibly colorized, or any other line, which is matched as a message only.
+_LOG_LINE = re.compile(
+    rb'(?:(?:\x1b\[[0-9;]*m)?\[(DEBUG|INFO|WARN|ERROR|FATAL)\] '
+    rb'\[(\d+(?:\.\d*)?)\] \[([^\]\n]*)\]: )?([^\n]*?)(?:\x1b\[0m)?\n'
+)
+
+
+class LogRecord:
+    """A line of output of a process, with the time it was received and its parsed fields."""
+
+    # The levels of the severities, which are the same as the levels of the logging module.
+    LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARN': 30, 'ERROR': 40, 'FATAL': 50}
+
+    def __init__(
+        self,
+        *,
+        line: bytes,
+        received_time: float,
+        severity: Optional[Text] = None,
+        stamp: Optional[float] = None,
+        logger: Optional[Text] = None,
+        message: bytes
+    ) -> None:
+        """
+        Constructor.
+
+        :param: line the line, without its newline
+        :param: received_time the monotonic time the line was received at
+        :param: severity the severity of the line, e.g. 'INFO', if it was parsed
+        :param: stamp the time stamp of the line, in seconds, if it was parsed
+        :param: logger the name of the logger of the line, if it was parsed
+        :param: message the message of the line, or the whole line if it wasn't parsed
+        """
+        self.__line = line
+        self.__received_time = received_time
+        self.__severity = severity
+        self.__stamp = stamp
+        self.__logger = logger
+        self.__message = message
+
+    @property
+    def line(self) -> bytes:
+        """Getter for line."""
+        return self.__line
+
+    @property
+    def received_time(self) -> float:
+        """Getter for received_time."""
+        return self.__received_time
+
+    @property
+    def severity(self) -> Optional[Text]:
+        """Getter for severity."""
+        return self.__severity
+
+    @property
+    def level(self) -> Optional[int]:
+        """Getter for the level of the severity, see :attr:`LEVELS`, or None."""
+        return None if self.__severity is None else self.LEVELS[self.__severity]
+
+    @property
+    def stamp(self) -> Optional[float]:
+        """Getter for stamp."""
+        return self.__stamp
+
+    @property
+    def logger(self) -> Optional[Text]:
+        """Getter for logger."""
+        return self.__logger
+
+    @property
+    def message(self) -> bytes:
+        """Getter for message."""
+        return self.__message
+
+    def __repr__(self) -> Text:
+        """Return a string representation of the record."""
+        return 'LogRecord(severity={!r}, logger={!r}, message={!r})'.format(
+            self.__severity, self.__logger, self.__message)
+
+
+def parse_log_records(data: bytes, received_time: float) -> List[LogRecord]:
+    """
+    Return the records of the complete lines of output of a process.
+
+    The lines in the default console output format of rcutils are parsed
+    into their fields, in a single pass over the data.
+    An incomplete last line is parsed as if it was complete, so the data
+    should be split in lines first, e.g. by a :class:`launch.utilities.OutputFilter`.
+
+    :param: data the output
+    :param: received_time the monotonic time the output was received at
+    """
+    if data and not data.endswith(b'\n'):
+        data += b'\n'
+    records = []
+    for match in _LOG_LINE.finditer(data):
+        severity, stamp, logger, message = match.groups()
+        records.append(LogRecord(
+            line=match.group(0)[:-1],
+            received_time=received_time,
+            severity=None if severity is None else severity.decode(),
+            stamp=None if stamp is None else float(stamp),
+            logger=None if logger is None else logger.decode(errors='replace'),
+            message=message,
+        ))
+    return records
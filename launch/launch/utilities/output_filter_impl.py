@@ -0,0 +1,168 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the OutputFilter class."""
+
+import re
+import time
+from typing import Callable
+from typing import Iterable
+from typing import List  # noqa: F401
+from typing import Optional
+from typing import Pattern  # noqa: F401
+from typing import Text
+import warnings
+
+
+# Inline flags at the start of a pattern, which apply to the whole pattern.
+_GLOBAL_FLAGS = re.compile(rb'\(\?([aiLmsux]+)\)')
+
+
+def _scope_pattern(pattern: Text) -> bytes:
+    """Return the pattern as a group, with its global inline flags, if any, scoped to it."""
+    encoded = pattern.encode()
+    try:
+        with warnings.catch_warnings():
+            # Global inline flags anywhere else are deprecated, and an error as of Python 3.11.
+            warnings.simplefilter('error', DeprecationWarning)
+            re.compile(encoded)
+    except (re.error, DeprecationWarning) as exc:
+        raise ValueError("invalid regular expression '{}': {}".format(pattern, exc))
+    flags = b''
+    start = 0
+    match = _GLOBAL_FLAGS.match(encoded)
+    while match is not None:
+        flags += match.group(1)
+        start = match.end()
+        match = _GLOBAL_FLAGS.match(encoded, start)
+    return b'(?' + flags + b':' + encoded[start:] + b')'
+
+
+def _compile_alternation(patterns: Iterable[Text]) -> Optional[Pattern]:
+    # A single regular expression is much faster than trying each of the patterns in turn.
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile(b'|'.join(_scope_pattern(pattern) for pattern in patterns))
+
+
+class OutputFilter:
+    """
+    Line based filter and rate limiter of the output of a process, on a stream of bytes.
+
+    Each line is kept if it matches any of the `keep` regular expressions,
+    if any are given, and does not match any of the `drop` regular
+    expressions, which are searched for anywhere in the line, as bytes.
+    The regular expressions are combined into one, so the numbers of their
+    groups are not kept, e.g. `\\1` may refer to a group of another
+    regular expression, and the names of their groups must be unique.
+
+    If a rate limit is given, kept lines are passed on at no more than that
+    many lines per second, with bursts of up to a second worth of lines,
+    and the lines over the limit are dropped.
+    The number of lines dropped that way is reported, with a line like
+    `[output rate limit: 42 lines suppressed]`, before the next line which is
+    passed on, or when the filter is flushed.
+
+    Incomplete lines are held back until they are completed, or until the
+    filter is flushed, e.g. when the stream is closed.
+    """
+
+    def __init__(
+        self,
+        *,
+        keep: Iterable[Text] = (),
+        drop: Iterable[Text] = (),
+        rate_limit: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Constructor.
+
+        :param: keep regular expressions of the lines to keep, all lines are
+            kept if none are given
+        :param: drop regular expressions of the lines to drop
+        :raises: ValueError if a regular expression is invalid, or has inline
+            flags other than at its start, e.g. `(?i)`, which only apply to it
+        :param: rate_limit maximum number of lines per second, or None
+        :param: clock the clock to measure the rate of lines with
+        """
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit is '{}', expected a positive number".format(rate_limit))
+        self.__keep = _compile_alternation(keep)
+        self.__drop = _compile_alternation(drop)
+        self.__rate_limit = rate_limit
+        self.__clock = clock
+        self.__partial_line = b''
+        self.__tokens = rate_limit
+        self.__last_time = None  # type: Optional[float]
+        self.__suppressed = 0
+
+    @property
+    def suppressed(self) -> int:
+        """Getter for suppressed, the number of rate limited lines not reported yet."""
+        return self.__suppressed
+
+    def __is_kept(self, line: bytes) -> bool:
+        if self.__keep is not None and self.__keep.search(line) is None:
+            return False
+        return self.__drop is None or self.__drop.search(line) is None
+
+    def __take_token(self) -> bool:
+        now = self.__clock()
+        if self.__last_time is not None:
+            self.__tokens = min(
+                self.__rate_limit, self.__tokens + (now - self.__last_time) * self.__rate_limit)
+        self.__last_time = now
+        if self.__tokens < 1:
+            return False
+        self.__tokens -= 1
+        return True
+
+    def __get_summary(self) -> bytes:
+        summary = '[output rate limit: {} lines suppressed]\n'.format(self.__suppressed).encode()
+        self.__suppressed = 0
+        return summary
+
+    def __filter_lines(self, lines: List[bytes]) -> bytes:
+        output = []  # type: List[bytes]
+        for line in lines:
+            if not self.__is_kept(line):
+                continue
+            if self.__rate_limit is not None:
+                if not self.__take_token():
+                    self.__suppressed += 1
+                    continue
+                if self.__suppressed:
+                    output.append(self.__get_summary())
+            output.append(line)
+        return b''.join(output)
+
+    def filter(self, data: bytes) -> bytes:
+        """Return the complete lines of the given data, and of the data before, which pass."""
+        data = self.__partial_line + data
+        end = data.rfind(b'\n') + 1
+        self.__partial_line = data[end:]
+        if not end:
+            return b''
+        return self.__filter_lines([line + b'\n' for line in data[:end - 1].split(b'\n')])
+
+    def flush(self) -> bytes:
+        """Return the incomplete line held back, if it passes, and the unreported summary."""
+        lines = [self.__partial_line] if self.__partial_line else []
+        self.__partial_line = b''
+        output = self.__filter_lines(lines)
+        if self.__suppressed:
+            output += self.__get_summary()
+        return output
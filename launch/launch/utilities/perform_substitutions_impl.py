@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Module for the perform_substitutions() utility function."""
+"""Module for the perform_substitutions() utility functions."""
 
+import asyncio
 from typing import List
 from typing import Text
 
@@ -24,3 +25,14 @@ from ..substitution import Substitution
 def perform_substitutions(context: LaunchContext, subs: List[Substitution]) -> Text:
     """Resolve a list of Substitutions with a context into a single string."""
     return ''.join([context.perform_substitution(sub) for sub in subs])
+
+
+async def perform_substitutions_async(context: LaunchContext, subs: List[Substitution]) -> Text:
+    """
+    Resolve a list of Substitutions with a context into a single string, asynchronously.
+
+    All of the substitutions are performed concurrently.
+    """
+    return ''.join(await asyncio.gather(*[
+        context.perform_substitution_async(sub) for sub in subs
+    ]))
@@ -0,0 +1,357 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for the pidfd based process backend."""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+from osrf_pycommon.process_utils import async_execute_process
+
+_pidfd_supported = None  # type: Optional[bool]
+
+_PIPES_CLOSE_TIMEOUT = 0.1
+
+_OUTPUT_FILES_POLL_PERIOD = 0.05
+
+
+def _get_new_process_group_kwargs() -> Dict[Text, Any]:
+    # Popen only takes a process group as of Python 3.11, so start a new session before, which
+    # also starts a new process group, rather than calling setpgrp() in a preexec_fn, which
+    # isn't safe while other threads are running and is slower.
+    if sys.version_info >= (3, 11):
+        return {'process_group': 0}
+    return {'start_new_session': True}
+
+
+def is_pidfd_supported() -> bool:
+    """Return True if processes can be watched with a pidfd, i.e. on Linux 5.3 or later."""
+    global _pidfd_supported
+    if _pidfd_supported is None:
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+            _pidfd_supported = True
+        except (AttributeError, OSError):
+            _pidfd_supported = False
+    return _pidfd_supported
+
+
+class _PipeProtocol(asyncio.Protocol):
+
+    def __init__(self, transport: '_PidfdSubprocessTransport', fd: int) -> None:
+        self.__transport = transport
+        self.__fd = fd
+
+    def data_received(self, data: bytes) -> None:
+        self.__transport._pipe_data_received(self.__fd, data)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.__transport._pipe_connection_lost(self.__fd, exc)
+
+
+class _OutputFilesReader:
+    """
+    Reader of the output a process writes to files, rather than to pipes.
+
+    The files are polled every :data:`_OUTPUT_FILES_POLL_PERIOD` seconds,
+    and removed once closed, i.e. once the process exited, as the process
+    keeps appending to them for as long as it runs.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        output_files: Dict[int, Text],
+        data_received: Callable[[int, bytes], None],
+        connection_lost: Callable[[int, Optional[Exception]], None],
+        *,
+        from_end: bool = False
+    ) -> None:
+        """
+        Constructor.
+
+        :param: output_files the paths of the files, by the fd they replace
+        :param: from_end if True, only what is written from now on is read
+        """
+        self.__loop = loop
+        self.__output_files = dict(output_files)
+        self.__data_received = data_received
+        self.__connection_lost = connection_lost
+        self.__fds = {}  # type: Dict[int, int]
+        for fd, path in self.__output_files.items():
+            self.__fds[fd] = os.open(path, os.O_RDONLY)
+            if from_end:
+                os.lseek(self.__fds[fd], 0, os.SEEK_END)
+        self.__handle = loop.call_later(
+            _OUTPUT_FILES_POLL_PERIOD, self.__poll)  # type: Optional[asyncio.Handle]
+
+    def __poll(self) -> None:
+        self.__read()
+        self.__handle = self.__loop.call_later(_OUTPUT_FILES_POLL_PERIOD, self.__poll)
+
+    def __read(self) -> None:
+        for fd, file_fd in self.__fds.items():
+            while True:
+                data = os.read(file_fd, 65536)
+                if not data:
+                    break
+                self.__data_received(fd, data)
+
+    def close(self) -> None:
+        """Read what is left in the files, then close and remove them."""
+        if self.__handle is None:
+            return
+        self.__handle.cancel()
+        self.__handle = None
+        self.__read()
+        for fd, file_fd in self.__fds.items():
+            os.close(file_fd)
+            try:
+                os.unlink(self.__output_files[fd])
+            except FileNotFoundError:
+                pass
+            self.__connection_lost(fd, None)
+
+
+class _PidfdSubprocessTransport(asyncio.SubprocessTransport):
+    """
+    Transport of a process which is watched for exiting through a pidfd.
+
+    The protocol is notified that the process exited once it exited and all
+    of its pipes are closed, so that all of its output is received first,
+    but at most :data:`_PIPES_CLOSE_TIMEOUT` seconds after it exited, as
+    processes it started may keep its pipes open.
+    The output the process writes to files instead, if any, is read until
+    it exited.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        process: subprocess.Popen,
+        protocol: asyncio.SubprocessProtocol,
+        output_files: Optional[Dict[int, Text]] = None
+    ) -> None:
+        self.__loop = loop
+        self.__process = process
+        self.__protocol = protocol
+        self.__pipes = {}  # type: Dict[int, asyncio.BaseTransport]
+        # Counted upfront, as the process may exit while the pipes are being connected.
+        self.__open_read_pipes = sum(
+            pipe is not None for pipe in (process.stdout, process.stderr))
+        self.__output_files_reader = None  # type: Optional[_OutputFilesReader]
+        if output_files:
+            self.__open_read_pipes += len(output_files)
+            self.__output_files_reader = _OutputFilesReader(
+                loop, output_files, self._pipe_data_received, self._pipe_connection_lost)
+        self.__pending_calls = []  # type: Optional[List[Tuple[Callable, Tuple[Any, ...]]]]
+        self.__returncode = None  # type: Optional[int]
+        self.__exit_reported = False
+        self.__finished = False
+        self.__closed = False
+        self.__pidfd = os.pidfd_open(process.pid)
+        loop.add_reader(self.__pidfd, self.__on_pidfd_readable)
+
+    async def _connect_pipes(self) -> None:
+        pipes = [(0, self.__process.stdin), (1, self.__process.stdout), (2, self.__process.stderr)]
+        for fd, pipe in pipes:
+            if pipe is None:
+                continue
+            if fd == 0:
+                self.__pipes[fd], _ = await self.__loop.connect_write_pipe(
+                    lambda: _PipeProtocol(self, 0), pipe)
+            else:
+                self.__pipes[fd], _ = await self.__loop.connect_read_pipe(
+                    lambda fd=fd: _PipeProtocol(self, fd), pipe)
+        self.__protocol.connection_made(self)
+        # Pass on what was received while the pipes were being connected.
+        pending_calls = self.__pending_calls
+        self.__pending_calls = None
+        for callback, args in pending_calls:
+            callback(*args)
+
+    def __call(self, callback: Callable, *args: Any) -> None:
+        if self.__pending_calls is not None:
+            self.__pending_calls.append((callback, args))
+        else:
+            callback(*args)
+
+    def __on_pidfd_readable(self) -> None:
+        self.__loop.remove_reader(self.__pidfd)
+        os.close(self.__pidfd)
+        self.__pidfd = -1
+        try:
+            _, status = os.waitpid(self.__process.pid, 0)
+            self.__returncode = os.waitstatus_to_exitcode(status)
+        except ChildProcessError:
+            # Reaped by someone else, report it like asyncio does.
+            self.__returncode = 255
+        # Let Popen know, so that it does not try to wait for the process itself.
+        self.__process.returncode = self.__returncode
+        if self.__output_files_reader is not None:
+            # Unlike pipes, the files are never closed by the process, so stop reading them now.
+            self.__output_files_reader.close()
+        if self.__open_read_pipes == 0:
+            self.__report_exit()
+        else:
+            self.__loop.call_later(_PIPES_CLOSE_TIMEOUT, self.__report_exit)
+
+    def __report_exit(self) -> None:
+        if self.__exit_reported:
+            return
+        self.__exit_reported = True
+        if 0 in self.__pipes:
+            self.__pipes[0].close()
+        self.__call(self.__protocol.process_exited)
+        self.__try_finish()
+
+    def _pipe_data_received(self, fd: int, data: bytes) -> None:
+        self.__call(self.__protocol.pipe_data_received, fd, data)
+
+    def _pipe_connection_lost(self, fd: int, exc: Optional[Exception]) -> None:
+        if fd != 0:
+            self.__open_read_pipes -= 1
+        self.__call(self.__protocol.pipe_connection_lost, fd, exc)
+        if self.__returncode is not None and self.__open_read_pipes == 0:
+            self.__report_exit()
+        self.__try_finish()
+
+    def __try_finish(self) -> None:
+        if self.__finished or not self.__exit_reported or self.__open_read_pipes > 0:
+            return
+        self.__finished = True
+        self.__call(self.__protocol.connection_lost, None)
+
+    def get_pid(self) -> int:
+        """Return the pid of the process."""
+        return self.__process.pid
+
+    def get_returncode(self) -> Optional[int]:
+        """Return the return code of the process, or None if it did not exit yet."""
+        return self.__returncode
+
+    def get_pipe_transport(self, fd: int) -> Optional[asyncio.BaseTransport]:
+        """Return the transport of the given pipe of the process, if any."""
+        return self.__pipes.get(fd)
+
+    def send_signal(self, signal_number: int) -> None:
+        """Send a signal to the process, through its pidfd, unless it exited already."""
+        if self.__pidfd == -1:
+            raise ProcessLookupError()
+        signal.pidfd_send_signal(self.__pidfd, signal_number)
+
+    def terminate(self) -> None:
+        """Send SIGTERM to the process."""
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        """Send SIGKILL to the process."""
+        self.send_signal(signal.SIGKILL)
+
+    def is_closing(self) -> bool:
+        """Return True if the transport is closed."""
+        return self.__closed
+
+    def close(self) -> None:
+        """Close the pipes of the process, and kill it if it is still running."""
+        if self.__closed:
+            return
+        self.__closed = True
+        for pipe in self.__pipes.values():
+            pipe.close()
+        if self.__pidfd != -1:
+            try:
+                self.kill()
+            except ProcessLookupError:
+                pass
+
+
+async def async_execute_process_with_pidfd(
+    protocol_class: Callable[..., asyncio.SubprocessProtocol],
+    cmd: List[Text],
+    cwd: Optional[Text] = None,
+    env: Optional[Dict[Text, Text]] = None,
+    shell: bool = False,
+    emulate_tty: bool = False,
+    stderr_to_stdout: bool = True,
+    new_process_group: bool = False,
+    output_files: Optional[Dict[int, Text]] = None
+) -> Tuple[asyncio.SubprocessTransport, asyncio.SubprocessProtocol]:
+    """
+    Execute a process like :func:`osrf_pycommon.process_utils.async_execute_process`.
+
+    If supported, see :func:`is_pidfd_supported`, the process is watched
+    for exiting by reading from a pidfd in the running loop, which takes no
+    thread nor signal handler per process, and works in any thread.
+    Otherwise, the process is executed by the event loop, or, to emulate a
+    tty, by :func:`osrf_pycommon.process_utils.async_execute_process`.
+
+    :param: new_process_group if True, the process is started in a new
+        process group, with the pid of the process as its id, so that it can
+        be signalled along with its own children, see :func:`os.killpg`;
+        before Python 3.11, it is started in a new session, which also
+        detaches it from the controlling terminal;
+        this is ignored on Windows, and when emulating a tty
+    :param: output_files the paths of existing files the process appends
+        its stdout, with the key 1, and stderr, with the key 2, to, instead
+        of pipes, so that it can keep writing its output if this process
+        exits; the files are read like the pipes, and removed once the
+        process exited; this is ignored if pidfds are not supported
+    """
+    if os.name == 'nt' or emulate_tty:
+        new_process_group = False
+    if emulate_tty or (not is_pidfd_supported() and not new_process_group):
+        return await async_execute_process(
+            protocol_class, cmd=cmd, cwd=cwd, env=env, shell=shell,
+            emulate_tty=emulate_tty, stderr_to_stdout=stderr_to_stdout)
+    loop = asyncio.get_event_loop()
+    kwargs = _get_new_process_group_kwargs() if new_process_group else {}
+    if not is_pidfd_supported():
+        # Like async_execute_process, which can't start a new process group.
+        stderr = subprocess.STDOUT if stderr_to_stdout else subprocess.PIPE
+        if shell:
+            return await loop.subprocess_shell(
+                protocol_class, ' '.join(cmd), cwd=cwd, env=env, stderr=stderr,
+                close_fds=False, **kwargs)
+        return await loop.subprocess_exec(
+            protocol_class, *cmd, cwd=cwd, env=env, stderr=stderr, close_fds=False, **kwargs)
+    output_files = output_files or {}
+    # The files are only passed to the process, which keeps them open on its own.
+    output_fds = {
+        fd: os.open(path, os.O_WRONLY | os.O_APPEND) for fd, path in output_files.items()}
+    try:
+        protocol = protocol_class()
+        process = subprocess.Popen(
+            ' '.join(cmd) if shell else cmd, cwd=cwd, env=env, shell=shell,
+            stdin=subprocess.PIPE, stdout=output_fds.get(1, subprocess.PIPE),
+            stderr=output_fds.get(
+                2, subprocess.STDOUT if stderr_to_stdout else subprocess.PIPE),
+            close_fds=False, bufsize=0, **kwargs)
+    finally:
+        for output_fd in output_fds.values():
+            os.close(output_fd)
+    transport = _PidfdSubprocessTransport(loop, process, protocol, output_files)
+    await transport._connect_pipes()
+    return transport, protocol
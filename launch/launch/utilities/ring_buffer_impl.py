@@ -0,0 +1,74 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the RingBuffer class."""
+
+from typing import Optional  # noqa: F401
+
+
+class RingBuffer:
+    """
+    Fixed size buffer of the last bytes written to it.
+
+    The buffer is allocated once, when it is first written to, and writing
+    copies the data into it in place, without allocating, so that keeping
+    the last output of many processes takes bounded memory and little time.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Constructor.
+
+        :param: size the number of bytes to keep
+        """
+        if size <= 0:
+            raise ValueError("size is '{}', expected a positive number".format(size))
+        self.__size = size
+        self.__buffer = None  # type: Optional[bytearray]
+        self.__position = 0
+        self.__full = False
+
+    @property
+    def size(self) -> int:
+        """Getter for size."""
+        return self.__size
+
+    def write(self, data: bytes) -> None:
+        """Add data to the buffer, overwriting the oldest data if it is full."""
+        if self.__buffer is None:
+            self.__buffer = bytearray(self.__size)
+        view = memoryview(data)
+        if len(view) >= self.__size:
+            self.__buffer[:] = view[len(view) - self.__size:]
+            self.__position = 0
+            self.__full = True
+            return
+        end = self.__position + len(view)
+        if end <= self.__size:
+            self.__buffer[self.__position:end] = view
+        else:
+            split = self.__size - self.__position
+            self.__buffer[self.__position:] = view[:split]
+            self.__buffer[:len(view) - split] = view[split:]
+        if end >= self.__size:
+            self.__full = True
+        self.__position = end % self.__size
+
+    def getvalue(self) -> bytes:
+        """Return the bytes in the buffer, oldest first."""
+        if self.__buffer is None:
+            return b''
+        if not self.__full:
+            return bytes(self.__buffer[:self.__position])
+        return bytes(self.__buffer[self.__position:] + self.__buffer[:self.__position])
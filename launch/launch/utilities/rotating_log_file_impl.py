@@ -0,0 +1,227 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for the RotatingLogFile class."""
+
+import concurrent.futures
+import gzip
+import os
+import shutil
+import struct
+import threading
+import time
+from typing import BinaryIO  # noqa: F401
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+# Each index entry is a monotonic timestamp and a byte offset in the uncompressed segment.
+_INDEX_ENTRY = struct.Struct('<dQ')
+
+_COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+_executor = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix='launch_log_compression')
+        return _executor
+
+
+def _compress(path: Text, compression: Text) -> None:
+    compressed_path = path + _COMPRESSION_SUFFIXES[compression]
+    with open(path, 'rb') as source:
+        if compression == 'gzip':
+            with gzip.open(compressed_path + '.tmp', 'wb', compresslevel=6) as destination:
+                shutil.copyfileobj(source, destination, 1024 * 1024)
+        else:
+            # import here to only pay for zstandard when needed
+            import zstandard
+            with open(compressed_path + '.tmp', 'wb') as destination:
+                zstandard.ZstdCompressor().copy_stream(source, destination)
+    os.replace(compressed_path + '.tmp', compressed_path)
+    os.unlink(path)
+
+
+def read_log_index(path: Text) -> List[Tuple[float, int]]:
+    """
+    Return the entries of the index of a log segment written by :class:`RotatingLogFile`.
+
+    Each entry is a monotonic timestamp, see :func:`time.monotonic`, and the
+    offset in the uncompressed segment of the output received at that time.
+    The entries are sorted, so the output received after a given time can be
+    found with :func:`bisect.bisect`.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Ignore an incomplete entry, e.g. if the index was not closed.
+    data = data[:len(data) - len(data) % _INDEX_ENTRY.size]
+    return list(_INDEX_ENTRY.iter_unpack(data))
+
+
+class RotatingLogFile:
+    """
+    Log file of the output of a process, split into segments by size and time.
+
+    The segments are named `<base_path>.<number>.log`, numbered from 0 and
+    skipping numbers which are in use, e.g. by a previous run.
+    A new segment is started before a write which would make the current
+    one larger than `max_bytes`, unless it is empty, or if the current
+    segment is older than `max_age` seconds.
+
+    Closed segments are compressed with gzip or zstd, which needs the
+    `zstandard` package, and removed, on a thread pool shared by all log
+    files, so that writing never waits for compression.
+
+    Each segment has an index, named `<base_path>.<number>.index`, with an
+    entry of the time and offset of the output at most every
+    `index_interval` seconds, see :func:`read_log_index`.
+    Indexes are not compressed, and the offsets are in the uncompressed
+    segment.
+    """
+
+    def __init__(
+        self,
+        base_path: Text,
+        *,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        max_age: Optional[float] = None,
+        compression: Optional[Text] = 'gzip',
+        index_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Constructor.
+
+        The first segment is created on first write.
+
+        :param: base_path the path of the segments, without their suffix
+        :param: max_bytes the maximum size of a segment, or None
+        :param: max_age the maximum time, in seconds, a segment is written to, or None
+        :param: compression either 'gzip', 'zstd' or None
+        :param: index_interval the minimum time, in seconds, between index entries
+        :param: clock the monotonic clock to timestamp the output and segments with
+        """
+        if compression not in _COMPRESSION_SUFFIXES:
+            raise ValueError(
+                "compression is '{}', expected one of {}".format(
+                    compression, sorted(c for c in _COMPRESSION_SUFFIXES if c is not None)))
+        if compression == 'zstd':
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                raise ValueError("compression 'zstd' needs the 'zstandard' package")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes is '{}', expected a positive number".format(max_bytes))
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age is '{}', expected a positive number".format(max_age))
+        self.__base_path = base_path
+        self.__max_bytes = max_bytes
+        self.__max_age = max_age
+        self.__compression = compression
+        self.__index_interval = index_interval
+        self.__clock = clock
+        self.__number = -1
+        self.__segment = None  # type: Optional[BinaryIO]
+        self.__index = None  # type: Optional[BinaryIO]
+        self.__segment_path = None  # type: Optional[Text]
+        self.__segment_size = 0
+        self.__segment_start = 0.0
+        self.__last_index_time = None  # type: Optional[float]
+        self.__segment_paths = []  # type: List[Text]
+        self.__pending = []  # type: List[concurrent.futures.Future]
+
+    @property
+    def base_path(self) -> Text:
+        """Getter for base_path."""
+        return self.__base_path
+
+    @property
+    def segment_paths(self) -> List[Text]:
+        """Getter for segment_paths, the paths the segments were written to, in order."""
+        return self.__segment_paths
+
+    def __get_path(self, number: int, suffix: Text) -> Text:
+        return '{}.{}{}'.format(self.__base_path, number, suffix)
+
+    def __open_segment(self, now: float) -> None:
+        self.__number += 1
+        while any(
+            os.path.exists(self.__get_path(self.__number, suffix))
+            for suffix in ['.log', '.index', '.log.gz', '.log.zst']
+        ):
+            self.__number += 1
+        self.__segment_path = self.__get_path(self.__number, '.log')
+        self.__segment = open(self.__segment_path, 'wb')
+        self.__index = open(self.__get_path(self.__number, '.index'), 'wb')
+        self.__segment_paths.append(self.__segment_path)
+        self.__segment_size = 0
+        self.__segment_start = now
+        self.__last_index_time = None
+
+    def __close_segment(self) -> None:
+        if self.__segment is None:
+            return
+        self.__segment.close()
+        self.__index.close()
+        self.__segment = None
+        self.__index = None
+        if self.__compression is not None:
+            self.__pending = [future for future in self.__pending if not future.done()]
+            self.__pending.append(_get_executor().submit(
+                _compress, self.__segment_path, self.__compression))
+
+    def write(self, data: bytes) -> None:
+        """Write data to the current segment, starting a new one first if needed."""
+        if not data:
+            return
+        now = self.__clock()
+        if self.__segment is not None and self.__segment_size > 0 and (
+            (self.__max_bytes is not None and
+                self.__segment_size + len(data) > self.__max_bytes) or
+            (self.__max_age is not None and now - self.__segment_start >= self.__max_age)
+        ):
+            self.__close_segment()
+        if self.__segment is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.__base_path)), exist_ok=True)
+            self.__open_segment(now)
+        if (
+            self.__last_index_time is None or
+            now - self.__last_index_time >= self.__index_interval
+        ):
+            self.__index.write(_INDEX_ENTRY.pack(now, self.__segment_size))
+            self.__last_index_time = now
+        self.__segment.write(data)
+        self.__segment_size += len(data)
+
+    def close(self, *, wait: bool = False) -> None:
+        """
+        Close the current segment, which is then compressed like the others.
+
+        :param: wait if True, wait for all of the segments to be compressed
+        """
+        self.__close_segment()
+        if wait:
+            concurrent.futures.wait(self.__pending)
+            for future in self.__pending:
+                future.result()
+            self.__pending = []
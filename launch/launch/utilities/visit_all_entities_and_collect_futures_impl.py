@@ -15,6 +15,8 @@
 """Module for the visit_all_entities_and_collect_futures() utility function."""
 
 import asyncio
+import time
+from typing import Iterator
 from typing import List
 from typing import Tuple
 
@@ -22,6 +24,50 @@ from ..launch_context import LaunchContext
 from ..launch_description_entity import LaunchDescriptionEntity
 
 
+def visit_all_entities_and_iterate_futures(
+    entity: LaunchDescriptionEntity,
+    context: LaunchContext
+) -> Iterator[Tuple[LaunchDescriptionEntity, asyncio.Future]]:
+    """
+    Visit given entity, as well as all sub-entities, and yield any futures.
+
+    Sub-entities are visited depth-first, in the same order as they are
+    returned by the visit of their parent entity.
+    The future of each entity (unless it is None) is yielded right after the
+    entity is visited, before continuing on to its sub-entities, so that the
+    futures can be consumed while the rest of the entities are visited.
+
+    The sub-entities are traversed with an explicit stack rather than by
+    recursion, so that the depth of nested launch descriptions is not limited
+    by the Python recursion limit, and so that the cost of each entity does
+    not depend on how deeply it is nested.
+
+    When a :class:`launch.LaunchPlan` is being created, the time spent
+    visiting each entity, excluding its sub-entities, is recorded in it.
+    """
+    # import here to avoid loop
+    from ..launch_plan import get_launch_plan
+    launch_plan = get_launch_plan(context)
+    stack = [iter((entity,))]  # type: List[Iterator[LaunchDescriptionEntity]]
+    while stack:
+        try:
+            entity = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            continue
+        if launch_plan is None:
+            sub_entities = entity.visit(context)
+        else:
+            start = time.perf_counter()
+            sub_entities = entity.visit(context)
+            launch_plan.add_timing(entity, 'visit', time.perf_counter() - start)
+        entity_future = entity.get_asyncio_future()
+        if entity_future is not None:
+            yield (entity, entity_future)
+        if sub_entities is not None:
+            stack.append(iter(sub_entities))
+
+
 def visit_all_entities_and_collect_futures(
     entity: LaunchDescriptionEntity,
     context: LaunchContext
@@ -29,18 +75,10 @@ def visit_all_entities_and_collect_futures(
     """
     Visit given entity, as well as all sub-entities, and collect any futures.
 
-    Sub-entities are visited recursively and depth-first.
+    Sub-entities are visited depth-first.
     The future is collected from each entity (unless it returns None) before
     continuing on to more sub-entities.
 
-    This function may call itself to traverse the sub-entities recursively.
+    See :func:`visit_all_entities_and_iterate_futures`, which this collects.
     """
-    sub_entities = entity.visit(context)
-    entity_future = entity.get_asyncio_future()
-    futures_to_return = []
-    if entity_future is not None:
-        futures_to_return.append((entity, entity_future))
-    if sub_entities is not None:
-        for sub_entity in sub_entities:
-            futures_to_return += visit_all_entities_and_collect_futures(sub_entity, context)
-    return [future_pair for future_pair in futures_to_return if future_pair[1] is not None]
+    return list(visit_all_entities_and_iterate_futures(entity, context))
@@ -0,0 +1,57 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for importing the launch package, lazily and eagerly.
+
+Run it with `python benchmark_import_time.py`, it is not part of the tests.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+# Each import is measured in a new interpreter, so that no module is imported already.
+IMPORT_SCRIPT = textwrap.dedent("""
+    import sys
+    import time
+    sys.path[:0] = {sys_path!r}
+    start = time.perf_counter()
+    import launch
+    if {eager!r}:
+        for package in (launch, launch.actions, launch.substitutions):
+            for name in package.__all__:
+                getattr(package, name)
+    print(time.perf_counter() - start)
+""")
+
+
+def measure(eager, repetitions=10):
+    """Return the shortest time, in seconds, importing launch took."""
+    return min(
+        float(subprocess.check_output([
+            sys.executable, '-c', IMPORT_SCRIPT.format(sys_path=sys.path, eager=eager),
+        ]))
+        for _ in range(repetitions)
+    )
+
+
+def main():
+    for eager in (False, True):
+        print('import launch{}: {:.1f} ms'.format(
+            ', and everything it exports' if eager else '', measure(eager) * 1000))
+
+
+if __name__ == '__main__':
+    main()
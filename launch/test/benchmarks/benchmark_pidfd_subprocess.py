@@ -0,0 +1,62 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark for executing short-lived processes with and without a pidfd.
+
+Run it with `python benchmark_pidfd_subprocess.py`, it is not part of the tests.
+"""
+
+import asyncio
+import time
+
+from launch.utilities import async_execute_process_with_pidfd
+from launch.utilities import is_pidfd_supported
+from osrf_pycommon.process_utils import async_execute_process
+from osrf_pycommon.process_utils import AsyncSubprocessProtocol
+
+
+async def execute_many(execute_process, count, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def execute_one():
+        async with semaphore:
+            transport, protocol = await execute_process(AsyncSubprocessProtocol, ['true'])
+            return await protocol.complete
+
+    return await asyncio.gather(*[execute_one() for _ in range(count)])
+
+
+def main(count=1000, concurrency=100):
+    print('executing {} processes, with up to {} at a time'.format(count, concurrency))
+    backends = [('osrf_pycommon', async_execute_process)]
+    if is_pidfd_supported():
+        backends.insert(0, ('pidfd', async_execute_process_with_pidfd))
+    for name, execute_process in backends:
+        loop = asyncio.new_event_loop()
+        try:
+            start = time.perf_counter()
+            returncodes = loop.run_until_complete(
+                execute_many(execute_process, count, concurrency))
+            elapsed = time.perf_counter() - start
+        finally:
+            loop.close()
+        assert returncodes == [0] * count
+        print('{:>13}: {:8.2f} ms, {:.2f} ms per process'.format(
+            name, elapsed * 1000, elapsed * 1000 / count))
+
+
+if __name__ == '__main__':
+    main()
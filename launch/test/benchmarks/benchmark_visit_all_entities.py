@@ -0,0 +1,59 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark for visiting launch descriptions of increasing depth and width.
+
+Run it with `python benchmark_visit_all_entities.py`, it is not part of the tests.
+"""
+
+import asyncio
+import time
+
+from launch import LaunchContext
+from launch import LaunchDescriptionEntity
+from launch.utilities import visit_all_entities_and_collect_futures
+
+
+class EntityTree(LaunchDescriptionEntity):
+    """Entity with a future, and `width` sub-entities down to the given depth."""
+
+    def __init__(self, depth, width):
+        self.__depth = depth
+        self.__width = width
+
+    def get_asyncio_future(self):
+        return asyncio.Future()
+
+    def visit(self, context):
+        if self.__depth == 0:
+            return None
+        return [EntityTree(self.__depth - 1, self.__width) for _ in range(self.__width)]
+
+
+def main():
+    # Futures are created with the current event loop, so there needs to be one.
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    context = LaunchContext()
+    for depth, width in ((100, 1), (1000, 1), (10000, 1), (1, 100), (1, 1000), (1, 10000)):
+        start = time.perf_counter()
+        result = visit_all_entities_and_collect_futures(EntityTree(depth, width), context)
+        elapsed = time.perf_counter() - start
+        print('depth {:5}, width {:5}: {:8.2f} ms, {:.2f} us per entity'.format(
+            depth, width, elapsed * 1000, elapsed * 1e6 / len(result)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the prefetch_python_launch_files() function."""
+
+from importlib.machinery import SourceFileLoader
+import os
+import textwrap
+
+from launch import LaunchContext
+from launch import LaunchDescription
+from launch.actions import IncludeLaunchDescription
+from launch.launch_description_sources import prefetch_python_launch_files
+from launch.launch_description_sources import python_launch_description_source
+from launch.launch_description_sources import python_launch_file_utilities
+from launch.launch_description_sources import PythonLaunchDescriptionSource
+from launch.substitutions import EnvironmentVariable
+from launch.substitutions import ThisLaunchFileDir
+
+INCLUDING_LAUNCH_FILE = """
+from launch import LaunchDescription
+from launch.actions import IncludeLaunchDescription
+from launch.launch_description_sources import PythonLaunchDescriptionSource
+from launch.substitutions import ThisLaunchFileDir
+
+
+def generate_launch_description():
+    return LaunchDescription([{}])
+"""
+
+INCLUDE = 'IncludeLaunchDescription(PythonLaunchDescriptionSource({})),'
+
+
+def _write_launch_file(directory, name, include_paths):
+    path = os.path.join(str(directory), name)
+    with open(path, 'w') as f:
+        f.write(textwrap.dedent(INCLUDING_LAUNCH_FILE).format(
+            ''.join(INCLUDE.format(p) for p in include_paths)))
+    return os.path.realpath(path)
+
+
+def test_prefetch_python_launch_files(tmpdir):
+    """Test prefetching the launch files included by a launch description."""
+    leaf = _write_launch_file(tmpdir, 'leaf.launch.py', [])
+    relative = _write_launch_file(
+        tmpdir, 'relative.launch.py', ["[ThisLaunchFileDir(), '/leaf.launch.py']"])
+    absolute = _write_launch_file(tmpdir, 'absolute.launch.py', [repr(leaf)])
+    root = _write_launch_file(tmpdir, 'root.launch.py', [
+        "[ThisLaunchFileDir(), '/relative.launch.py']",
+        repr(absolute),
+        "[ThisLaunchFileDir(), '/missing.launch.py']",
+    ])
+
+    ld = LaunchDescription([
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(root)),
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(absolute)),
+        # Not resolvable without a context, so it is not prefetched.
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(
+            [EnvironmentVariable('HOME'), '/other.launch.py'])),
+    ])
+    # Only the launch files included directly are prefetched, without executing them.
+    assert prefetch_python_launch_files(ld).result() == [root, absolute]
+    for path in (root, absolute):
+        assert path in python_launch_file_utilities._code_cache
+    for path in (relative, leaf):
+        assert path not in python_launch_file_utilities._code_cache
+    assert root not in python_launch_description_source._launch_descriptions_without_context
+
+    # The includes of a launch file are prefetched when it is loaded, without waiting for them.
+    PythonLaunchDescriptionSource(root).get_launch_description(LaunchContext())
+    python_launch_file_utilities._get_code(SourceFileLoader('python_launch_file', relative))
+    assert relative in python_launch_file_utilities._code_cache
+    assert leaf not in python_launch_file_utilities._code_cache
+
+    # Without the directory of the including launch file, ThisLaunchFileDir can't be resolved.
+    relative_ld = LaunchDescription([
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(
+            [os.path.dirname(leaf), '/', 'leaf.launch.py'])),
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(
+            [ThisLaunchFileDir(), '/absolute.launch.py'])),
+    ])
+    assert prefetch_python_launch_files(relative_ld).result() == [leaf]
+    assert prefetch_python_launch_files(
+        relative_ld, launch_file_directory=os.path.dirname(leaf)).result() == [leaf, absolute]
+    assert prefetch_python_launch_files(LaunchDescription()).result() == []
+    assert python_launch_file_utilities._pending_compilations == {}
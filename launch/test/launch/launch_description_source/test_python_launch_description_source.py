@@ -41,3 +41,37 @@ def test_python_launch_description_source():
     with pytest.raises(FileNotFoundError):
         plds = PythonLaunchDescriptionSource('does_not_exist')
         ld = plds.get_launch_description(LaunchContext())
+
+
+def test_python_launch_description_source_without_context(tmpdir):
+    """Test that loading without a context is shared by sources until the file changes."""
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    simple_launch_file_path = os.path.join(this_dir, 'simple.launch.py')
+    ld = PythonLaunchDescriptionSource(
+        simple_launch_file_path).try_get_launch_description_without_context()
+    assert ld is not None
+    assert ld is PythonLaunchDescriptionSource(
+        simple_launch_file_path).try_get_launch_description_without_context()
+    # Getting the launch description with a context always loads a new one.
+    assert ld is not PythonLaunchDescriptionSource(
+        simple_launch_file_path).get_launch_description(LaunchContext())
+
+    launch_file = tmpdir / 'test.launch.py'
+    launch_file.write(
+        'from launch import LaunchDescription\n'
+        'def generate_launch_description():\n'
+        '    return LaunchDescription()\n')
+    ld = PythonLaunchDescriptionSource(
+        str(launch_file)).try_get_launch_description_without_context()
+    launch_file.write(
+        'from launch import LaunchDescription\n'
+        'from launch.actions import LogInfo\n'
+        'def generate_launch_description():\n'
+        "    return LaunchDescription([LogInfo(msg='changed')])\n")
+    new_ld = PythonLaunchDescriptionSource(
+        str(launch_file)).try_get_launch_description_without_context()
+    assert ld is not new_ld
+    assert 1 == len(new_ld.entities)
+
+    assert PythonLaunchDescriptionSource(
+        'does_not_exist').try_get_launch_description_without_context() is None
@@ -20,6 +20,7 @@ import sys
 from launch.launch_description_sources import get_launch_description_from_python_launch_file
 from launch.launch_description_sources import InvalidPythonLaunchFileError
 from launch.launch_description_sources import load_python_launch_file_as_module
+from launch.launch_description_sources import python_launch_file_utilities
 
 import pytest
 
@@ -46,3 +47,23 @@ def test_get_launch_description_from_python_launch_file():
 
     with pytest.raises(FileNotFoundError):
         ld = get_launch_description_from_python_launch_file('does_not_exist')
+
+
+def test_load_python_launch_file_as_module_reuses_code(tmpdir):
+    """Test that the compiled code of a Python launch file is reused until it changes."""
+    launch_file = tmpdir / 'test.launch.py'
+    launch_file.write('value = 1\n')
+    path = str(launch_file)
+
+    code_cache = python_launch_file_utilities._code_cache
+    assert 1 == load_python_launch_file_as_module(path).value
+    code = code_cache[os.path.realpath(path)][1]
+    assert 1 == load_python_launch_file_as_module(path).value
+    assert code is code_cache[os.path.realpath(path)][1]
+
+    # The module is still executed each time.
+    assert load_python_launch_file_as_module(path) is not load_python_launch_file_as_module(path)
+
+    launch_file.write('value = 22\n')
+    assert 22 == load_python_launch_file_as_module(path).value
+    assert code is not code_cache[os.path.realpath(path)][1]
@@ -0,0 +1,119 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the Command substitution class."""
+
+import asyncio
+import os
+import sys
+
+from launch import LaunchContext
+from launch.substitutions import Command
+from launch.substitutions import EnvironmentVariable
+from launch.substitutions import SubstitutionFailure
+
+import pytest
+
+
+def _counting_command(counter_file, text):
+    # Appends a line to the counter file every time it is run, and prints the given text.
+    return '{} -c "open(\'{}\', \'a\').write(\'x\\n\'); print(\'{}\', end=\'\')"'.format(
+        sys.executable, counter_file, text)
+
+
+def _count(counter_file):
+    with open(counter_file, 'r') as h:
+        return len(h.readlines())
+
+
+def test_command(tmpdir):
+    """Test the Command substitution, and that its output is memoized."""
+    counter_file = str(tmpdir / 'counter')
+    context = LaunchContext()
+    sub = Command(_counting_command(counter_file, 'hello'))
+    assert 'hello' == sub.perform(context)
+    assert 'hello' == Command(_counting_command(counter_file, 'hello')).perform(context)
+    assert 1 == _count(counter_file)
+
+    # A different environment is a different invocation.
+    sub = Command(_counting_command(counter_file, 'hello'), env=dict(os.environ, FOO='bar'))
+    assert 'hello' == sub.perform(context)
+    assert 2 == _count(counter_file)
+
+    # Memoization is per launch, i.e. per context.
+    assert 'hello' == Command(_counting_command(counter_file, 'hello')).perform(LaunchContext())
+    assert 3 == _count(counter_file)
+
+
+def test_command_async(tmpdir, monkeypatch):
+    """Test that concurrent uses of the same command only run it once."""
+    counter_file = str(tmpdir / 'counter')
+    loop = asyncio.new_event_loop()
+    context = LaunchContext()
+    context._set_asyncio_loop(loop)
+    monkeypatch.setenv('TEST_COMMAND_TEXT', 'hello')
+    subs = [
+        Command(['{} -c "import time; time.sleep(0.5); '.format(sys.executable),
+                 "open('{}', 'a').write('x\\n'); print('".format(counter_file),
+                 EnvironmentVariable('TEST_COMMAND_TEXT'), "', end='')\""])
+        for _ in range(3)
+    ]
+
+    async def perform_all():
+        return await asyncio.gather(*[sub.perform_async(context) for sub in subs])
+
+    try:
+        results = loop.run_until_complete(perform_all())
+        assert ['hello'] * 3 == results
+        assert 1 == _count(counter_file)
+        # The synchronous variant uses the result as well.
+        assert 'hello' == subs[0].perform(context)
+        assert 1 == _count(counter_file)
+    finally:
+        loop.close()
+
+
+def test_command_failure():
+    """Test the Command substitution with a failing command."""
+    context = LaunchContext()
+    with pytest.raises(SubstitutionFailure, match='exit code'):
+        Command('{} -c "import sys; sys.exit(1)"'.format(sys.executable)).perform(context)
+    with pytest.raises(SubstitutionFailure, match='timed out'):
+        Command(
+            '{} -c "import time; time.sleep(5)"'.format(sys.executable), timeout=0.1
+        ).perform(context)
+    with pytest.raises(SubstitutionFailure, match='failed to run'):
+        Command('this-executable-does-not-exist').perform(context)
+
+
+def test_command_persistent_cache(tmpdir):
+    """Test the persistent cache of the Command substitution."""
+    counter_file = str(tmpdir / 'counter')
+    input_file = tmpdir / 'input.txt'
+    input_file.write('1')
+
+    def make_command():
+        return Command(
+            _counting_command(counter_file, 'hello'),
+            cache_inputs=[str(input_file)], cache_directory=str(tmpdir / 'cache'))
+
+    assert 'hello' == make_command().perform(LaunchContext())
+    assert 'hello' == make_command().perform(LaunchContext())
+    assert 1 == _count(counter_file)
+
+    # Changing the contents of an input invalidates the cached output.
+    input_file.write('2')
+    assert 'hello' == make_command().perform(LaunchContext())
+    assert 2 == _count(counter_file)
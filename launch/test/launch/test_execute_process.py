@@ -14,11 +14,24 @@
 
 """Tests for the ExecuteProcess Action."""
 
+import os
+import signal
 import sys
+import time
 
 from launch import LaunchDescription
 from launch import LaunchService
+from launch.actions import EmitEvent
+from launch.actions import RegisterEventHandler
 from launch.actions.execute_process import ExecuteProcess
+from launch.event_handlers import OnProcessExit
+from launch.event_handlers import OnProcessIO
+from launch.event_handlers.on_process_start import OnProcessStart
+from launch.events import Shutdown
+from launch.events.process import matches_action
+from launch.events.process import SignalProcesses
+
+import pytest
 
 
 def test_execute_process_with_env():
@@ -32,3 +45,218 @@ def test_execute_process_with_env():
     ls = LaunchService()
     ls.include_launch_description(ld)
     assert 0 == ls.run()
+
+
+def _run_and_collect_stdout(process_action):
+    output = []
+    ld = LaunchDescription([
+        process_action,
+        RegisterEventHandler(OnProcessIO(
+            target_action=process_action,
+            on_stdout=lambda event: output.append(event.text),
+        )),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    return b''.join(output)
+
+
+def test_execute_process_with_output_filter():
+    """Test that the lines dropped by the output filter don't become events."""
+    output = _run_and_collect_stdout(ExecuteProcess(
+        cmd=[sys.executable, '-c', 'print("keep 1\\ndrop 2\\nignore 3\\nkeep 4", end="")'],
+        output='screen',
+        output_filter={'keep': ['^keep', '^drop'], 'drop': ['^drop']},
+    ))
+    assert output == b'keep 1\nkeep 4'
+
+
+def test_execute_process_with_output_rate_limit():
+    """Test that the lines over the output rate limit are suppressed."""
+    output = _run_and_collect_stdout(ExecuteProcess(
+        cmd=[sys.executable, '-c', 'for i in range(1000): print(i)'],
+        output='screen',
+        output_rate_limit=10,
+    ))
+    lines = output.decode().splitlines()
+    assert lines[:10] == [str(i) for i in range(10)]
+    assert 'lines suppressed' in lines[-1]
+    assert len(lines) < 100
+
+
+def test_execute_process_with_invalid_output_filter():
+    with pytest.raises(ValueError):
+        ExecuteProcess(cmd=['ls'], output_filter={'include': ['.*']})
+    with pytest.raises(ValueError):
+        ExecuteProcess(cmd=['ls'], output_rate_limit=-1)
+
+
+def test_execute_process_output_tail():
+    """Test that the last output of a process is passed to the ProcessExited event."""
+    exited_events = []
+    process_action = ExecuteProcess(
+        cmd=[
+            sys.executable, '-c',
+            'import sys, time\n'
+            'for i in range(1000): print(i)\n'
+            'sys.stdout.flush()\n'
+            'time.sleep(0.1)\n'
+            'sys.exit("fatal error")',
+        ],
+        output_tail_size=64,
+    )
+    ld = LaunchDescription([
+        process_action,
+        RegisterEventHandler(OnProcessExit(
+            target_action=process_action,
+            on_exit=lambda event, context: exited_events.append(event),
+        )),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    ls.run()
+    assert len(exited_events) == 1
+    assert exited_events[0].returncode == 1
+    output_tail = exited_events[0].output_tail
+    assert len(output_tail) == 64
+    assert b'999\n' in output_tail
+    assert output_tail.endswith(b'fatal error\n')
+
+
+def test_execute_process_without_output_tail():
+    exited_events = []
+    process_action = ExecuteProcess(cmd=[sys.executable, '-c', 'print(1)'], output_tail_size=0)
+    ld = LaunchDescription([
+        process_action,
+        RegisterEventHandler(OnProcessExit(
+            target_action=process_action,
+            on_exit=lambda event, context: exited_events.append(event),
+        )),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    assert exited_events[0].output_tail is None
+    with pytest.raises(ValueError):
+        ExecuteProcess(cmd=['ls'], output_tail_size=-1)
+
+
+def test_execute_process_with_output_log(tmpdir):
+    """Test that the output of a process is written to a log file."""
+    output = _run_and_collect_stdout(ExecuteProcess(
+        cmd=[sys.executable, '-c', 'print("hello\\nworld")'],
+        name='hello',
+        output='screen',
+        output_log={'directory': str(tmpdir), 'compression': None},
+    ))
+    assert output == b'hello\nworld\n'
+    log_files = tmpdir.listdir(fil=lambda path: path.ext == '.log')
+    assert len(log_files) == 1
+    assert log_files[0].basename.startswith('hello-')
+    assert log_files[0].read_binary() == b'hello\nworld\n'
+    with pytest.raises(ValueError):
+        ExecuteProcess(cmd=['ls'], output_log={'max_bytes': 1024})
+
+
+def test_execute_process_with_output_records():
+    """Test that the output events carry the parsed records of their lines."""
+    records = []
+    process_action = ExecuteProcess(
+        cmd=[
+            sys.executable, '-c',
+            'import sys, time\n'
+            'print("[INFO] [1.5] [talker]: Hello", flush=True)\n'
+            'time.sleep(0.1)\n'
+            'print("[ERROR] [2.5] [talker]: Bye\\nplain", end="")',
+        ],
+        output='screen',
+        output_records=True,
+    )
+    ld = LaunchDescription([
+        process_action,
+        RegisterEventHandler(OnProcessIO(
+            target_action=process_action,
+            on_stdout=lambda event: records.extend(event.records),
+        )),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    assert [(r.severity, r.logger, r.message) for r in records] == [
+        ('INFO', 'talker', b'Hello'), ('ERROR', 'talker', b'Bye'), (None, None, b'plain')]
+    assert records[0].received_time < records[1].received_time
+
+
+def _is_running(pid):
+    try:
+        with open('/proc/{}/stat'.format(pid), 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return False
+    # Zombies are not running, and may not be reaped by the init process of a container.
+    return stat[stat.rindex(b')') + 2:].split()[0] not in (b'Z', b'X')
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/stat'), reason='needs /proc')
+def test_execute_process_shutdown_signals_process_group():
+    """Test that the processes started by a process are not left behind on shutdown."""
+    grandchild_pids = []
+
+    def on_stdout(event):
+        grandchild_pids.append(int(event.text))
+        return EmitEvent(event=Shutdown(reason='grandchild started'))
+
+    # Background processes of a non-interactive shell ignore SIGINT, so the sleep is only
+    # stopped by killing the processes left behind in the process group once the shell exits.
+    process_action = ExecuteProcess(cmd=['sleep 30 & echo $!; wait'], shell=True)
+    ld = LaunchDescription([
+        process_action,
+        RegisterEventHandler(OnProcessIO(target_action=process_action, on_stdout=on_stdout)),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    assert len(grandchild_pids) == 1
+    # The leftovers are killed asynchronously.
+    deadline = time.monotonic() + 5.0
+    while _is_running(grandchild_pids[0]) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not _is_running(grandchild_pids[0])
+
+
+def test_execute_process_signal_processes():
+    """Test that a SignalProcesses event signals all of the processes it matches."""
+    exited_events = []
+    process_actions = [
+        ExecuteProcess(cmd=[sys.executable, '-c', 'import time; time.sleep(30)'])
+        for _ in range(3)
+    ]
+    started_actions = []
+
+    def on_start(event, context):
+        started_actions.append(event.action)
+        if len(started_actions) == 3:
+            return [
+                EmitEvent(event=SignalProcesses(
+                    signal_number=signal.SIGTERM,
+                    process_matcher=lambda action: action is not process_actions[0])),
+                EmitEvent(event=SignalProcesses(
+                    signal_number='SIGKILL',
+                    process_matcher=matches_action(process_actions[0]))),
+            ]
+
+    ld = LaunchDescription(process_actions + [
+        RegisterEventHandler(OnProcessStart(on_start=on_start)),
+        RegisterEventHandler(OnProcessExit(
+            on_exit=lambda event, context: exited_events.append(event))),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    returncodes = {event.action: event.returncode for event in exited_events}
+    assert returncodes == {
+        process_actions[0]: -signal.SIGKILL,
+        process_actions[1]: -signal.SIGTERM,
+        process_actions[2]: -signal.SIGTERM,
+    }
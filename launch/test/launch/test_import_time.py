@@ -0,0 +1,49 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lazy importing of the modules of the launch package."""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+SCRIPT = textwrap.dedent("""
+    import json
+    import sys
+    sys.path[:0] = {sys_path!r}
+    import launch
+    imported_modules = sorted(sys.modules)
+    unresolved_names = []
+    for package in (launch, launch.actions, launch.substitutions):
+        for name in package.__all__:
+            if getattr(package, name, None) is None:
+                unresolved_names.append(package.__name__ + '.' + name)
+    print(json.dumps({{
+        'imported_modules': imported_modules,
+        'unresolved_names': unresolved_names,
+    }}))
+""")
+
+
+def test_import_time():
+    """Test that importing launch does not import all of its modules, until they are used."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', SCRIPT.format(sys_path=sys.path)])
+    result = json.loads(output.decode())
+    assert 'launch' in result['imported_modules']
+    assert 'launch.actions' not in result['imported_modules']
+    assert 'launch.substitutions' not in result['imported_modules']
+    assert 'asyncio' not in result['imported_modules']
+    assert result['unresolved_names'] == []
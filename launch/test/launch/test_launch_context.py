@@ -141,3 +141,25 @@ def test_launch_context_perform_substitution():
 
     sub = TextSubstitution(text='foo')
     assert lc.perform_substitution(sub) == 'foo'
+
+    loop = asyncio.get_event_loop()
+    assert loop.run_until_complete(lc.perform_substitution_async(sub)) == 'foo'
+
+
+def test_launch_context_snapshot():
+    """Test that a snapshot of the LaunchContext class is isolated from later changes."""
+    lc = LaunchContext()
+    lc.extend_locals({'foo': 1})
+    lc.launch_configurations['bar'] = 'baz'
+
+    snapshot = lc._snapshot()
+    lc.extend_locals({'foo': 2})
+    lc._push_launch_configurations()
+    lc.launch_configurations['bar'] = 'qux'
+
+    assert snapshot.locals.foo == 1
+    assert snapshot.launch_configurations['bar'] == 'baz'
+    assert snapshot._event_queue is lc._event_queue
+
+    snapshot.extend_locals({'foo': 3})
+    assert lc.locals.foo == 2
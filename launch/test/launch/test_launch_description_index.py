@@ -0,0 +1,68 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the LaunchDescriptionIndex class."""
+
+from launch import Action
+from launch import LaunchDescription
+from launch import LaunchDescriptionIndex
+from launch import LaunchDescriptionSource
+from launch.actions import DeclareLaunchArgument
+from launch.actions import IncludeLaunchDescription
+from launch.actions import LogInfo
+from launch.actions import TimerAction
+from launch.conditions import IfCondition
+
+
+def test_launch_description_index():
+    """Test indexing a launch description, including conditional and included entities."""
+    include = IncludeLaunchDescription(LaunchDescriptionSource(LaunchDescription([
+        DeclareLaunchArgument('included'),
+        DeclareLaunchArgument('first'),
+        LogInfo(msg='included'),
+    ])))
+    ld = LaunchDescription([
+        DeclareLaunchArgument('first'),
+        TimerAction(period=1.0, actions=[
+            IncludeLaunchDescription(LaunchDescriptionSource(LaunchDescription([
+                DeclareLaunchArgument('timed'),
+            ]))),
+        ]),
+        DeclareLaunchArgument('conditional', condition=IfCondition('true')),
+        include,
+    ])
+    index = ld.get_index()
+    assert isinstance(index, LaunchDescriptionIndex)
+    assert [a.name for a in index.launch_arguments] == [
+        'first', 'timed', 'conditional', 'included']
+    assert [a.name for a in index.launch_arguments if index.is_conditionally_included(a.name)] \
+        == ['timed', 'conditional']
+    assert index.includes[-1] is include
+    assert len(index.includes) == 2
+    assert len(index.actions_by_type[DeclareLaunchArgument]) == 5
+    assert len(index.actions_by_type[IncludeLaunchDescription]) == 2
+    assert len(index.get_actions(Action)) == 9
+    assert [a.name for a in ld.get_launch_arguments() if a._conditionally_included] == [
+        'timed', 'conditional']
+    assert all(a._conditionally_included for a in ld.get_launch_arguments(True))
+
+
+def test_launch_description_index_cache():
+    """Test that the index of a launch description is cached until an entity is added."""
+    ld = LaunchDescription([DeclareLaunchArgument('foo')])
+    index = ld.get_index()
+    assert ld.get_index() is index
+    ld.add_action(DeclareLaunchArgument('bar'))
+    assert ld.get_index() is not index
+    assert [a.name for a in ld.get_launch_arguments()] == ['foo', 'bar']
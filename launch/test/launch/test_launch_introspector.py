@@ -0,0 +1,85 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the LaunchIntrospector class."""
+
+import io
+import json
+
+from launch import LaunchDescription
+from launch import LaunchIntrospector
+from launch.actions import ExecuteProcess
+from launch.actions import LogInfo
+from launch.actions import RegisterEventHandler
+from launch.event_handlers import OnProcessExit
+
+
+def _get_launch_description():
+    process = ExecuteProcess(cmd=['ls', '-l'], env={'NAME': 'value'})
+    return LaunchDescription([
+        LogInfo(msg='first'),
+        process,
+        RegisterEventHandler(OnProcessExit(
+            target_action=process, on_exit=[LogInfo(msg='exited')])),
+        RegisterEventHandler(OnProcessExit(
+            target_action=process, on_exit=[LogInfo(msg='exited')])),
+    ])
+
+
+def test_launch_introspector_nodes():
+    """Test iterating the nodes of the tree of a launch description."""
+    nodes = list(LaunchIntrospector().iterate_launch_description_nodes(_get_launch_description()))
+    assert [(n['id'], n['parent'], n['depth'], n['is_last'], n['kind']) for n in nodes] == [
+        (0, None, 0, False, 'entity'),
+        (1, None, 0, False, 'entity'),
+        (2, None, 0, False, 'entity'),
+        (3, 2, 1, True, 'event_handler'),
+        (4, None, 0, True, 'entity'),
+        (5, 4, 1, True, 'event_handler'),
+    ]
+    assert [n['type'] for n in nodes] == [
+        'LogInfo', 'ExecuteProcess', 'RegisterEventHandler', 'OnProcessExit',
+        'RegisterEventHandler', 'OnProcessExit']
+    assert nodes[1]['description'] == \
+        "ExecuteProcess(cmd=['ls', '-l'], cwd=None, env={'NAME': 'value'}, shell=False)"
+
+
+def test_launch_introspector_format():
+    """Test formatting a launch description as a tree."""
+    ld = _get_launch_description()
+    lines = LaunchIntrospector().format_launch_description(ld).splitlines()
+    assert lines[0] == '{}'.format(ld)
+    assert [line[:4] for line in lines[1:]] == [
+        '├── ', '├── ', '├── ', '│   ', '└── ', '    ']
+    assert lines[4].startswith('│   └── OnProcessExit(')
+    assert lines[6].startswith('    └── OnProcessExit(')
+
+
+def test_launch_introspector_exporters():
+    """Test exporting a launch description as JSON and GraphViz."""
+    ld = _get_launch_description()
+    stream = io.StringIO()
+    LaunchIntrospector().write_launch_description_json(ld, stream)
+    data = json.loads(stream.getvalue())
+    assert data['launch_description'] == '{}'.format(ld)
+    assert data['nodes'] == list(LaunchIntrospector().iterate_launch_description_nodes(ld))
+
+    stream = io.StringIO()
+    LaunchIntrospector().write_launch_description_dot(ld, stream)
+    dot = stream.getvalue()
+    assert dot.startswith('digraph launch_description {\n')
+    assert dot.endswith('}\n')
+    assert '    root -> node0;\n' in dot
+    assert '    node2 -> node3;\n' in dot
+    assert 'shape=ellipse' in dot
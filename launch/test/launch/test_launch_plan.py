@@ -0,0 +1,196 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the LaunchPlan class."""
+
+import os
+import sys
+import textwrap
+
+from launch import LaunchDescription
+from launch import LaunchPlan
+from launch import LaunchService
+from launch.actions import DeclareLaunchArgument
+from launch.actions import ExecuteProcess
+from launch.actions import IncludeLaunchDescription
+from launch.actions import OpaqueFunction
+from launch.actions import TimerAction
+from launch.launch_description_sources import PythonLaunchDescriptionSource
+from launch.launch_plan import get_launch_plan_key
+from launch.substitutions import Command
+from launch.substitutions import LaunchConfiguration
+
+LAUNCH_FILE = """
+import sys
+
+from launch import LaunchDescription
+from launch.actions import DeclareLaunchArgument
+from launch.actions import ExecuteProcess
+from launch.substitutions import LaunchConfiguration
+
+
+def generate_launch_description():
+    return LaunchDescription([
+        DeclareLaunchArgument('output_file'),
+        ExecuteProcess(
+            cmd=[sys.executable, '-c', [
+                'open("', LaunchConfiguration('output_file'), '", "w").close()']],
+            name='touch',
+            env={'PLANNED': 'yes'},
+        ),
+    ])
+"""
+
+
+def _write_launch_file(tmpdir):
+    launch_file_path = os.path.join(str(tmpdir), 'touch.launch.py')
+    with open(launch_file_path, 'w') as f:
+        f.write(textwrap.dedent(LAUNCH_FILE))
+    return launch_file_path
+
+
+def test_launch_plan_create_and_replay(tmpdir):
+    """Test creating a launch plan without launching anything, and launching from it."""
+    launch_file_path = _write_launch_file(tmpdir)
+    output_file = os.path.join(str(tmpdir), 'output')
+    ld = LaunchDescription([
+        IncludeLaunchDescription(
+            PythonLaunchDescriptionSource(launch_file_path),
+            launch_arguments=[('output_file', output_file)],
+        ),
+    ])
+    plan = LaunchPlan.create(ld)
+    assert not os.path.exists(output_file)
+    assert plan.is_cacheable
+    assert list(plan.inputs) == [launch_file_path]
+    assert len(plan.processes) == 1
+    process = plan.processes[0]
+    assert process['name'] == 'touch'
+    assert process['cmd'][-1] == 'open("{}", "w").close()'.format(output_file)
+    assert process['env'] == {'PLANNED': 'yes'}
+
+    plan_path = os.path.join(str(tmpdir), 'plans', 'plan.json')
+    plan.save(plan_path)
+    loaded_plan = LaunchPlan.load(plan_path)
+    assert loaded_plan is not None
+    assert loaded_plan.processes == plan.processes
+    assert loaded_plan.is_up_to_date()
+
+    ls = LaunchService()
+    ls.include_launch_description(loaded_plan.to_launch_description())
+    assert 0 == ls.run()
+    assert os.path.exists(output_file)
+
+    with open(launch_file_path, 'a') as f:
+        f.write('\n# modified\n')
+    assert not loaded_plan.is_up_to_date()
+    assert LaunchPlan.load(os.path.join(str(tmpdir), 'missing.json')) is None
+
+
+def test_launch_plan_restores_files(tmpdir):
+    """Test that generated files are restored for replaying, and removed on shutdown."""
+    directory = os.path.join(str(tmpdir), 'generated', 'params')
+    generated_file = os.path.join(directory, 'params.yaml')
+    output_file = os.path.join(str(tmpdir), 'output')
+    plan = LaunchPlan(
+        processes=[{
+            'name': 'copy',
+            'cmd': [sys.executable, '-c', 'import shutil; shutil.copy({!r}, {!r})'.format(
+                generated_file, output_file)],
+            'cwd': None,
+            'env': None,
+            'shell': False,
+            'sigterm_timeout': '5',
+            'sigkill_timeout': '5',
+            'output': 'log',
+            'log_cmd': False,
+            'files': [generated_file],
+        }],
+        files={generated_file: 'restored'},
+    )
+    ls = LaunchService()
+    ls.include_launch_description(plan.to_launch_description())
+    assert os.path.exists(generated_file)
+    assert 0 == ls.run()
+    with open(output_file, 'r') as f:
+        assert f.read() == 'restored'
+    assert not os.path.exists(os.path.join(str(tmpdir), 'generated'))
+
+
+def test_launch_plan_uncacheable():
+    """Test that deferred actions make a launch plan uncacheable, without waiting for them."""
+    ld = LaunchDescription([
+        DeclareLaunchArgument('name', default_value='deferred'),
+        TimerAction(period=100.0, actions=[
+            ExecuteProcess(cmd=[sys.executable, '--version'], name=LaunchConfiguration('name')),
+        ]),
+        ExecuteProcess(cmd=[sys.executable, '--version'], on_exit=[]),
+    ])
+    plan = LaunchPlan.create(ld)
+    assert not plan.is_cacheable
+    assert len(plan.uncacheable_reasons) == 2
+    assert sorted(process['name'] for process in plan.processes) == [
+        'deferred', os.path.basename(sys.executable)]
+
+
+def test_launch_plan_command_inputs(tmpdir):
+    """Test that the inputs of commands are recorded, so that plans using them go stale."""
+    input_file = os.path.join(str(tmpdir), 'robot.urdf')
+    with open(input_file, 'w') as f:
+        f.write('robot')
+    cache_directory = os.path.join(str(tmpdir), 'cache')
+    plan = LaunchPlan.create(LaunchDescription([
+        ExecuteProcess(cmd=['echo', Command(
+            'cat ' + input_file, cache_inputs=[input_file], cache_directory=cache_directory)]),
+    ]))
+    assert plan.is_cacheable
+    assert list(plan.inputs) == [input_file]
+    assert plan.processes[0]['cmd'] == ['echo', 'robot']
+    assert plan.is_up_to_date()
+    with open(input_file, 'w') as f:
+        f.write('modified robot')
+    assert not plan.is_up_to_date()
+
+
+def test_launch_plan_uncacheable_command_and_function(tmpdir):
+    """Test that commands without inputs, and Python functions, make plans uncacheable."""
+    input_file = os.path.join(str(tmpdir), 'robot.urdf')
+    with open(input_file, 'w') as f:
+        f.write('robot')
+    called = []
+    plan = LaunchPlan.create(LaunchDescription([
+        ExecuteProcess(cmd=['echo', Command('cat ' + input_file)]),
+        OpaqueFunction(function=lambda context: called.append(True)),
+    ]))
+    assert called == [True]
+    assert not plan.is_cacheable
+    reasons = sorted(plan.uncacheable_reasons)
+    assert len(reasons) == 2
+    assert reasons[0].startswith('Command(') and reasons[0].endswith('has no cache inputs')
+    assert reasons[1].startswith("function '")
+
+
+def test_get_launch_plan_key():
+    """Test the keys of launch plans."""
+    key = get_launch_plan_key(
+        launch_file_path='a.launch.py', launch_arguments=['x:=1'], environment={'A': '1'})
+    assert key == get_launch_plan_key(
+        launch_file_path='a.launch.py', launch_arguments=['x:=1'],
+        environment={'A': '1', 'SHLVL': '2'})
+    assert key != get_launch_plan_key(
+        launch_file_path='a.launch.py', launch_arguments=['x:=2'], environment={'A': '1'})
+    assert key != get_launch_plan_key(
+        launch_file_path='a.launch.py', launch_arguments=['x:=1'], environment={'A': '2'})
+    assert key != get_launch_plan_key(
+        launch_file_path='b.launch.py', launch_arguments=['x:=1'], environment={'A': '1'})
@@ -15,10 +15,18 @@
 """Tests for the LaunchService class."""
 
 import queue
+import sys
 import threading
 
 from launch import LaunchDescription
 from launch import LaunchService
+from launch.actions import ExecuteProcess
+from launch.actions import RegisterEventHandler
+from launch.actions import SetLaunchConfiguration
+from launch.conditions import IfCondition
+from launch.conditions import UnlessCondition
+from launch.event_handlers import OnShutdown
+from launch.substitutions import LaunchConfiguration
 from launch.utilities import install_signal_handlers
 
 # Install the signal handlers here, in the hope that this is executed in the
@@ -93,3 +101,66 @@ def test_launch_service_emit_event():
 
     assert ls.run(shutdown_when_idle=True) == 0
     handled_events.get(block=False)
+
+
+def test_launch_service_wakes_up_when_an_entity_completes():
+    """Test that the launch service notices it is idle when an entity completes silently."""
+    from launch.action import Action
+
+    class DelayedAction(Action):
+        """Action which completes later, without emitting any event."""
+
+        def __init__(self):
+            super().__init__()
+            self.__future = None
+
+        def execute(self, context):
+            self.__future = context.asyncio_loop.create_future()
+            context.asyncio_loop.call_later(0.1, self.__future.set_result, None)
+
+        def get_asyncio_future(self):
+            return self.__future
+
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription([DelayedAction()]))
+    return_codes = queue.Queue()
+    t = threading.Thread(target=lambda: return_codes.put(ls.run()), daemon=True)
+    t.start()
+    try:
+        assert return_codes.get(block=True, timeout=5.0) == 0
+    finally:
+        ls.shutdown()
+        t.join(timeout=5.0)
+
+
+def test_launch_service_plan():
+    """Test planning with the LaunchService, without launching anything."""
+    on_shutdown = OnShutdown(on_shutdown=[])
+    process = ExecuteProcess(
+        cmd=[sys.executable, '-c', LaunchConfiguration('code')],
+        name='planned',
+        condition=IfCondition(LaunchConfiguration('enabled')),
+    )
+    ld = LaunchDescription([
+        SetLaunchConfiguration('enabled', 'true'),
+        SetLaunchConfiguration('code', 'raise SystemExit(1)'),
+        process,
+        ExecuteProcess(
+            cmd=[sys.executable, '--version'],
+            condition=UnlessCondition(LaunchConfiguration('enabled')),
+        ),
+        RegisterEventHandler(on_shutdown),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    plan = ls.plan(key='key')
+    assert plan.key == 'key'
+    assert [p['cmd'] for p in plan.processes] == [[sys.executable, '-c', 'raise SystemExit(1)']]
+    assert [(type(c), value) for _, c, value in plan.conditions] == [
+        (IfCondition, True), (UnlessCondition, False)]
+    assert plan.event_handlers == [on_shutdown]
+    phases = [(entity, phase) for entity, phase, _ in plan.timings]
+    assert (ld, 'visit') in phases
+    assert (process, 'visit') in phases
+    assert (process, 'expansion') in phases
+    assert all(seconds >= 0.0 for _, _, seconds in plan.timings)
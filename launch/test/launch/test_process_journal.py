@@ -0,0 +1,289 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the ProcessJournal class."""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+
+from launch import LaunchDescription
+from launch import LaunchService
+from launch import ProcessJournal
+from launch.actions import EmitEvent
+from launch.actions import ExecuteProcess
+from launch.actions import RegisterEventHandler
+from launch.event_handlers import OnProcessExit
+from launch.event_handlers import OnProcessIO
+from launch.event_handlers.on_process_start import OnProcessStart
+from launch.events import Shutdown
+from launch.process_journal import get_process_start_time
+from launch.process_journal import hash_process_command
+
+import pytest
+
+SLEEPER_CMD = [sys.executable, '-c', 'import time; time.sleep(30)']
+
+
+@pytest.fixture
+def sleeper():
+    process = subprocess.Popen(SLEEPER_CMD)
+    yield process
+    process.kill()
+    process.wait()
+
+
+def test_journal_of_launch(tmpdir):
+    journal_path = str(tmpdir.join('journal'))
+    ld = LaunchDescription([ExecuteProcess(cmd=[sys.executable, '-c', 'pass'], name='quick')])
+    ls = LaunchService(process_journal=journal_path)
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    with open(journal_path, 'r') as f:
+        entries = [json.loads(line) for line in f]
+    assert [entry['event'] for entry in entries] == ['started', 'exited']
+    assert entries[0]['name'] == 'quick'
+    assert entries[0]['cmd_hash'] == hash_process_command(
+        [sys.executable, '-c', 'pass'], None, None)
+    # The processes which exited are dropped when the journal is opened again.
+    assert ProcessJournal(journal_path).orphans == []
+    assert os.path.getsize(journal_path) == 0
+
+
+def test_orphans(tmpdir, sleeper):
+    journal_path = str(tmpdir.join('journal'))
+    journal = ProcessJournal(journal_path)
+    journal.record_started(name='sleeper', pid=sleeper.pid, cmd_hash='a')
+    journal.record_started(name='exited', pid=sleeper.pid + 1, cmd_hash='b')
+    journal.record_exited(pid=sleeper.pid + 1)
+    journal.close()
+    # The last line may be incomplete if the launch service was killed while writing it.
+    with open(journal_path, 'a') as f:
+        f.write('{"event": "star')
+    with open(journal_path, 'r') as f:
+        lines = f.readlines()
+    # A process which was started with the same pid, but at another time, is not an orphan.
+    stale_entry = json.loads(lines[0])
+    stale_entry['start_time'] -= 1
+    with open(journal_path, 'a') as f:
+        f.write('\n' + json.dumps(stale_entry) + '\n')
+
+    orphans = ProcessJournal(journal_path).orphans
+    assert len(orphans) == 1
+    assert orphans[0]['name'] == 'sleeper'
+    assert orphans[0]['pid'] == sleeper.pid
+    assert orphans[0]['start_time'] == get_process_start_time(sleeper.pid)
+
+
+@pytest.mark.skipif(not hasattr(os, 'pidfd_open'), reason='needs pidfd support')
+def test_adopt_orphan(tmpdir, sleeper):
+    journal_path = str(tmpdir.join('journal'))
+    journal = ProcessJournal(journal_path)
+    journal.record_started(
+        name='sleeper', pid=sleeper.pid, cmd_hash=hash_process_command(SLEEPER_CMD, None, None))
+    journal.close()
+
+    started_pids = []
+    exited_events = []
+
+    def on_start(event, context):
+        started_pids.append(event.pid)
+        return EmitEvent(event=Shutdown(reason='adopted'))
+
+    process_action = ExecuteProcess(cmd=SLEEPER_CMD, name='sleeper')
+    ld = LaunchDescription([
+        process_action,
+        RegisterEventHandler(OnProcessStart(
+            target_action=process_action,
+            on_start=on_start,
+        )),
+        RegisterEventHandler(OnProcessExit(
+            target_action=process_action,
+            on_exit=lambda event, context: exited_events.append(event),
+        )),
+    ])
+    ls = LaunchService(process_journal=journal_path)
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    assert started_pids == [sleeper.pid]
+    # The adopted process was interrupted on shutdown, like any other.
+    assert sleeper.wait(timeout=5) != 0
+    assert len(exited_events) == 1
+    assert exited_events[0].returncode is None
+    assert ProcessJournal(journal_path).orphans == []
+
+
+@pytest.mark.skipif(not hasattr(os, 'pidfd_open'), reason='needs pidfd support')
+def test_adopted_process_group_leader_signalled_through_pidfd(tmpdir, monkeypatch):
+    # The orphan leads its own process group, like the processes started with process_group.
+    sleeper = subprocess.Popen(SLEEPER_CMD, start_new_session=True)
+    try:
+        journal_path = str(tmpdir.join('journal'))
+        journal = ProcessJournal(journal_path)
+        journal.record_started(
+            name='sleeper', pid=sleeper.pid,
+            cmd_hash=hash_process_command(SLEEPER_CMD, None, None))
+        journal.close()
+        # The pid of an adopted process, so its process group, may be reused at any time.
+        killpg_calls = []
+        monkeypatch.setattr(os, 'killpg', lambda *args: killpg_calls.append(args))
+
+        process_action = ExecuteProcess(cmd=SLEEPER_CMD, name='sleeper', process_group=True)
+        ld = LaunchDescription([
+            process_action,
+            RegisterEventHandler(OnProcessStart(
+                target_action=process_action,
+                on_start=lambda event, context: EmitEvent(event=Shutdown(reason='adopted')),
+            )),
+        ])
+        ls = LaunchService(process_journal=journal_path)
+        ls.include_launch_description(ld)
+        assert 0 == ls.run()
+        assert sleeper.wait(timeout=5) != 0
+        assert killpg_calls == []
+    finally:
+        sleeper.kill()
+        sleeper.wait()
+
+
+def test_unadopted_orphans_are_reported(tmpdir, sleeper, caplog):
+    journal_path = str(tmpdir.join('journal'))
+    journal = ProcessJournal(journal_path)
+    journal.record_started(name='sleeper', pid=sleeper.pid, cmd_hash='not launched again')
+    journal.close()
+
+    ld = LaunchDescription([ExecuteProcess(cmd=[sys.executable, '-c', 'pass'], name='quick')])
+    ls = LaunchService(process_journal=journal_path)
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    warnings = [
+        record.getMessage() for record in caplog.records
+        if record.name == 'launch.ProcessJournal' and record.levelname == 'WARNING'
+    ]
+    assert len(warnings) == 1
+    assert "process 'sleeper' [pid {}]".format(sleeper.pid) in warnings[0]
+    assert 'not adopted' in warnings[0]
+    # The orphan is left running, and can still be adopted later on.
+    assert sleeper.poll() is None
+    assert [orphan['pid'] for orphan in ProcessJournal(journal_path).orphans] == [sleeper.pid]
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.05)
+
+
+def test_journaled_output_is_read_from_files(tmpdir):
+    journal_path = str(tmpdir.join('journal'))
+    stdout = []
+    stderr = []
+    cmd = [sys.executable, '-c', 'import sys; print("out"); print("err", file=sys.stderr)']
+    ld = LaunchDescription([
+        ExecuteProcess(cmd=cmd, name='talker', output='log'),
+        RegisterEventHandler(OnProcessIO(
+            on_stdout=lambda event: stdout.append(event.text),
+            on_stderr=lambda event: stderr.append(event.text),
+        )),
+    ])
+    ls = LaunchService(process_journal=journal_path)
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    assert b''.join(stdout) == b'out\n'
+    assert b''.join(stderr) == b'err\n'
+    with open(journal_path, 'r') as f:
+        output_files = json.loads(f.readline())['output_files']
+    if hasattr(os, 'pidfd_open'):
+        assert sorted(output_files) == ['1', '2']
+    # The files are removed once the process exited.
+    assert all(not os.path.exists(path) for path in output_files.values())
+
+
+def test_journal_is_closed_after_run(tmpdir, monkeypatch):
+    journal_path = str(tmpdir.join('journal'))
+    closed = []
+    monkeypatch.setattr(ProcessJournal, 'close', lambda self: closed.append(self.path))
+    ls = LaunchService(process_journal=journal_path)
+    ls.include_launch_description(LaunchDescription([
+        ExecuteProcess(cmd=[sys.executable, '-c', 'pass'], name='quick'),
+    ]))
+    assert 0 == ls.run()
+    assert closed == [journal_path]
+
+
+@pytest.mark.skipif(not hasattr(os, 'pidfd_open'), reason='needs pidfd support')
+def test_orphans_writing_output_are_adopted(tmpdir):
+    journal_path = str(tmpdir.join('journal'))
+    # Nothing reads the output of the process once the launch service is killed.
+    chatty_cmd = [sys.executable, '-c', textwrap.dedent("""
+        import time
+        while True:
+            print('chatty', flush=True)
+            time.sleep(0.05)
+    """)]
+    launch_script = textwrap.dedent("""
+        import sys
+        from launch import LaunchDescription
+        from launch import LaunchService
+        from launch.actions import ExecuteProcess
+        ls = LaunchService(process_journal=sys.argv[1])
+        ls.include_launch_description(LaunchDescription([
+            ExecuteProcess(cmd={!r}, name='chatty'),
+        ]))
+        ls.run()
+    """).format(chatty_cmd)
+    launcher = subprocess.Popen(
+        [sys.executable, '-c', launch_script, journal_path],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    entry = None
+    try:
+        _wait_for(lambda: os.path.exists(journal_path) and os.path.getsize(journal_path) > 0)
+        with open(journal_path, 'r') as f:
+            entry = json.loads(f.readline())
+        launcher.send_signal(signal.SIGKILL)
+        launcher.wait()
+        # The orphan keeps writing its output, to its files.
+        time.sleep(0.5)
+        assert get_process_start_time(entry['pid']) == entry['start_time']
+
+        stdout = []
+
+        def on_stdout(event):
+            stdout.append(event.text)
+            return EmitEvent(event=Shutdown(reason='adopted'))
+
+        ld = LaunchDescription([
+            ExecuteProcess(cmd=chatty_cmd, name='chatty'),
+            RegisterEventHandler(OnProcessIO(on_stdout=on_stdout)),
+        ])
+        ls = LaunchService(process_journal=journal_path)
+        ls.include_launch_description(ld)
+        assert 0 == ls.run()
+        assert stdout and all(text.startswith(b'chatty\n') for text in stdout)
+        # The adopted process was interrupted on shutdown, and its files removed.
+        _wait_for(lambda: get_process_start_time(entry['pid']) != entry['start_time'])
+        assert os.listdir(journal_path + '.output') == []
+    finally:
+        if launcher.poll() is None:
+            launcher.kill()
+            launcher.wait()
+        if entry is not None and get_process_start_time(entry['pid']) == entry['start_time']:
+            os.kill(entry['pid'], signal.SIGKILL)
+    assert ProcessJournal(journal_path).orphans == []
@@ -0,0 +1,29 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the install_lazy_imports() function."""
+
+import launch.actions
+from launch.actions.emit_event import EmitEvent
+
+import pytest
+
+
+def test_lazy_imports():
+    assert 'EmitEvent' in dir(launch.actions)
+    assert launch.actions.EmitEvent is EmitEvent
+    assert launch.actions.__dict__['EmitEvent'] is EmitEvent
+    with pytest.raises(AttributeError, match="module 'launch.actions' has no attribute 'Foo'"):
+        launch.actions.Foo
@@ -0,0 +1,47 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the LogRecord class and parse_log_records()."""
+
+from launch.utilities import parse_log_records
+
+
+def test_parse_log_records():
+    records = parse_log_records(
+        b'[INFO] [1568281234.123456789] [talker]: Publishing: "Hello [1]"\n'
+        b'plain output\n'
+        b'\x1b[31m[ERROR] [1568281235.5] [ns.listener]: failed\x1b[0m\n'
+        b'[WARN] [1568281236.0] [talker]: incomplete',
+        42.0)
+    assert [record.line for record in records] == [
+        b'[INFO] [1568281234.123456789] [talker]: Publishing: "Hello [1]"',
+        b'plain output',
+        b'\x1b[31m[ERROR] [1568281235.5] [ns.listener]: failed\x1b[0m',
+        b'[WARN] [1568281236.0] [talker]: incomplete',
+    ]
+    assert [record.severity for record in records] == ['INFO', None, 'ERROR', 'WARN']
+    assert [record.level for record in records] == [20, None, 40, 30]
+    assert [record.logger for record in records] == ['talker', None, 'ns.listener', 'talker']
+    assert [record.message for record in records] == [
+        b'Publishing: "Hello [1]"', b'plain output', b'failed', b'incomplete']
+    assert records[0].stamp == 1568281234.123456789
+    assert records[1].stamp is None
+    assert all(record.received_time == 42.0 for record in records)
+
+
+def test_parse_empty_lines():
+    assert parse_log_records(b'', 0.0) == []
+    records = parse_log_records(b'\n\n', 0.0)
+    assert [record.message for record in records] == [b'', b'']
@@ -0,0 +1,80 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the OutputFilter class."""
+
+from launch.utilities import OutputFilter
+
+import pytest
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_keep_and_drop():
+    output_filter = OutputFilter(keep=['WARN', 'ERROR'], drop=['spam'])
+    assert output_filter.filter(
+        b'INFO hello\nWARN disk\nWARN spam spam\nERROR crash\n'
+    ) == b'WARN disk\nERROR crash\n'
+
+
+def test_incomplete_lines_are_held_back():
+    output_filter = OutputFilter(drop=['^DEBUG'])
+    assert output_filter.filter(b'DEB') == b''
+    assert output_filter.filter(b'UG noise\nINFO start') == b''
+    assert output_filter.filter(b'ed\nINFO') == b'INFO started\n'
+    assert output_filter.flush() == b'INFO'
+    assert output_filter.flush() == b''
+
+
+def test_rate_limit():
+    clock = FakeClock()
+    output_filter = OutputFilter(rate_limit=2, clock=clock)
+    assert output_filter.filter(b'1\n2\n3\n4\n') == b'1\n2\n'
+    assert output_filter.suppressed == 2
+    clock.time = 0.5
+    assert output_filter.filter(b'5\n6\n') == b'[output rate limit: 2 lines suppressed]\n5\n'
+    assert output_filter.suppressed == 1
+    assert output_filter.flush() == b'[output rate limit: 1 lines suppressed]\n'
+
+
+def test_rate_limit_only_counts_kept_lines():
+    output_filter = OutputFilter(drop=['noise'], rate_limit=1, clock=FakeClock())
+    assert output_filter.filter(b'noise\nnoise\nsignal\n') == b'signal\n'
+    assert output_filter.suppressed == 0
+
+
+def test_invalid_rate_limit():
+    with pytest.raises(ValueError):
+        OutputFilter(rate_limit=0)
+
+
+def test_inline_flags_only_apply_to_their_pattern():
+    output_filter = OutputFilter(drop=['^debug', '(?i)spam', '(?i)(?m)^eggs$'])
+    # The flags of a pattern would apply to all of them if they were global.
+    assert output_filter.filter(b'DEBUG x\ndebug y\nSPAM z\nEGGS\n') == b'DEBUG x\n'
+
+
+def test_invalid_patterns():
+    with pytest.raises(ValueError, match='invalid regular expression'):
+        OutputFilter(keep=['(unbalanced'])
+    # Inline flags are only valid at the start of a pattern.
+    with pytest.raises(ValueError, match="'debug.*\\(\\?i\\)'"):
+        OutputFilter(drop=['debug.*(?i)'])
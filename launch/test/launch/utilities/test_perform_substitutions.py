@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Tests for the perform_substitutions() function."""
+"""Tests for the perform_substitutions() functions."""
+
+import asyncio
+import time
 
 from launch import LaunchContext, Substitution
 from launch.utilities import perform_substitutions
+from launch.utilities import perform_substitutions_async
 
 import pytest
 
@@ -61,3 +65,43 @@ def test_invalid_substitutions():
         perform_substitutions(context, [mock_sub, [mock_sub]])
     with pytest.raises(NotImplementedError):
         perform_substitutions(context, [Substitution()])
+
+
+def test_perform_substitutions_async():
+    """Test the perform_substitutions_async() function."""
+    loop = asyncio.new_event_loop()
+    context = LaunchContext()
+    context._set_asyncio_loop(loop)
+
+    class MockSubstitution(Substitution):
+
+        def perform(self, context):
+            return 'Mock substitution'
+
+    class MockBlockingSubstitution(Substitution):
+
+        def __init__(self, text):
+            self.__text = text
+
+        def perform(self, context):
+            time.sleep(0.5)
+            return self.__text
+
+        async def perform_async(self, context):
+            return await context.asyncio_loop.run_in_executor(None, self.perform, context)
+
+    try:
+        # Synchronous substitutions are used as a fallback.
+        assert 'Mock substitution' == loop.run_until_complete(
+            perform_substitutions_async(context, [MockSubstitution()]))
+        # Blocking substitutions are performed concurrently, and the order is maintained.
+        start = time.monotonic()
+        result = loop.run_until_complete(perform_substitutions_async(
+            context,
+            [MockBlockingSubstitution(str(i)) for i in range(4)] + [MockSubstitution()]))
+        assert time.monotonic() - start < 1.5
+        assert '0123Mock substitution' == result
+        with pytest.raises(NotImplementedError):
+            loop.run_until_complete(perform_substitutions_async(context, [Substitution()]))
+    finally:
+        loop.close()
@@ -0,0 +1,147 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the pidfd based process backend."""
+
+import asyncio
+import os
+import signal
+import sys
+import threading
+import time
+import types
+
+from launch.utilities import async_execute_process_with_pidfd
+from launch.utilities import is_pidfd_supported
+from launch.utilities import pidfd_subprocess_impl
+from osrf_pycommon.process_utils import async_execute_process
+from osrf_pycommon.process_utils import AsyncSubprocessProtocol
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not is_pidfd_supported(), reason='needs pidfd support')
+
+
+class CollectingProtocol(AsyncSubprocessProtocol):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.output = b''
+
+    def on_stdout_received(self, data):
+        self.output += data
+
+    def on_stderr_received(self, data):
+        self.output += data
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_output_and_returncode():
+    async def execute():
+        transport, protocol = await async_execute_process_with_pidfd(
+            CollectingProtocol,
+            [sys.executable, '-c', 'import sys; print("x" * 100000); sys.exit(3)'],
+            stderr_to_stdout=False)
+        return await protocol.complete, protocol.output
+
+    returncode, output = run(execute())
+    assert returncode == 3
+    # All of the output is received before the process is reported as exited.
+    assert output == b'x' * 100000 + b'\n'
+
+
+def test_send_signal():
+    async def execute():
+        transport, protocol = await async_execute_process_with_pidfd(
+            CollectingProtocol, [sys.executable, '-c', 'import time; time.sleep(30)'])
+        transport.send_signal(signal.SIGTERM)
+        return await protocol.complete
+
+    assert run(execute()) == -signal.SIGTERM
+
+
+def test_pipes_kept_open_by_children():
+    async def execute():
+        transport, protocol = await async_execute_process_with_pidfd(
+            CollectingProtocol, ['sleep 30 & echo $!'], shell=True)
+        start = time.monotonic()
+        returncode = await protocol.complete
+        return returncode, protocol.output, time.monotonic() - start
+
+    returncode, output, duration = run(execute())
+    os.kill(int(output), signal.SIGKILL)
+    # The exit is reported, along with the output so far, even though the pipes are still open.
+    assert returncode == 0
+    assert duration < 5.0
+
+
+@pytest.mark.parametrize('version_info', [(3, 8), (3, 11)])
+def test_new_process_group(monkeypatch, version_info):
+    # Before Python 3.11, a new session is started rather than only a new process group.
+    monkeypatch.setattr(
+        pidfd_subprocess_impl, 'sys', types.SimpleNamespace(version_info=version_info))
+    if sys.version_info < version_info:
+        pytest.skip('needs Python {}.{}'.format(*version_info))
+
+    async def execute():
+        transport, protocol = await async_execute_process_with_pidfd(
+            CollectingProtocol,
+            [sys.executable, '-c', 'import os; print(os.getpgid(0), os.getsid(0))'],
+            new_process_group=True)
+        return transport.get_pid(), await protocol.complete, protocol.output
+
+    pid, returncode, output = run(execute())
+    assert returncode == 0
+    pgid, sid = [int(x) for x in output.split()]
+    assert pgid == pid
+    if version_info < (3, 11):
+        assert sid == pid
+
+
+def test_outside_of_main_thread():
+    results = []
+
+    def target():
+        async def execute():
+            transport, protocol = await async_execute_process_with_pidfd(
+                CollectingProtocol, ['echo', 'hello'], shell=True)
+            return await protocol.complete, protocol.output
+
+        results.append(run(execute()))
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    assert results == [(0, b'hello\n')]
+
+
+def test_short_lived_processes():
+    """Test executing many short-lived processes at once, with both backends."""
+    async def execute_many(execute_process):
+        async def execute_one():
+            transport, protocol = await execute_process(CollectingProtocol, ['true'])
+            return await protocol.complete
+
+        return await asyncio.gather(*[execute_one() for _ in range(20)])
+
+    for execute_process in (async_execute_process_with_pidfd, async_execute_process):
+        assert run(execute_many(execute_process)) == [0] * 20
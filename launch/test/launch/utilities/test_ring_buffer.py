@@ -0,0 +1,50 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the RingBuffer class."""
+
+from launch.utilities import RingBuffer
+
+import pytest
+
+
+def test_empty():
+    assert RingBuffer(4).getvalue() == b''
+
+
+def test_wraparound():
+    ring_buffer = RingBuffer(8)
+    ring_buffer.write(b'abcde')
+    assert ring_buffer.getvalue() == b'abcde'
+    ring_buffer.write(b'fgh')
+    assert ring_buffer.getvalue() == b'abcdefgh'
+    ring_buffer.write(b'ijk')
+    assert ring_buffer.getvalue() == b'defghijk'
+    ring_buffer.write(b'lmnopq')
+    assert ring_buffer.getvalue() == b'jklmnopq'
+
+
+def test_write_larger_than_size():
+    ring_buffer = RingBuffer(4)
+    ring_buffer.write(b'ab')
+    ring_buffer.write(b'0123456789')
+    assert ring_buffer.getvalue() == b'6789'
+    ring_buffer.write(b'x')
+    assert ring_buffer.getvalue() == b'789x'
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
@@ -0,0 +1,107 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the RotatingLogFile class."""
+
+import bisect
+import gzip
+import os
+
+from launch.utilities import read_log_index
+from launch.utilities import RotatingLogFile
+
+import pytest
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_rotation_by_size(tmpdir):
+    log_file = RotatingLogFile(str(tmpdir.join('talker')), max_bytes=10, compression=None)
+    for line in [b'aaaa\n', b'bbbb\n', b'cccc\n', b'0123456789abc\n']:
+        log_file.write(line)
+    log_file.close()
+    assert log_file.segment_paths == [
+        str(tmpdir.join('talker.{}.log'.format(i))) for i in (0, 1, 2)]
+    contents = []
+    for path in log_file.segment_paths:
+        with open(path, 'rb') as f:
+            contents.append(f.read())
+    assert contents == [b'aaaa\nbbbb\n', b'cccc\n', b'0123456789abc\n']
+
+
+def test_rotation_by_age_and_index(tmpdir):
+    clock = FakeClock()
+    log_file = RotatingLogFile(
+        str(tmpdir.join('talker')), max_bytes=None, max_age=60.0, compression=None,
+        index_interval=1.0, clock=clock)
+    for i in range(100):
+        clock.time = i * 0.5
+        log_file.write('{:02}\n'.format(i).encode())
+    log_file.close()
+    assert len(log_file.segment_paths) == 1
+    index = read_log_index(str(tmpdir.join('talker.0.index')))
+    assert index[:3] == [(0.0, 0), (1.0, 6), (2.0, 12)]
+    assert len(index) == 50
+    # Seek to the output received at 10 seconds.
+    _, offset = index[bisect.bisect(index, (10.0, float('inf'))) - 1]
+    with open(log_file.segment_paths[0], 'rb') as f:
+        f.seek(offset)
+        assert f.readline() == b'20\n'
+
+    clock.time = 100.0
+    log_file.write(b'new\n')
+    clock.time = 200.0
+    log_file.write(b'newer\n')
+    log_file.close()
+    assert log_file.segment_paths[1:] == [
+        str(tmpdir.join('talker.1.log')), str(tmpdir.join('talker.2.log'))]
+
+
+def test_compression(tmpdir):
+    log_file = RotatingLogFile(str(tmpdir.join('talker')), max_bytes=1000)
+    for i in range(1000):
+        log_file.write(b'[INFO] [talker]: Publishing: "Hello World"\n')
+    log_file.close(wait=True)
+    assert len(log_file.segment_paths) > 1
+    data = b''
+    for path in log_file.segment_paths:
+        assert not os.path.exists(path)
+        assert os.path.exists(path[:-len('.log')] + '.index')
+        with gzip.open(path + '.gz', 'rb') as f:
+            data += f.read()
+    assert data == b'[INFO] [talker]: Publishing: "Hello World"\n' * 1000
+
+
+def test_existing_segments_are_kept(tmpdir):
+    tmpdir.join('talker.0.log.gz').write('previous run')
+    log_file = RotatingLogFile(str(tmpdir.join('talker')), compression=None)
+    log_file.write(b'hello\n')
+    log_file.close()
+    assert log_file.segment_paths == [str(tmpdir.join('talker.1.log'))]
+    assert tmpdir.join('talker.0.log.gz').read() == 'previous run'
+
+
+def test_invalid_arguments(tmpdir):
+    with pytest.raises(ValueError):
+        RotatingLogFile(str(tmpdir.join('talker')), compression='bzip2')
+    with pytest.raises(ValueError):
+        RotatingLogFile(str(tmpdir.join('talker')), max_bytes=0)
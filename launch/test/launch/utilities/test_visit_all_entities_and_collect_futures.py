@@ -15,9 +15,11 @@
 """Tests for the visit_all_entities_and_collect_futures() function."""
 
 import asyncio
+import sys
 
 from launch import LaunchContext, LaunchDescriptionEntity
 from launch.utilities import visit_all_entities_and_collect_futures
+from launch.utilities import visit_all_entities_and_iterate_futures
 
 
 def test_visit_all_entities_and_collect_futures_with_future():
@@ -96,3 +98,69 @@ def test_visit_all_entities_and_collect_futures_sub_entities():
         else:
             assert isinstance(future_pair[0], MockEntityDescriptionWithFuture)
         assert isinstance(future_pair[1], asyncio.Future)
+
+
+class MockEntityDescriptionTree(LaunchDescriptionEntity):
+
+    def __init__(self, depth, width, visited, parent=None, index=0):
+        self.__depth = depth
+        self.__width = width
+        self.__visited = visited
+        self.__parent = parent
+        self.__index = index
+
+    @property
+    def name(self):
+        if self.__parent is None:
+            return str(self.__index)
+        return '{}.{}'.format(self.__parent.name, self.__index)
+
+    def get_asyncio_future(self):
+        return asyncio.Future()
+
+    def visit(self, context):
+        self.__visited.append(self)
+        if self.__depth == 0:
+            return None
+        return [
+            MockEntityDescriptionTree(self.__depth - 1, self.__width, self.__visited, self, i)
+            for i in range(self.__width)
+        ]
+
+
+def test_visit_all_entities_and_iterate_futures_order():
+    """Test that entities are visited and their futures yielded depth-first, in order."""
+    context = LaunchContext()
+    visited = []
+    futures = visit_all_entities_and_iterate_futures(
+        MockEntityDescriptionTree(2, 2, visited), context)
+    # Nothing is visited until the futures are consumed.
+    assert visited == []
+    entity, future = next(futures)
+    assert entity.name == '0'
+    assert visited == [entity]
+    names = [entity.name for entity, future in futures]
+    expected = ['0.0', '0.0.0', '0.0.1', '0.1', '0.1.0', '0.1.1']
+    assert names == expected
+    assert [entity.name for entity in visited] == ['0'] + expected
+
+
+def test_visit_all_entities_and_collect_futures_deep_nesting():
+    """Test that nesting deeper than the recursion limit is supported."""
+    context = LaunchContext()
+    depth = sys.getrecursionlimit() * 2
+    visited = []
+    result = visit_all_entities_and_collect_futures(
+        MockEntityDescriptionTree(depth, 1, visited), context)
+    assert len(result) == depth + 1
+    assert len(visited) == depth + 1
+
+
+def test_visit_all_entities_and_collect_futures_wide_and_deep():
+    """Test visiting descriptions which are either deep or wide."""
+    context = LaunchContext()
+    for depth, width in ((100, 1), (1, 100)):
+        visited = []
+        result = visit_all_entities_and_collect_futures(
+            MockEntityDescriptionTree(depth, width, visited), context)
+        assert len(result) == len(visited) == depth * width + 1
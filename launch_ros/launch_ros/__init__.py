@@ -14,16 +14,27 @@
 
 """Main entry point for the `launch_ros` package."""
 
-from . import actions
-from . import event_handlers
-from . import events
-from . import substitutions
-from .default_launch_description import get_default_launch_description
+from launch.utilities import install_lazy_imports
+
+_module_names = {
+    'actions': 'actions',
+    'descriptions': 'descriptions',
+    'event_handlers': 'event_handlers',
+    'events': 'events',
+    'substitutions': 'substitutions',
+    'get_default_launch_description': 'default_launch_description',
+    # Not in __all__, but historically available after `import launch_ros`.
+    'utilities': 'utilities',
+}
 
 __all__ = [
     'actions',
+    'descriptions',
     'event_handlers',
     'events',
     'substitutions',
     'get_default_launch_description',
 ]
+
+
+install_lazy_imports(globals(), _module_names)
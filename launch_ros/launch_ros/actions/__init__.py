@@ -14,10 +14,23 @@
 
 """actions Module."""
 
-from .lifecycle_node import LifecycleNode
-from .node import Node
+from launch.utilities import install_lazy_imports
+
+_module_names = {
+    'ComposableNodeContainer': 'composable_node_container',
+    'LifecycleManager': 'lifecycle_manager',
+    'LifecycleNode': 'lifecycle_node',
+    'LoadComposableNodes': 'load_composable_nodes',
+    'Node': 'node',
+}
 
 __all__ = [
+    'ComposableNodeContainer',
+    'LifecycleManager',
     'LifecycleNode',
+    'LoadComposableNodes',
     'Node',
 ]
+
+
+install_lazy_imports(globals(), _module_names)
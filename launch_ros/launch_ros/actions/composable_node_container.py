@@ -0,0 +1,77 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ComposableNodeContainer action."""
+
+from typing import List
+from typing import Optional
+
+from launch.action import Action
+from launch.launch_context import LaunchContext
+from launch.some_substitutions_type import SomeSubstitutionsType
+
+from .load_composable_nodes import LoadComposableNodes
+from .node import Node
+from ..descriptions import ComposableNode
+
+
+class ComposableNodeContainer(Node):
+    """Action that executes a container ROS node for composable ROS nodes."""
+
+    def __init__(
+        self,
+        *,
+        node_name: SomeSubstitutionsType,
+        node_namespace: SomeSubstitutionsType,
+        composable_node_descriptions: Optional[List[ComposableNode]] = None,
+        **kwargs
+    ) -> None:
+        """
+        Construct a ComposableNodeContainer action.
+
+        Most arguments are forwarded to :class:`launch_ros.actions.Node`, so
+        see the documentation of that class for further details.
+        The `package` and `node_executable` must name a container executable,
+        e.g. `rclcpp_components` and `component_container`, which provides
+        the `_container/load_node` service.
+
+        Once the container is launched, the given composable nodes are loaded
+        into it with a :class:`launch_ros.actions.LoadComposableNodes` action.
+        More composable nodes can be loaded later, with other
+        LoadComposableNodes actions targeting this action.
+
+        :param: node_name the name of the container node, which is required
+            to find its services
+        :param: node_namespace the ros namespace of the container node
+        :param: composable_node_descriptions optional descriptions of
+            composable nodes to be loaded into the container
+        """
+        super().__init__(node_name=node_name, node_namespace=node_namespace, **kwargs)
+        self.__composable_node_descriptions = composable_node_descriptions
+
+    def execute(self, context: LaunchContext) -> Optional[List[Action]]:
+        """
+        Execute the action.
+
+        Most work is delegated to :meth:`launch_ros.actions.Node.execute`,
+        except for the composable nodes load action if it applies.
+        """
+        actions = super().execute(context)
+        if not self.__composable_node_descriptions:
+            return actions
+        load_actions = [LoadComposableNodes(
+            composable_node_descriptions=self.__composable_node_descriptions,
+            target_container=self,
+        )]  # type: List[Action]
+        return load_actions if actions is None else actions + load_actions
@@ -0,0 +1,295 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for the LifecycleManager action."""
+
+import asyncio
+import logging
+import time
+from typing import cast
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set  # noqa: F401
+from typing import Text
+from typing import Tuple  # noqa: F401
+
+import launch
+from launch.action import Action
+from launch.event_handlers import OnShutdown
+from launch.events import Shutdown
+from launch.launch_plan import get_launch_plan
+
+import lifecycle_msgs.msg
+
+from .lifecycle_node import LifecycleNode
+from ..events.lifecycle import ChangeState
+from ..events.lifecycle import ChangeStateCompleted
+from ..events.lifecycle import StateTransition
+
+_logger = logging.getLogger(name='launch_ros')
+
+# The transitions which bring an unconfigured lifecycle node to the active state, and the
+# primary state which each of them ends in.
+_TRANSITIONS_TO_ACTIVE = [
+    (
+        lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE,
+        lifecycle_msgs.msg.State.PRIMARY_STATE_INACTIVE,
+    ),
+    (
+        lifecycle_msgs.msg.Transition.TRANSITION_ACTIVATE,
+        lifecycle_msgs.msg.State.PRIMARY_STATE_ACTIVE,
+    ),
+]
+
+_PRIMARY_STATES = frozenset([
+    lifecycle_msgs.msg.State.PRIMARY_STATE_UNKNOWN,
+    lifecycle_msgs.msg.State.PRIMARY_STATE_UNCONFIGURED,
+    lifecycle_msgs.msg.State.PRIMARY_STATE_INACTIVE,
+    lifecycle_msgs.msg.State.PRIMARY_STATE_ACTIVE,
+    lifecycle_msgs.msg.State.PRIMARY_STATE_FINALIZED,
+])
+
+
+def _sort_topologically(
+    dependencies: Mapping[LifecycleNode, Iterable[LifecycleNode]]
+) -> List[List[LifecycleNode]]:
+    """Return the levels of the graph, where each node only depends on nodes of lower levels."""
+    remaining = {}  # type: Dict[LifecycleNode, Set[LifecycleNode]]
+    for node, node_dependencies in dependencies.items():
+        remaining.setdefault(node, set()).update(node_dependencies)
+        for dependency in node_dependencies:
+            remaining.setdefault(dependency, set())
+    levels = []  # type: List[List[LifecycleNode]]
+    while remaining:
+        level = [node for node, node_dependencies in remaining.items() if not node_dependencies]
+        if not level:
+            # The names of the nodes are not known before they are executed.
+            raise ValueError(
+                'lifecycle node dependencies have a cycle, between {} lifecycle nodes'.format(
+                    len(remaining)))
+        for node in level:
+            del remaining[node]
+        for node_dependencies in remaining.values():
+            node_dependencies.difference_update(level)
+        levels.append(level)
+    return levels
+
+
+class LifecycleManager(Action):
+    """
+    Action that brings lifecycle nodes to the active state, in dependency order.
+
+    The lifecycle nodes are given as a directed acyclic graph, mapping each
+    lifecycle node to the lifecycle nodes it depends on.
+    Each lifecycle node is configured and then activated, by emitting
+    :class:`launch_ros.events.lifecycle.ChangeState` events targeted at it,
+    as soon as all of the lifecycle nodes it depends on are active, so all of
+    the lifecycle nodes whose dependencies are met transition in parallel.
+
+    The states of the lifecycle nodes are tracked with the
+    :class:`launch_ros.events.lifecycle.StateTransition` events they emit,
+    and transitions to a state which is already reached are skipped.
+
+    If a transition fails, or doesn't reach the expected state within the
+    transition timeout, the remaining transitions are abandoned and the
+    launch system is shut down.
+
+    The time taken by each transition of each lifecycle node is recorded, see
+    :py:attr:`transition_latencies`.
+
+    The given lifecycle nodes must be launched before this action is executed,
+    e.g. by placing this action after them in the same launch description.
+    """
+
+    def __init__(
+        self,
+        *,
+        lifecycle_nodes: Mapping[LifecycleNode, Iterable[LifecycleNode]],
+        transition_timeout: float = 10.0,
+        **kwargs
+    ) -> None:
+        """
+        Constructor.
+
+        :param: lifecycle_nodes maps each lifecycle node to the lifecycle
+            nodes which must be active before it is configured, lifecycle nodes
+            which only appear as dependencies are managed as well
+        :param: transition_timeout is the time, in seconds, each transition of
+            each lifecycle node may take, including waiting for its change state
+            service to become available
+        :raises: ValueError if the dependencies have a cycle
+        """
+        super().__init__(**kwargs)
+        self.__dependencies = {
+            node: list(node_dependencies) for node, node_dependencies in lifecycle_nodes.items()
+        }
+        self.__levels = _sort_topologically(self.__dependencies)
+        self.__transition_timeout = transition_timeout
+        self.__states = {}  # type: Dict[LifecycleNode, int]
+        self.__waiters = {}  # type: Dict[LifecycleNode, Tuple[int, asyncio.Future]]
+        self.__change_state_events = {}  # type: Dict[ChangeState, LifecycleNode]
+        self.__transition_latencies = {}  # type: Dict[Text, Dict[Text, float]]
+
+    @property
+    def levels(self) -> List[List[LifecycleNode]]:
+        """Getter for levels, the lifecycle nodes grouped by their depth in the graph."""
+        return self.__levels
+
+    @property
+    def transition_timeout(self) -> float:
+        """Getter for transition_timeout."""
+        return self.__transition_timeout
+
+    @property
+    def transition_latencies(self) -> Dict[Text, Dict[Text, float]]:
+        """
+        Getter for transition_latencies.
+
+        This maps the name of each lifecycle node to the time, in seconds, it
+        took to make each of its transitions, by transition name, e.g.
+        'TRANSITION_CONFIGURE', measured from the emission of the ChangeState
+        event to the reception of the StateTransition event of the goal state.
+        """
+        return self.__transition_latencies
+
+    def __on_state_transition(self, context: launch.LaunchContext) -> None:
+        event = cast(StateTransition, context.locals.event)
+        state_id = event.msg.goal_state.id
+        self.__states[event.action] = state_id
+        if event.action not in self.__waiters or state_id not in _PRIMARY_STATES:
+            return
+        goal_state_id, future = self.__waiters[event.action]
+        if future.done():
+            return
+        if state_id == goal_state_id:
+            future.set_result(None)
+        else:
+            future.set_exception(RuntimeError("transition ended in state '{}'".format(
+                ChangeState.valid_states[state_id])))
+
+    def __on_change_state_completed(self, context: launch.LaunchContext) -> None:
+        event = cast(ChangeStateCompleted, context.locals.event)
+        node = self.__change_state_events.pop(event.change_state_event)
+        if event.succeeded or node not in self.__waiters:
+            return
+        _, future = self.__waiters[node]
+        if not future.done():
+            future.set_exception(RuntimeError('change state service call failed'))
+
+    async def __transition(
+        self,
+        node: LifecycleNode,
+        transition_id: int,
+        goal_state_id: int,
+        context: launch.LaunchContext
+    ) -> None:
+        if self.__states.get(node) == goal_state_id:
+            return
+        future = context.asyncio_loop.create_future()
+        self.__waiters[node] = (goal_state_id, future)
+        event = ChangeState(
+            lifecycle_node_matcher=lambda lifecycle_node: lifecycle_node is node,
+            transition_id=transition_id)
+        self.__change_state_events[event] = node
+        transition = ChangeState.valid_transitions[transition_id]
+        start = time.monotonic()
+        context.emit_event_sync(event)
+        try:
+            await asyncio.wait_for(future, self.__transition_timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError("transition '{}' of lifecycle node '{}' timed out after {} s"
+                               .format(transition, node.node_name, self.__transition_timeout))
+        except RuntimeError as exc:
+            raise RuntimeError("transition '{}' of lifecycle node '{}' failed: {}".format(
+                transition, node.node_name, exc))
+        finally:
+            del self.__waiters[node]
+        latency = time.monotonic() - start
+        self.__transition_latencies.setdefault(node.node_name, {})[transition] = latency
+        _logger.debug("lifecycle node '{}' made transition '{}' in {:.3f} s".format(
+            node.node_name, transition, latency))
+
+    async def __activate(
+        self,
+        node: LifecycleNode,
+        dependencies: List['asyncio.Task'],
+        context: launch.LaunchContext
+    ) -> None:
+        if dependencies:
+            await asyncio.gather(*dependencies)
+        for transition_id, goal_state_id in _TRANSITIONS_TO_ACTIVE:
+            await self.__transition(node, transition_id, goal_state_id, context)
+
+    async def __manage(self, context: launch.LaunchContext, event_handlers) -> None:
+        tasks = {}  # type: Dict[LifecycleNode, asyncio.Task]
+        for level in self.__levels:
+            for node in level:
+                tasks[node] = context.asyncio_loop.create_task(self.__activate(
+                    node,
+                    [tasks[dependency] for dependency in self.__dependencies.get(node, [])],
+                    context))
+        try:
+            await asyncio.gather(*tasks.values())
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            if not context.is_shutdown:
+                _logger.error(
+                    'Failed to bring lifecycle nodes to the active state: {}'.format(exc))
+                context.emit_event_sync(Shutdown(reason=str(exc)))
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            for event_handler in event_handlers:
+                context.unregister_event_handler(event_handler)
+
+    def execute(self, context: launch.LaunchContext) -> Optional[List[Action]]:
+        """Execute the action."""
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            # State transitions are driven by events, which a launch plan can't replay.
+            launch_plan.add_uncacheable_reason('lifecycle nodes are managed')
+            return None
+        nodes = set(node for level in self.__levels for node in level)
+        event_handlers = [
+            launch.EventHandler(
+                matcher=lambda event: (
+                    isinstance(event, StateTransition) and event.action in nodes
+                ),
+                entities=[launch.actions.OpaqueFunction(function=self.__on_state_transition)],
+            ),
+            launch.EventHandler(
+                matcher=lambda event: (
+                    isinstance(event, ChangeStateCompleted) and
+                    event.change_state_event in self.__change_state_events
+                ),
+                entities=[
+                    launch.actions.OpaqueFunction(function=self.__on_change_state_completed),
+                ],
+            ),
+        ]
+        for event_handler in event_handlers:
+            context.register_event_handler(event_handler)
+        task = context.asyncio_loop.create_task(self.__manage(context, event_handlers))
+
+        def cancel(event, context):
+            task.cancel()
+
+        context.register_event_handler(OnShutdown(on_shutdown=cancel))
+        context.add_completion_future(task)
+        return None
@@ -14,25 +14,79 @@
 
 """Module for the LifecycleNode action."""
 
+import asyncio
 import functools
 import logging
+from typing import Any  # noqa: F401
 from typing import cast
+from typing import Dict  # noqa: F401
 from typing import List
 from typing import Optional
 from typing import Text
 
 import launch
 from launch.action import Action
+from launch.launch_plan import get_launch_plan
 
 import lifecycle_msgs.msg
 import lifecycle_msgs.srv
 
 from .node import Node
 from ..events.lifecycle import ChangeState
+from ..events.lifecycle import ChangeStateCompleted
 from ..events.lifecycle import StateTransition
+from ..utilities import call_service_async
 
 _logger = logging.getLogger(name='launch_ros')
 
+_CHANGE_STATE_BATCHES_GLOBAL_NAME = 'launch_ros_change_state_batches'
+
+
+class _ChangeStateBatch:
+    """The state transitions requested from lifecycle nodes by one ChangeState event."""
+
+    def __init__(self, event: ChangeState, context: launch.LaunchContext) -> None:
+        self.__event = event
+        self.__semaphore = None  # type: Optional[asyncio.Semaphore]
+        if event.max_concurrent_transitions is not None:
+            self.__semaphore = asyncio.Semaphore(event.max_concurrent_transitions)
+        self.__nodes = []  # type: List[LifecycleNode]
+        self.__tasks = []  # type: List[asyncio.Task]
+        context.add_completion_future(
+            context.asyncio_loop.create_task(self.__wait_and_emit(context)))
+
+    @classmethod
+    def get(cls, event: ChangeState, context: launch.LaunchContext) -> '_ChangeStateBatch':
+        """Return the batch of the given event, creating it for the first targeted node."""
+        batches = context.get_locals_as_dict().get(_CHANGE_STATE_BATCHES_GLOBAL_NAME)
+        if batches is None:
+            batches = {}  # type: Dict[ChangeState, _ChangeStateBatch]
+            context.extend_globals({_CHANGE_STATE_BATCHES_GLOBAL_NAME: batches})
+        if event not in batches:
+            batches[event] = cls(event, context)
+        return batches[event]
+
+    def add(self, node: 'LifecycleNode', coroutine: Any, context: launch.LaunchContext) -> None:
+        """Add the coroutine changing the state of a node, which returns its success."""
+        self.__nodes.append(node)
+        self.__tasks.append(context.asyncio_loop.create_task(self.__limit(coroutine)))
+
+    async def __limit(self, coroutine: Any) -> bool:
+        if self.__semaphore is None:
+            return await coroutine
+        async with self.__semaphore:
+            return await coroutine
+
+    async def __wait_and_emit(self, context: launch.LaunchContext) -> None:
+        # The event handlers of an event are all executed before the loop runs this, so by now
+        # every targeted node has added its transition.
+        results = await asyncio.gather(*self.__tasks)
+        context.get_locals_as_dict()[_CHANGE_STATE_BATCHES_GLOBAL_NAME].pop(self.__event)
+        context.emit_event_sync(ChangeStateCompleted(
+            change_state_event=self.__event,
+            results=list(zip(self.__nodes, results)),
+        ))
+
 
 class LifecycleNode(Node):
     """Action that executes a ROS lifecycle node."""
@@ -53,6 +107,11 @@ class LifecycleNode(Node):
               "/<node_name>/transition_event" topic, indicating the lifecycle
               node represented by this action changed state
 
+        - :class:`launch.events.lifecycle.ChangeStateCompleted`:
+
+            - this event is emitted once per ChangeState event, by the
+              lifecycle nodes it targeted, when all of them are done
+
         This action also handles some events related to lifecycle:
 
         - :class:`launch.events.lifecycle.ChangeState`
@@ -60,6 +119,10 @@ class LifecycleNode(Node):
           - this event can be targeted to a single lifecycle node, or more than
             one, or even all lifecycle nodes, and it requests the targeted nodes
             to change state, see its documentation for more details.
+          - the change state services of the targeted nodes are called
+            asynchronously and concurrently, up to the limit given by the event,
+            without blocking any thread while waiting for the services or for
+            their responses.
         """
         super().__init__(node_name=node_name, **kwargs)
         self.__rclpy_subscription = None
@@ -75,18 +138,21 @@ class LifecycleNode(Node):
             _logger.error(
                 "Exception in handling of 'lifecycle.msg.TransitionEvent': {}".format(exc))
 
-    def _call_change_state(self, request, context: launch.LaunchContext):
-        while not self.__rclpy_change_state_client.wait_for_service(timeout_sec=1.0):
-            if context.is_shutdown:
-                _logger.warn("Abandoning wait for the '{}' service, due to shutdown.".format(
-                    self.__rclpy_change_state_client.srv_name))
-                return
-        response = self.__rclpy_change_state_client.call(request)
-        if not response.success:
+    async def _call_change_state(self, request, context: launch.LaunchContext) -> bool:
+        try:
+            response = await call_service_async(
+                context, self.__rclpy_change_state_client, request)
+        except Exception as exc:
+            _logger.error("Failed to call the change state service of LifecycleNode '{}': {}"
+                          .format(self.node_name, exc))
+            response = None
+        if response is None or not response.success:
             _logger.error("Failed to make transition '{}' for LifecycleNode '{}'".format(
                 ChangeState.valid_transitions[request.transition.id],
                 self.node_name,
             ))
+            return False
+        return True
 
     def _on_change_state_event(self, context: launch.LaunchContext) -> None:
         typed_event = cast(ChangeState, context.locals.event)
@@ -94,8 +160,8 @@ class LifecycleNode(Node):
             return None
         request = lifecycle_msgs.srv.ChangeState.Request()
         request.transition.id = typed_event.transition_id
-        context.add_completion_future(
-            context.asyncio_loop.run_in_executor(None, self._call_change_state, request, context))
+        _ChangeStateBatch.get(typed_event, context).add(
+            self, self._call_change_state(request, context), context)
 
     def execute(self, context: launch.LaunchContext) -> Optional[List[Action]]:
         """
@@ -106,6 +172,12 @@ class LifecycleNode(Node):
         self._perform_substitutions(context)  # ensure self.node_name is expanded
         if '<node_name_unspecified>' in self.node_name:
             raise RuntimeError('node_name unexpectedly incomplete for lifecycle node')
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            # State transitions are driven by events, which a launch plan can't replay.
+            launch_plan.add_uncacheable_reason(
+                "lifecycle node '{}' is launched".format(self.node_name))
+            return super().execute(context)
         # Create a subscription to monitor the state changes of the subprocess.
         self.__rclpy_subscription = context.locals.launch_ros_node.create_subscription(
             lifecycle_msgs.msg.TransitionEvent,
@@ -115,6 +187,8 @@ class LifecycleNode(Node):
         self.__rclpy_change_state_client = context.locals.launch_ros_node.create_client(
             lifecycle_msgs.srv.ChangeState,
             '{}/change_state'.format(self.node_name))
+        # Make the spinning thread consider the new subscription and client right away.
+        context.locals.ros_startup_action.wake()
         # Register an event handler to change states on a ChangeState lifecycle event.
         context.register_event_handler(launch.EventHandler(
             matcher=lambda event: isinstance(event, ChangeState),
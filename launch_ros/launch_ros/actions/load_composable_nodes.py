@@ -0,0 +1,216 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the LoadComposableNodes action."""
+
+import asyncio
+import logging
+import pathlib
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple
+from typing import Union
+
+from launch.action import Action
+from launch.launch_context import LaunchContext
+from launch.launch_plan import get_launch_plan
+from launch.some_substitutions_type import SomeSubstitutionsType
+from launch.utilities import normalize_to_list_of_substitutions
+from launch.utilities import perform_substitutions
+
+from ..descriptions import ComposableNode
+from ..utilities import call_service_async
+from ..utilities import expand_node_name_and_namespace
+from ..utilities import expand_parameter_dict
+
+if False:
+    # imports here would cause loops, but are only used as forward-references for type-checking
+    from .composable_node_container import ComposableNodeContainer  # noqa
+
+_logger = logging.getLogger(name='launch_ros')
+
+
+def _flatten_parameters(parameters: Dict[Text, Any], prefix: Text = '') -> Iterator[Tuple]:
+    # Nested dictionaries are namespaces of parameters, separated with dots.
+    for name, value in parameters.items():
+        if isinstance(value, dict):
+            yield from _flatten_parameters(value, prefix + name + '.')
+        else:
+            yield prefix + name, value
+
+
+def _load_parameter_file(path: Text, fully_qualified_node_name: Optional[Text]) -> Dict:
+    # import here to only pay for yaml when needed
+    import yaml
+    with open(path, 'r') as f:
+        param_file = yaml.safe_load(f) or {}
+    # Gather the parameters of the entries for all nodes and for the node itself, which may be
+    # nested in their namespaces, in the order they appear in the file.
+    parameters = {}  # type: Dict[Text, Any]
+    pending = [('', param_file)]
+    while pending:
+        prefix, entry = pending.pop(0)
+        for key, value in entry.items():
+            if key == 'ros__parameters':
+                if prefix in ('/**', fully_qualified_node_name):
+                    parameters.update(value)
+            elif isinstance(value, dict):
+                pending.append((prefix + '/' + key.strip('/'), value))
+    return parameters
+
+
+class LoadComposableNodes(Action):
+    """Action that loads composable ROS nodes into a running container."""
+
+    def __init__(
+        self,
+        *,
+        composable_node_descriptions: List[ComposableNode],
+        target_container: Union['ComposableNodeContainer', SomeSubstitutionsType],
+        **kwargs
+    ) -> None:
+        """
+        Construct a LoadComposableNodes action.
+
+        The requests to load the composable nodes are sent to the container
+        concurrently, once its `_container/load_node` service is available,
+        without blocking any thread while waiting for the service or for the
+        responses.
+        Failing to load a composable node is logged as an error.
+
+        This action requires the `launch_ros` node, see
+        :func:`launch_ros.get_default_launch_description`.
+
+        :param: composable_node_descriptions descriptions of the composable
+            nodes to load
+        :param: target_container the container to load the nodes into, either
+            the :class:`ComposableNodeContainer` action which launched it, or
+            the fully qualified node name of the container
+        """
+        super().__init__(**kwargs)
+        self.__composable_node_descriptions = composable_node_descriptions
+        self.__target_container = target_container
+
+    @property
+    def composable_node_descriptions(self) -> List[ComposableNode]:
+        """Getter for composable_node_descriptions."""
+        return self.__composable_node_descriptions
+
+    def _get_container_name(self, context: LaunchContext) -> Text:
+        # import here to avoid loop
+        from .composable_node_container import ComposableNodeContainer
+        if isinstance(self.__target_container, ComposableNodeContainer):
+            return self.__target_container.node_name
+        return perform_substitutions(
+            context, normalize_to_list_of_substitutions(self.__target_container))
+
+    def _create_request(self, composable_node: ComposableNode, context: LaunchContext) -> Any:
+        # import here to only pay for rclpy once a node is actually launched
+        import composition_interfaces.srv
+        from rclpy.parameter import Parameter
+
+        def perform(substitutions):
+            return perform_substitutions(
+                context, normalize_to_list_of_substitutions(substitutions))
+
+        def to_parameter_msgs(parameters):
+            return [
+                Parameter(name, value=value).to_parameter_msg()
+                for name, value in _flatten_parameters(parameters)
+            ]
+
+        request = composition_interfaces.srv.LoadNode.Request()
+        request.package_name = perform(composable_node.package)
+        request.plugin_name = perform(composable_node.node_plugin)
+        node_name, node_namespace = expand_node_name_and_namespace(
+            context,
+            node_name=composable_node.node_name,
+            node_namespace=composable_node.node_namespace)
+        if node_name is not None:
+            request.node_name = node_name
+        if node_namespace is not None:
+            request.node_namespace = node_namespace
+        fully_qualified_node_name = None
+        if node_name is not None:
+            fully_qualified_node_name = '{}/{}'.format(
+                (node_namespace or '').rstrip('/'), node_name)
+        # Later parameters take precedence, like when passing several parameter files to a node.
+        parameters = {}  # type: Dict[Text, Any]
+        for params in composable_node.parameters:
+            if isinstance(params, dict):
+                parameters.update(dict(_flatten_parameters(
+                    expand_parameter_dict(context, params))))
+            else:
+                path = str(params) if isinstance(params, pathlib.Path) else perform(params)
+                parameters.update(dict(_flatten_parameters(
+                    _load_parameter_file(path, fully_qualified_node_name))))
+        request.parameters = to_parameter_msgs(parameters)
+        request.remap_rules = [
+            '{}:={}'.format(perform(remapping_from), perform(remapping_to))
+            for remapping_from, remapping_to in composable_node.remappings
+        ]
+        extra_arguments = {}  # type: Dict[Text, Any]
+        for arguments in composable_node.extra_arguments:
+            extra_arguments.update(expand_parameter_dict(context, arguments))
+        request.extra_arguments = to_parameter_msgs(extra_arguments)
+        return request
+
+    async def _load_node(self, client: Any, request: Any, context: LaunchContext) -> None:
+        response = await call_service_async(context, client, request)
+        if response is None:
+            return
+        if not response.success:
+            _logger.error("Failed to load node '{}' of type '{}' in container '{}': {}".format(
+                request.node_name or '<default name>', request.plugin_name, client.srv_name,
+                response.error_message))
+            return
+        _logger.info("Loaded node '{}' in container '{}'".format(
+            response.full_node_name, client.srv_name))
+
+    async def _load_nodes(self, client: Any, requests: List[Any], context: LaunchContext):
+        try:
+            await asyncio.gather(*[
+                self._load_node(client, request, context) for request in requests
+            ])
+        finally:
+            context.locals.launch_ros_node.destroy_client(client)
+
+    def execute(self, context: LaunchContext) -> Optional[List[Action]]:
+        """Execute the action."""
+        # import here to only pay for rclpy once a node is actually launched
+        import composition_interfaces.srv
+        container_name = self._get_container_name(context)
+        launch_plan = get_launch_plan(context)
+        if launch_plan is not None:
+            # The nodes are loaded by service calls, which a launch plan can't replay.
+            launch_plan.add_uncacheable_reason(
+                "composable nodes are loaded into '{}'".format(container_name))
+            return None
+        # Expand all of the descriptions first, so that errors are raised by this action.
+        requests = [
+            self._create_request(composable_node, context)
+            for composable_node in self.__composable_node_descriptions
+        ]
+        client = context.locals.launch_ros_node.create_client(
+            composition_interfaces.srv.LoadNode,
+            '{}/_container/load_node'.format(container_name))
+        # Make the spinning thread consider the new client right away.
+        context.locals.ros_startup_action.wake()
+        context.add_completion_future(
+            context.asyncio_loop.create_task(self._load_nodes(client, requests, context)))
+        return None
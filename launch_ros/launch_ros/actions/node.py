@@ -14,18 +14,18 @@
 
 """Module for the Node action."""
 
+import asyncio
 import logging
 import os
 import pathlib
-from tempfile import NamedTemporaryFile
-from typing import Dict  # noqa: F401
+from typing import Any
+from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
-from typing import Text  # noqa: F401
+from typing import Text
 from typing import Tuple
 
-from launch import Substitution
 from launch.action import Action
 from launch.actions import ExecuteProcess
 from launch.launch_context import LaunchContext
@@ -34,16 +34,15 @@ from launch.some_substitutions_type import SomeSubstitutionsType_types_tuple
 from launch.substitutions import LocalSubstitution
 from launch.utilities import ensure_argument_type
 from launch.utilities import normalize_to_list_of_substitutions
-from launch.utilities import perform_substitutions
+from launch.utilities import perform_substitutions_async
 
 from launch_ros.remap_rule_type import SomeRemapRules
 from launch_ros.substitutions import ExecutableInPackage
+from launch_ros.utilities import expand_node_name_and_namespace
+from launch_ros.utilities import expand_parameter_dict
+from launch_ros.utilities import get_parameter_file_cache
 from launch_ros.utilities import normalize_remap_rules
-
-from rclpy.validate_namespace import validate_namespace
-from rclpy.validate_node_name import validate_node_name
-
-import yaml
+from launch_ros.utilities import ParameterFileCache  # noqa: F401
 
 _logger = logging.getLogger(name='launch_ros')
 
@@ -170,6 +169,7 @@ class Node(ExecuteProcess):
         self.__expanded_node_name = '<node_name_unspecified>'
         self.__expanded_node_namespace = '/'
         self.__final_node_name = None  # type: Optional[Text]
+        self.__parameter_file_cache = None  # type: Optional[ParameterFileCache]
         self.__expanded_parameter_files = None  # type: Optional[List[Text]]
         self.__expanded_remappings = None  # type: Optional[List[Tuple[Text, Text]]]
 
@@ -183,68 +183,15 @@ class Node(ExecuteProcess):
         return self.__final_node_name
 
     def _create_params_file_from_dict(self, context, params):
-        with NamedTemporaryFile(mode='w', prefix='launch_params_', delete=False) as h:
-            param_file_path = h.name
-            # TODO(dhood): clean up generated parameter files.
-
-            def perform_substitution_if_applicable(context, var):
-                if isinstance(var, (int, float, str)):
-                    # No substitution necessary.
-                    return var
-                if isinstance(var, Substitution):
-                    return perform_substitutions(context, normalize_to_list_of_substitutions(var))
-                if isinstance(var, tuple):
-                    try:
-                        return perform_substitutions(
-                            context, normalize_to_list_of_substitutions(var))
-                    except TypeError:
-                        raise TypeError(
-                            'Invalid element received in parameters dictionary '
-                            '(not all tuple elements are Substitutions): {}'.format(var))
-                else:
-                    raise TypeError(
-                        'Unsupported type received in parameters dictionary: {}'
-                        .format(type(var)))
-
-            def expand_dict(input_dict):
-                expanded_dict = {}
-                for k, v in input_dict.items():
-                    # Key (parameter/group name) can only be a string/Substitutions that evaluates
-                    # to a string.
-                    expanded_key = perform_substitutions(
-                        context, normalize_to_list_of_substitutions(k))
-                    if isinstance(v, dict):
-                        # Expand the nested dict.
-                        expanded_value = expand_dict(v)
-                    elif isinstance(v, list):
-                        # Expand each element.
-                        expanded_value = []
-                        for e in v:
-                            if isinstance(e, list):
-                                raise TypeError(
-                                    'Nested lists are not supported for parameters: {} found in {}'
-                                    .format(e, v))
-                            expanded_value.append(perform_substitution_if_applicable(context, e))
-                    # Tuples are treated as Substitution(s) to be concatenated.
-                    elif isinstance(v, tuple):
-                        for e in v:
-                            ensure_argument_type(
-                                e, SomeSubstitutionsType_types_tuple,
-                                'parameter dictionary tuple entry', 'Node')
-                        expanded_value = perform_substitutions(
-                            context, normalize_to_list_of_substitutions(v))
-                    else:
-                        expanded_value = perform_substitution_if_applicable(context, v)
-                    expanded_dict[expanded_key] = expanded_value
-                return expanded_dict
-
-            expanded_dict = expand_dict(params)
-            param_dict = {
-                self.__expanded_node_name: {'ros__parameters': expanded_dict}}
-            if self.__expanded_node_namespace:
-                param_dict = {self.__expanded_node_namespace: param_dict}
-            yaml.dump(param_dict, h, default_flow_style=False)
-            return param_file_path
+        expanded_dict = expand_parameter_dict(context, params)
+        param_dict = {
+            self.__expanded_node_name: {'ros__parameters': expanded_dict}}
+        if self.__expanded_node_namespace:
+            param_dict = {self.__expanded_node_namespace: param_dict}
+        if self.__parameter_file_cache is None:
+            self.__parameter_file_cache = get_parameter_file_cache(context)
+        # Nodes with identical parameters share the same file, see ParameterFileCache.
+        return self.__parameter_file_cache.get_parameter_file(param_dict)
 
     def _perform_substitutions(self, context: LaunchContext) -> None:
         try:
@@ -252,17 +199,13 @@ class Node(ExecuteProcess):
                 # This function may have already been called by a subclass' `execute`, for example.
                 return
             self.__substitutions_performed = True
-            if self.__node_name is not None:
-                self.__expanded_node_name = perform_substitutions(
-                    context, normalize_to_list_of_substitutions(self.__node_name))
-                validate_node_name(self.__expanded_node_name)
+            expanded_node_name, expanded_node_namespace = expand_node_name_and_namespace(
+                context, node_name=self.__node_name, node_namespace=self.__node_namespace)
+            if expanded_node_name is not None:
+                self.__expanded_node_name = expanded_node_name
             self.__expanded_node_name.lstrip('/')
-            if self.__node_namespace is not None:
-                self.__expanded_node_namespace = perform_substitutions(
-                    context, normalize_to_list_of_substitutions(self.__node_namespace))
-            if not self.__expanded_node_namespace.startswith('/'):
-                self.__expanded_node_namespace = '/' + self.__expanded_node_namespace
-            validate_namespace(self.__expanded_node_namespace)
+            if expanded_node_namespace is not None:
+                self.__expanded_node_namespace = expanded_node_namespace
         except Exception:
             _logger.error(
                 "Error while expanding or validating node name or namespace for '{}':"
@@ -278,39 +221,39 @@ class Node(ExecuteProcess):
         if self.__expanded_node_namespace not in ['', '/']:
             self.__final_node_name += self.__expanded_node_namespace
         self.__final_node_name += '/' + self.__expanded_node_name
-        # expand parameters too
-        if self.__parameters is not None:
-            self.__expanded_parameter_files = []
-            for params in self.__parameters:
-                if isinstance(params, dict):
-                    param_file_path = self._create_params_file_from_dict(context, params)
-                else:
-                    if isinstance(params, pathlib.Path):
-                        param_file_path = str(params)
-                    else:
-                        param_file_path = perform_substitutions(
-                            context, normalize_to_list_of_substitutions(params))
-                if not os.path.isfile(param_file_path):
-                    _logger.warn(
-                        'Parameter file path is not a file: {}'.format(param_file_path))
-                    # Don't skip adding the file to the parameter list since space has been
-                    # reserved for it in the ros_specific_arguments.
-                self.__expanded_parameter_files.append(param_file_path)
-        # expand remappings too
-        if self.__remappings is not None:
-            self.__expanded_remappings = []
-            for k, v in self.__remappings:
-                key = perform_substitutions(context, normalize_to_list_of_substitutions(k))
-                value = perform_substitutions(context, normalize_to_list_of_substitutions(v))
-                self.__expanded_remappings.append((key, value))
 
-    def execute(self, context: LaunchContext) -> Optional[List[Action]]:
+    async def _expand_substitutions(self, context: LaunchContext) -> None:
         """
-        Execute the action.
+        Expand the parameters and remappings, as well as the ExecuteProcess substitutions.
 
-        Delegated to :meth:`launch.actions.ExecuteProcess.execute`.
+        See :meth:`launch.actions.ExecuteProcess._expand_substitutions`.
         """
-        self._perform_substitutions(context)
+        async def perform(subs):
+            return await perform_substitutions_async(
+                context, normalize_to_list_of_substitutions(subs))
+
+        async def expand_parameter_file_path(params):
+            if isinstance(params, dict):
+                return self._create_params_file_from_dict(context, params)
+            if isinstance(params, pathlib.Path):
+                return str(params)
+            return await perform(params)
+
+        # expand parameters and remappings concurrently
+        self.__expanded_parameter_files, expanded_remappings = await asyncio.gather(
+            asyncio.gather(*[expand_parameter_file_path(params) for params in self.__parameters]),
+            asyncio.gather(*[
+                asyncio.gather(perform(k), perform(v)) for k, v in self.__remappings
+            ]),
+        )
+        for param_file_path in self.__expanded_parameter_files:
+            if not os.path.isfile(param_file_path):
+                _logger.warn(
+                    'Parameter file path is not a file: {}'.format(param_file_path))
+                # Don't skip adding the file to the parameter list since space has been
+                # reserved for it in the ros_specific_arguments.
+        self.__expanded_remappings = [tuple(remapping) for remapping in expanded_remappings]
+
         # Prepare the ros_specific_arguments list and add it to the context so that the
         # LocalSubstitution placeholders added to the the cmd can be expanded using the contents.
         ros_specific_arguments = []  # type: List[Text]
@@ -318,11 +261,35 @@ class Node(ExecuteProcess):
             ros_specific_arguments.append('__node:={}'.format(self.__expanded_node_name))
         if self.__node_namespace is not None:
             ros_specific_arguments.append('__ns:={}'.format(self.__expanded_node_namespace))
-        if self.__expanded_parameter_files is not None:
-            for param_file_path in self.__expanded_parameter_files:
-                ros_specific_arguments.append('__params:={}'.format(param_file_path))
-        if self.__expanded_remappings is not None:
-            for remapping_from, remapping_to in self.__expanded_remappings:
-                ros_specific_arguments.append('{}:={}'.format(remapping_from, remapping_to))
+        for param_file_path in self.__expanded_parameter_files:
+            ros_specific_arguments.append('__params:={}'.format(param_file_path))
+        for remapping_from, remapping_to in self.__expanded_remappings:
+            ros_specific_arguments.append('{}:={}'.format(remapping_from, remapping_to))
         context.extend_locals({'ros_specific_arguments': ros_specific_arguments})
+        await super()._expand_substitutions(context)
+
+    def _get_launch_plan_entry(self, context: LaunchContext) -> Dict[Text, Any]:
+        """
+        Add the parameter files to the launch plan entry of the process.
+
+        See :meth:`launch.actions.ExecuteProcess._get_launch_plan_entry`.
+        """
+        entry = super()._get_launch_plan_entry(context)
+        for params, param_file_path in zip(self.__parameters, self.__expanded_parameter_files):
+            if isinstance(params, dict):
+                entry['files'].append(param_file_path)
+            elif os.path.isfile(param_file_path):
+                entry['inputs'].append(param_file_path)
+        return entry
+
+    def execute(self, context: LaunchContext) -> Optional[List[Action]]:
+        """
+        Execute the action.
+
+        Delegated to :meth:`launch.actions.ExecuteProcess.execute`.
+        """
+        self._perform_substitutions(context)
+        if any(isinstance(params, dict) for params in self.__parameters):
+            # Get it here, as the substitutions are expanded with a snapshot of the context.
+            self.__parameter_file_cache = get_parameter_file_cache(context)
         return super().execute(context)
@@ -24,9 +24,10 @@ from typing import TextIO  # noqa: F401
 
 import launch
 import launch.actions
+import launch.event_handlers
 import launch.events
 
-import rclpy
+from .utilities import ConsoleWriter
 
 _logger = logging.getLogger('launch_ros')
 _process_log_files = {}  # type: Dict[Text, TextIO]
@@ -39,60 +40,83 @@ def _on_process_started(context: launch.LaunchContext):
         _logger.warn("process '{}' asked for 'output=log', but that's not currently implemented.")
 
 
-def _on_process_exited(context: launch.LaunchContext):
+def _on_process_exited(context: launch.LaunchContext, console_writer: ConsoleWriter):
     typed_event = cast(launch.events.process.ProcessExited, context.locals.event)
+    # All of the output of the process was handled before it exited, so write it out now.
+    console_writer.flush()
     if typed_event.execute_process_action.output == 'log':
         # TODO(wjwwood): implement file logging
         pass
 
 
-def _on_process_output(event: launch.Event, *, file_name: Text, prefix_output: bool):
+def _on_process_output(
+    event: launch.Event, *, file_name: Text, prefix_output: bool, console_writer: ConsoleWriter
+):
     typed_event = cast(launch.events.process.ProcessIO, event)
-    text = event.text.decode()
     if typed_event.execute_process_action.output == 'screen':
+        prefix = None
         if prefix_output:
-            for line in text.splitlines():
-                print('[{}] {}'.format(event.process_name, line))
-        else:
-            print(text, end='')
+            prefix = '[{}] '.format(event.process_name)
+        console_writer.write(event.text.decode(), prefix=prefix)
     elif typed_event.execute_process_action.output == 'log':
         if file_name == 'stderr':
+            prefix = None
             if prefix_output:
-                for line in text.splitlines():
-                    print('[{}:{}] {}'.format(event.process_name, file_name, line))
-            else:
-                print(text, end='')
+                prefix = '[{}:{}] '.format(event.process_name, file_name)
+            console_writer.write(event.text.decode(), prefix=prefix)
         # TODO(wjwwood): implement file logging
 
 
 class ROSSpecificLaunchStartup(launch.actions.OpaqueFunction):
-    """Does ROS specific launch startup."""
+    """
+    Does ROS specific launch startup.
+
+    This creates the `launch_ros` node, and spins it in a separate thread.
+    The thread blocks until there is work for the node, and is woken by a
+    guard condition when the node needs to be looked at again, i.e. on
+    shutdown and when subscriptions, clients, etc. are added to the node, see
+    :meth:`wake`, so that neither has to wait for a timeout.
+    """
 
     def __init__(self):
         """Constructor."""
         super().__init__(function=self._function)
         self.__shutting_down = False
+        self.__wake_guard_condition = None
+
+    def wake(self) -> None:
+        """
+        Wake the thread spinning the `launch_ros` node.
+
+        This must be called after adding subscriptions, clients, etc. to the
+        node, for them to be handled before anything else wakes the thread.
+        """
+        if self.__wake_guard_condition is not None:
+            self.__wake_guard_condition.trigger()
 
     def _shutdown(self, event: launch.Event, context: launch.LaunchContext):
         self.__shutting_down = True
+        self.wake()
         self.__rclpy_spin_thread.join()
         self.__launch_ros_node.destroy_node()
 
     def _run(self):
+        import rclpy
         executor = rclpy.get_global_executor()
         try:
             executor.add_node(self.__launch_ros_node)
             while not self.__shutting_down:
-                # TODO(wjwwood): switch this to `spin()` when it considers
-                #   asynchronously added subscriptions.
-                #   see: https://github.com/ros2/rclpy/issues/188
-                executor.spin_once(timeout_sec=1.0)
+                # Block until there is work, or until woken by the guard condition, which
+                # makes the executor consider entities which were added asynchronously.
+                executor.spin_once()
         except KeyboardInterrupt:
             pass
         finally:
             executor.remove_node(self.__launch_ros_node)
 
     def _function(self, context: launch.LaunchContext):
+        # import here to only pay for rclpy once the launch service actually runs
+        import rclpy
         try:
             rclpy.init(args=context.argv)
         except RuntimeError as exc:
@@ -100,6 +124,9 @@ class ROSSpecificLaunchStartup(launch.actions.OpaqueFunction):
                 pass
             raise
         self.__launch_ros_node = rclpy.create_node('launch_ros')
+        # Triggering it only wakes the executor, so the callback has nothing to do.
+        self.__wake_guard_condition = self.__launch_ros_node.create_guard_condition(
+            lambda: None)
         context.extend_globals({
             'ros_startup_action': self,
             'launch_ros_node': self.__launch_ros_node
@@ -111,14 +138,30 @@ class ROSSpecificLaunchStartup(launch.actions.OpaqueFunction):
         self.__rclpy_spin_thread.start()
 
 
-def get_default_launch_description(*, prefix_output_with_name=False):
+def get_default_launch_description(
+    *,
+    prefix_output_with_name=False,
+    output_flush_period=0.1,
+    flush_output_in_thread=False
+):
     """
     Return a LaunchDescription to be included before user descriptions.
 
+    The output of the processes is written to the console with a
+    :class:`launch_ros.utilities.ConsoleWriter`, which buffers it for up to
+    the given flush period, and all of the output of a process is written out
+    when it exits, or when the launch system shuts down.
+
     :param: prefix_output_with_name if True, each line of output is prefixed
         with the name of the process as `[process_name] `, else it is printed
         unmodified
+    :param: output_flush_period the maximum time, in seconds, the output of
+        processes is buffered, or 0 to write it out immediately
+    :param: flush_output_in_thread if True the output is written out from a
+        background thread, else from the launch loop
     """
+    console_writer = ConsoleWriter(
+        flush_period=output_flush_period, use_thread=flush_output_in_thread)
     default_ros_launch_description = launch.LaunchDescription([
         # ROS initialization (create node and other stuff).
         ROSSpecificLaunchStartup(),
@@ -130,14 +173,21 @@ def get_default_launch_description(*, prefix_output_with_name=False):
         # Handle process exit.
         launch.actions.RegisterEventHandler(launch.EventHandler(
             matcher=lambda event: isinstance(event, launch.events.process.ProcessExited),
-            entities=[launch.actions.OpaqueFunction(function=_on_process_exited)],
+            entities=[launch.actions.OpaqueFunction(
+                function=_on_process_exited, args=[console_writer])],
         )),
         # Add default handler for output from processes.
         launch.actions.RegisterEventHandler(launch.event_handlers.OnProcessIO(
             on_stdout=functools.partial(
-                _on_process_output, file_name='stdout', prefix_output=prefix_output_with_name),
+                _on_process_output, file_name='stdout', prefix_output=prefix_output_with_name,
+                console_writer=console_writer),
             on_stderr=functools.partial(
-                _on_process_output, file_name='stderr', prefix_output=prefix_output_with_name),
+                _on_process_output, file_name='stderr', prefix_output=prefix_output_with_name,
+                console_writer=console_writer),
+        )),
+        # Write out the remaining output on shutdown.
+        launch.actions.RegisterEventHandler(launch.event_handlers.OnShutdown(
+            on_shutdown=lambda event, context: console_writer.flush(),
         )),
     ])
     return default_ros_launch_description
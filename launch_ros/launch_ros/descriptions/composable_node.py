@@ -0,0 +1,113 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ComposableNode description."""
+
+import pathlib
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from launch.some_substitutions_type import SomeSubstitutionsType
+from launch.some_substitutions_type import SomeSubstitutionsType_types_tuple
+from launch.utilities import ensure_argument_type
+
+from launch_ros.remap_rule_type import RemapRules
+from launch_ros.remap_rule_type import SomeRemapRules
+from launch_ros.utilities import normalize_remap_rules
+
+
+class ComposableNode:
+    """Describes a ROS node which can be loaded into a container with other ROS nodes."""
+
+    def __init__(
+        self, *,
+        package: SomeSubstitutionsType,
+        node_plugin: SomeSubstitutionsType,
+        node_name: Optional[SomeSubstitutionsType] = None,
+        node_namespace: Optional[SomeSubstitutionsType] = None,
+        parameters: Optional[List[SomeSubstitutionsType]] = None,
+        remappings: Optional[SomeRemapRules] = None,
+        extra_arguments: Optional[List[Dict]] = None
+    ) -> None:
+        """
+        Constructor.
+
+        The node name, namespace, parameters and remappings are expanded like
+        those of :class:`launch_ros.actions.Node`, see its documentation for
+        details, when the composable node is loaded, see
+        :class:`launch_ros.actions.LoadComposableNodes`.
+
+        Parameter files are read when the composable node is loaded, and the
+        parameters of the entries for all nodes, `/**`, and for the node itself
+        are passed to the container.
+
+        :param: package the package in which the node plugin can be found
+        :param: node_plugin the name of the plugin to load
+        :param: node_name the name of the node, or None to use the default
+            name specified within the code of the node
+        :param: node_namespace the ros namespace of the node
+        :param: parameters list of names of yaml files with parameter rules,
+            or dictionaries of parameters
+        :param: remappings ordered list of 'to' and 'from' string pairs to be
+            passed to the node as ROS remapping rules
+        :param: extra_arguments list of dictionaries of container specific
+            arguments, e.g. `{'use_intra_process_comms': True}`
+        """
+        parameter_types = list(SomeSubstitutionsType_types_tuple) + [pathlib.Path, dict]
+        for i, param in enumerate([] if parameters is None else parameters):
+            ensure_argument_type(
+                param, parameter_types, 'parameters[{}]'.format(i), 'ComposableNode')
+        self.__package = package
+        self.__node_plugin = node_plugin
+        self.__node_name = node_name
+        self.__node_namespace = node_namespace
+        self.__parameters = [] if parameters is None else list(parameters)
+        self.__remappings = [] if remappings is None else list(normalize_remap_rules(remappings))
+        self.__extra_arguments = [] if extra_arguments is None else list(extra_arguments)
+
+    @property
+    def package(self) -> SomeSubstitutionsType:
+        """Getter for package."""
+        return self.__package
+
+    @property
+    def node_plugin(self) -> SomeSubstitutionsType:
+        """Getter for node_plugin."""
+        return self.__node_plugin
+
+    @property
+    def node_name(self) -> Optional[SomeSubstitutionsType]:
+        """Getter for node_name."""
+        return self.__node_name
+
+    @property
+    def node_namespace(self) -> Optional[SomeSubstitutionsType]:
+        """Getter for node_namespace."""
+        return self.__node_namespace
+
+    @property
+    def parameters(self) -> List[SomeSubstitutionsType]:
+        """Getter for parameters."""
+        return self.__parameters
+
+    @property
+    def remappings(self) -> RemapRules:
+        """Getter for remappings."""
+        return self.__remappings
+
+    @property
+    def extra_arguments(self) -> List[Dict]:
+        """Getter for extra_arguments."""
+        return self.__extra_arguments
@@ -15,11 +15,13 @@
 """Package for launch.events.process."""
 
 from .change_state import ChangeState
+from .change_state_completed import ChangeStateCompleted
 from .lifecycle_node_matchers import matches_node_name
 from .state_transition import StateTransition
 
 __all__ = [
     'ChangeState',
+    'ChangeStateCompleted',
     'matches_node_name',
     'StateTransition',
 ]
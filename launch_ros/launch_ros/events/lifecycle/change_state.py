@@ -16,6 +16,7 @@
 
 import collections
 from typing import Callable
+from typing import Optional
 
 from launch.event import Event
 
@@ -68,7 +69,8 @@ class ChangeState(Event):
         self,
         *,
         lifecycle_node_matcher: Callable[['LifecycleNode'], bool],
-        transition_id: int
+        transition_id: int,
+        max_concurrent_transitions: Optional[int] = None
     ) -> None:
         """
         Constructor.
@@ -78,15 +80,23 @@ class ChangeState(Event):
         :param: transition_id is the id of the requested transition which are
             defined in the :class:`lifecycle_msgs.msg.Transition` message class,
             e.g. `lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE`.
+        :param: max_concurrent_transitions is the maximum number of targeted
+            lifecycle nodes which are asked to change state at the same time,
+            or None, the default, for no limit.
         """
         super().__init__()
         self.__lifecycle_node_matcher = lifecycle_node_matcher
         self.__transition_id = transition_id
+        self.__max_concurrent_transitions = max_concurrent_transitions
         if transition_id not in self.valid_transitions.keys():
             raise ValueError("given transition_id of '{}', expected one of {{{}}}".format(
                 transition_id,
                 ', '.join(['{}: {}'.format(v, k) for k, v in self.valid_transitions.items()]),
             ))
+        if max_concurrent_transitions is not None and max_concurrent_transitions < 1:
+            raise ValueError(
+                "given max_concurrent_transitions of '{}', expected at least 1".format(
+                    max_concurrent_transitions))
 
     @property
     def lifecycle_node_matcher(self) -> Callable[['LifecycleNode'], bool]:
@@ -97,3 +107,8 @@ class ChangeState(Event):
     def transition_id(self) -> int:
         """Getter for transition_id."""
         return self.__transition_id
+
+    @property
+    def max_concurrent_transitions(self) -> Optional[int]:
+        """Getter for max_concurrent_transitions."""
+        return self.__max_concurrent_transitions
@@ -0,0 +1,71 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Module for ChangeStateCompleted event."""
+
+from typing import List
+from typing import Tuple
+
+from launch.event import Event
+
+from .change_state import ChangeState
+
+if False:
+    # imports here would cause loops, but are only used as forward-references for type-checking
+    from ...actions import LifecycleNode  # noqa
+
+
+class ChangeStateCompleted(Event):
+    """
+    Event emitted when all lifecycle nodes targeted by a ChangeState event are done.
+
+    It is emitted once per :class:`ChangeState` event which targeted at least
+    one lifecycle node, after the change state service calls to all of the
+    targeted nodes returned, failed, or were abandoned due to shutdown.
+    """
+
+    name = 'launch_ros.events.lifecycle.ChangeStateCompleted'
+
+    def __init__(
+        self,
+        *,
+        change_state_event: ChangeState,
+        results: List[Tuple['LifecycleNode', bool]]
+    ) -> None:
+        """
+        Constructor.
+
+        :param: change_state_event the ChangeState event which was handled
+        :param: results the targeted lifecycle nodes, in the order they were
+            targeted, and whether they made the requested transition successfully
+        """
+        super().__init__()
+        self.__change_state_event = change_state_event
+        self.__results = results
+
+    @property
+    def change_state_event(self) -> ChangeState:
+        """Getter for change_state_event."""
+        return self.__change_state_event
+
+    @property
+    def results(self) -> List[Tuple['LifecycleNode', bool]]:
+        """Getter for results."""
+        return self.__results
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True if all of the targeted lifecycle nodes made the transition."""
+        return all(success for _, success in self.__results)
@@ -14,6 +14,7 @@
 
 """Module for the ExecutableInPackage substitution."""
 
+import asyncio
 import os
 from typing import List
 from typing import Text
@@ -26,6 +27,7 @@ from launch.substitution import Substitution
 from launch.substitutions.substitution_failure import SubstitutionFailure
 from launch.utilities import normalize_to_list_of_substitutions
 from launch.utilities import perform_substitutions
+from launch.utilities import perform_substitutions_async
 
 from osrf_pycommon.process_utils import which
 
@@ -68,6 +70,18 @@ class ExecutableInPackage(Substitution):
         """Perform the substitution by locating the executable."""
         executable = perform_substitutions(context, self.executable)
         package = perform_substitutions(context, self.package)
+        return self._find_executable(executable, package)
+
+    async def perform_async(self, context: LaunchContext) -> Text:
+        """Perform the substitution, locating the executable in the loop's executor."""
+        executable, package = await asyncio.gather(
+            perform_substitutions_async(context, self.executable),
+            perform_substitutions_async(context, self.package),
+        )
+        return await context.asyncio_loop.run_in_executor(
+            None, self._find_executable, executable, package)
+
+    def _find_executable(self, executable: Text, package: Text) -> Text:
         package_prefix = get_package_prefix(package)
         package_libexec = os.path.join(package_prefix, 'lib', package)
         if not os.path.exists(package_libexec):
@@ -18,11 +18,23 @@ Module for descriptions of launchable entities.
 Descriptions are not executable and are immutable so they can be reused by launch entities.
 """
 
+from .call_service_async import call_service_async
+from .console_writer import ConsoleWriter
+from .expand_node_name_and_namespace import expand_node_name_and_namespace
+from .expand_parameter_dict import expand_parameter_dict
 from .normalize_remap_rule import normalize_remap_rule
 from .normalize_remap_rule import normalize_remap_rules
+from .parameter_file_cache import get_parameter_file_cache
+from .parameter_file_cache import ParameterFileCache
 
 
 __all__ = [
+    'call_service_async',
+    'ConsoleWriter',
+    'expand_node_name_and_namespace',
+    'expand_parameter_dict',
+    'get_parameter_file_cache',
     'normalize_remap_rule',
     'normalize_remap_rules',
+    'ParameterFileCache',
 ]
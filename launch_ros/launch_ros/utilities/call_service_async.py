@@ -0,0 +1,72 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the call_service_async function."""
+
+import asyncio
+import logging
+from typing import Any
+from typing import Optional
+
+from launch.launch_context import LaunchContext
+
+_logger = logging.getLogger(name='launch_ros')
+
+# Period, in seconds, with which a service which isn't available yet is checked.
+_SERVICE_POLL_PERIOD = 0.1
+
+
+async def call_service_async(context: LaunchContext, client: Any, request: Any) -> Optional[Any]:
+    """
+    Call a service with an rclpy client, without blocking a thread, and return the response.
+
+    The client must belong to the `launch_ros` node, which is spun in another
+    thread, see :func:`launch_ros.get_default_launch_description`.
+    Waiting for the service polls it, rather than blocking a thread in
+    `wait_for_service()`, and the response is awaited on the launch loop.
+    Both waits are abandoned if the launch system is shut down meanwhile,
+    e.g. if the node providing the service died.
+
+    :returns: the response, or None if the wait was abandoned due to shutdown
+    :raises: the exception of the call, if it failed
+    """
+    while not client.service_is_ready():
+        if context.is_shutdown:
+            _logger.warning("Abandoning wait for the '{}' service, due to shutdown.".format(
+                client.srv_name))
+            return None
+        await asyncio.sleep(_SERVICE_POLL_PERIOD)
+    # The rclpy future is completed by the thread spinning the launch_ros node.
+    future = context.asyncio_loop.create_future()
+
+    def on_done(rclpy_future):
+        def set_result():
+            if future.done():
+                return
+            exception = rclpy_future.exception()
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(rclpy_future.result())
+        context.asyncio_loop.call_soon_threadsafe(set_result)
+
+    client.call_async(request).add_done_callback(on_done)
+    while not future.done():
+        if context.is_shutdown:
+            _logger.warning(
+                "Abandoning wait for the response of the '{}' service, due to shutdown.".format(
+                    client.srv_name))
+            return None
+        await asyncio.wait([future], timeout=_SERVICE_POLL_PERIOD)
+    return future.result()
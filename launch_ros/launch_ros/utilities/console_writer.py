@@ -0,0 +1,152 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ConsoleWriter class."""
+
+import asyncio
+import os
+import sys
+import threading
+from typing import Dict  # noqa: F401
+from typing import Optional
+from typing import Text
+from typing import Tuple  # noqa: F401
+
+
+class ConsoleWriter:
+    """
+    Buffered writer of process output to `sys.stdout`.
+
+    The output is encoded like `print()` would, with the encoding and errors
+    of `sys.stdout`, and appended to an internal buffer, which is written to
+    the binary buffer of `sys.stdout` and flushed at most once per flush
+    period.
+    The flush is scheduled on the asyncio loop which is running when the
+    output is written, or, if `use_thread` is True, on a background thread,
+    so that writing to a slow console doesn't hold up the launch loop.
+    It can also be flushed explicitly, see :meth:`flush`.
+
+    Line prefixes, e.g. `[talker-1] `, are encoded once, and each chunk of
+    output is encoded into a single bytes object.
+    """
+
+    def __init__(self, *, flush_period: float = 0.1, use_thread: bool = False) -> None:
+        """
+        Constructor.
+
+        :param: flush_period the maximum time, in seconds, output is kept in
+            the buffer, or 0 to write every chunk of output immediately
+        :param: use_thread if True the buffer is flushed from a background
+            thread, else from the asyncio loop
+        """
+        self.__flush_period = flush_period
+        self.__use_thread = use_thread
+        self.__lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+        self.__buffer = bytearray()
+        self.__flush_scheduled = False
+        self.__prefixes = {}  # type: Dict[Tuple[Text, Text, Text], bytes]
+
+    @property
+    def flush_period(self) -> float:
+        """Getter for flush_period."""
+        return self.__flush_period
+
+    @property
+    def use_thread(self) -> bool:
+        """Getter for use_thread."""
+        return self.__use_thread
+
+    def __get_encoding(self) -> Tuple[Text, Text]:
+        return (
+            getattr(sys.stdout, 'encoding', None) or 'utf-8',
+            getattr(sys.stdout, 'errors', None) or 'strict',
+        )
+
+    def __get_prefix(self, prefix: Text, encoding: Text, errors: Text) -> bytes:
+        key = (prefix, encoding, errors)
+        encoded_prefix = self.__prefixes.get(key)
+        if encoded_prefix is None:
+            encoded_prefix = prefix.encode(encoding, errors)
+            self.__prefixes[key] = encoded_prefix
+        return encoded_prefix
+
+    def write(self, text: Text, *, prefix: Optional[Text] = None) -> None:
+        """
+        Write some output.
+
+        Without a prefix, the text is written as is, like `print(text, end='')`.
+        With a prefix, each line of the text, see `str.splitlines()`, is
+        written with the prefix and a line ending, like
+        `print(prefix + line)` for each line.
+        """
+        encoding, errors = self.__get_encoding()
+        newline = os.linesep.encode(encoding, errors)
+        if prefix is None:
+            data = text.encode(encoding, errors)
+            if os.linesep != '\n':
+                # Like the line ending translation of the text layer of sys.stdout.
+                data = data.replace('\n'.encode(encoding, errors), newline)
+        else:
+            lines = text.splitlines()
+            if not lines:
+                return
+            encoded_prefix = self.__get_prefix(prefix, encoding, errors)
+            data = encoded_prefix + (newline + encoded_prefix).join(
+                line.encode(encoding, errors) for line in lines) + newline
+        with self.__lock:
+            self.__buffer += data
+            if self.__flush_scheduled:
+                return
+            self.__flush_scheduled = True
+        if self.__flush_period > 0 and self.__use_thread:
+            timer = threading.Timer(self.__flush_period, self.__scheduled_flush)
+            timer.daemon = True
+            timer.start()
+            return
+        if self.__flush_period > 0:
+            try:
+                loop = asyncio.get_event_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None and loop.is_running():
+                loop.call_later(self.__flush_period, self.__scheduled_flush)
+                return
+        self.__scheduled_flush()
+
+    def __scheduled_flush(self) -> None:
+        with self.__lock:
+            self.__flush_scheduled = False
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered output to `sys.stdout` and flush it."""
+        # The buffer is unlocked while writing, so that output can be added meanwhile.
+        with self.__write_lock:
+            with self.__lock:
+                if not self.__buffer:
+                    return
+                data = bytes(self.__buffer)
+                del self.__buffer[:]
+            stream = sys.stdout
+            # Flush what was printed before, so it is not reordered with this output.
+            stream.flush()
+            binary_stream = getattr(stream, 'buffer', None)
+            if binary_stream is None:
+                encoding, errors = self.__get_encoding()
+                stream.write(data.decode(encoding, errors).replace(os.linesep, '\n'))
+                stream.flush()
+            else:
+                binary_stream.write(data)
+                binary_stream.flush()
@@ -0,0 +1,57 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the expand_node_name_and_namespace function."""
+
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+from launch.launch_context import LaunchContext
+from launch.some_substitutions_type import SomeSubstitutionsType
+from launch.utilities import normalize_to_list_of_substitutions
+from launch.utilities import perform_substitutions
+
+
+def expand_node_name_and_namespace(
+    context: LaunchContext,
+    *,
+    node_name: Optional[SomeSubstitutionsType],
+    node_namespace: Optional[SomeSubstitutionsType]
+) -> Tuple[Optional[Text], Optional[Text]]:
+    """
+    Expand and validate the name and namespace of a node.
+
+    A relative namespace is made absolute, by prepending a `/`.
+    The name or namespace is returned as None if it is not given, but the
+    default namespace, `/`, is validated anyway.
+
+    :raises: an rclpy exception if the name or namespace is not valid
+    """
+    # import here to only pay for rclpy once a node is actually launched
+    from rclpy.validate_namespace import validate_namespace
+    from rclpy.validate_node_name import validate_node_name
+    expanded_node_name = None
+    if node_name is not None:
+        expanded_node_name = perform_substitutions(
+            context, normalize_to_list_of_substitutions(node_name))
+        validate_node_name(expanded_node_name)
+    expanded_node_namespace = None
+    if node_namespace is not None:
+        expanded_node_namespace = perform_substitutions(
+            context, normalize_to_list_of_substitutions(node_namespace))
+        if not expanded_node_namespace.startswith('/'):
+            expanded_node_namespace = '/' + expanded_node_namespace
+    validate_namespace('/' if expanded_node_namespace is None else expanded_node_namespace)
+    return expanded_node_name, expanded_node_namespace
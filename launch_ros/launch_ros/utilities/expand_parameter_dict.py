@@ -0,0 +1,89 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the expand_parameter_dict function."""
+
+from typing import Any
+from typing import Dict
+from typing import Text
+
+from launch import Substitution
+from launch.launch_context import LaunchContext
+from launch.some_substitutions_type import SomeSubstitutionsType_types_tuple
+from launch.utilities import ensure_argument_type
+from launch.utilities import normalize_to_list_of_substitutions
+from launch.utilities import perform_substitutions
+
+
+def _perform_substitution_if_applicable(context: LaunchContext, var: Any) -> Any:
+    if isinstance(var, (int, float, str)):
+        # No substitution necessary.
+        return var
+    if isinstance(var, Substitution):
+        return perform_substitutions(context, normalize_to_list_of_substitutions(var))
+    if isinstance(var, tuple):
+        try:
+            return perform_substitutions(
+                context, normalize_to_list_of_substitutions(var))
+        except TypeError:
+            raise TypeError(
+                'Invalid element received in parameters dictionary '
+                '(not all tuple elements are Substitutions): {}'.format(var))
+    else:
+        raise TypeError(
+            'Unsupported type received in parameters dictionary: {}'
+            .format(type(var)))
+
+
+def expand_parameter_dict(context: LaunchContext, parameters: Dict) -> Dict[Text, Any]:
+    """
+    Expand the substitutions in a dictionary of parameters, see :class:`launch_ros.actions.Node`.
+
+    Keys can be strings or Substitutions which are expanded to a string.
+    Values can be strings, integers, floats, Substitutions, tuples of
+    Substitutions which are expanded and concatenated, lists of those, or
+    dictionaries with the same properties, which are expanded recursively.
+
+    :raises: TypeError if a key or value has an unsupported type
+    """
+    expanded_dict = {}
+    for k, v in parameters.items():
+        # Key (parameter/group name) can only be a string/Substitutions that evaluates
+        # to a string.
+        expanded_key = perform_substitutions(
+            context, normalize_to_list_of_substitutions(k))
+        if isinstance(v, dict):
+            # Expand the nested dict.
+            expanded_value = expand_parameter_dict(context, v)
+        elif isinstance(v, list):
+            # Expand each element.
+            expanded_value = []
+            for e in v:
+                if isinstance(e, list):
+                    raise TypeError(
+                        'Nested lists are not supported for parameters: {} found in {}'
+                        .format(e, v))
+                expanded_value.append(_perform_substitution_if_applicable(context, e))
+        # Tuples are treated as Substitution(s) to be concatenated.
+        elif isinstance(v, tuple):
+            for e in v:
+                ensure_argument_type(
+                    e, SomeSubstitutionsType_types_tuple,
+                    'parameter dictionary tuple entry', 'Node')
+            expanded_value = perform_substitutions(
+                context, normalize_to_list_of_substitutions(v))
+        else:
+            expanded_value = _perform_substitution_if_applicable(context, v)
+        expanded_dict[expanded_key] = expanded_value
+    return expanded_dict
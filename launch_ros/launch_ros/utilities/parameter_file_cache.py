@@ -0,0 +1,98 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ParameterFileCache class."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any
+from typing import Dict
+from typing import Optional  # noqa: F401
+from typing import Text
+
+from launch.event_handlers import OnShutdown
+from launch.launch_context import LaunchContext
+
+_GLOBAL_NAME = 'launch_ros_parameter_file_cache'
+
+
+class ParameterFileCache:
+    """
+    Content addressed parameter files, written once per launch run.
+
+    Each distinct parameter dictionary is written to a YAML file named after
+    the SHA-256 hash of its contents, in a temporary directory which is
+    created on first use and removed by :meth:`cleanup`.
+    Dictionaries with the same contents share the same file.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.__directory = None  # type: Optional[Text]
+        self.__lock = threading.Lock()
+
+    @property
+    def directory(self) -> Optional[Text]:
+        """Getter for directory, or None if no parameter file was written yet."""
+        return self.__directory
+
+    def get_parameter_file(self, param_dict: Dict[Text, Any]) -> Text:
+        """Return the path of a YAML file with the given parameters, writing it if needed."""
+        # The keys are sorted when hashing, like when dumping, so the order doesn't matter.
+        digest = hashlib.sha256(json.dumps(param_dict, sort_keys=True).encode()).hexdigest()
+        with self.__lock:
+            if self.__directory is None:
+                self.__directory = tempfile.mkdtemp(prefix='launch_params_')
+            param_file_path = os.path.join(self.__directory, '{}.yaml'.format(digest))
+            if not os.path.exists(param_file_path):
+                # import here to only pay for yaml when needed
+                import yaml
+                with tempfile.NamedTemporaryFile(
+                    mode='w', dir=self.__directory, suffix='.tmp', delete=False
+                ) as h:
+                    # Prefer the much faster dumper of libyaml, if available.
+                    yaml.dump(
+                        param_dict, h, Dumper=getattr(yaml, 'CDumper', yaml.Dumper),
+                        default_flow_style=False)
+                os.replace(h.name, param_file_path)
+        return param_file_path
+
+    def cleanup(self) -> None:
+        """Remove the parameter files written so far."""
+        with self.__lock:
+            if self.__directory is not None:
+                shutil.rmtree(self.__directory, ignore_errors=True)
+                self.__directory = None
+
+
+def get_parameter_file_cache(context: LaunchContext) -> ParameterFileCache:
+    """
+    Return the parameter file cache of the launch run of the given context.
+
+    The cache is created on first use, stored in the context globals, and
+    cleaned up when the launch system shuts down.
+    This must be called with the context the entities are visited with,
+    rather than with a snapshot of it.
+    """
+    cache = context.get_locals_as_dict().get(_GLOBAL_NAME)
+    if cache is None:
+        cache = ParameterFileCache()
+        context.extend_globals({_GLOBAL_NAME: cache})
+        context.register_event_handler(OnShutdown(
+            on_shutdown=lambda event, context: cache.cleanup()))
+    return cache
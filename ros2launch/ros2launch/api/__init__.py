@@ -14,6 +14,7 @@
 
 """Python package for the ros2 launch api."""
 
+from .api import dry_run_a_python_launch_file
 from .api import get_share_file_path_from_package
 from .api import InvalidPythonLaunchFileError
 from .api import launch_a_python_launch_file
@@ -22,12 +23,19 @@ from .api import MultipleLaunchFilesError
 from .api import print_a_python_launch_file
 from .api import print_arguments_of_launch_description
 from .api import print_arguments_of_python_launch_file
+from .launch_file_index import LaunchFileIndex
+from .launch_server import LaunchServer
+from .launch_server import LaunchServerClient
 
 __all__ = [
+    'dry_run_a_python_launch_file',
     'get_share_file_path_from_package',
     'InvalidPythonLaunchFileError',
     'LaunchFileNameCompleter',
     'launch_a_python_launch_file',
+    'LaunchFileIndex',
+    'LaunchServer',
+    'LaunchServerClient',
     'MultipleLaunchFilesError',
     'print_a_python_launch_file',
     'print_arguments_of_launch_description',
@@ -16,6 +16,7 @@
 
 from collections import OrderedDict
 import os
+import sys
 from typing import List
 from typing import Text
 from typing import Tuple
@@ -26,8 +27,11 @@ import launch
 from launch.launch_description_sources import get_launch_description_from_python_launch_file
 from launch.launch_description_sources import InvalidPythonLaunchFileError
 from launch.launch_description_sources import load_python_launch_file_as_module
+from launch.launch_plan import get_launch_plan_key
 import launch_ros
 
+from .launch_file_index import LaunchFileIndex
+
 # forward functions into this module's default namespace (useful for some autocompletion tools)
 get_launch_description_from_python_launch_file = get_launch_description_from_python_launch_file
 InvalidPythonLaunchFileError = InvalidPythonLaunchFileError
@@ -52,11 +56,14 @@ def get_share_file_path_from_package(*, package_name, file_name):
     :raises: MultipleLaunchFilesError if the file is found in multiple places
     """
     package_share_directory = get_package_share_directory(package_name)
-    matching_file_paths = []
-    for root, dirs, files in os.walk(package_share_directory):
-        for name in files:
-            if name == file_name:
-                matching_file_paths.append(os.path.join(root, name))
+    matching_file_paths = LaunchFileIndex().get_launch_file_paths(
+        package_name=package_name).get(file_name, [])
+    if not matching_file_paths and not file_name.endswith('.launch.py'):
+        # Only Python launch files are indexed, so look for anything else the slow way.
+        for root, dirs, files in os.walk(package_share_directory):
+            for name in files:
+                if name == file_name:
+                    matching_file_paths.append(os.path.join(root, name))
     if len(matching_file_paths) == 0:
         raise FileNotFoundError(
             "file '{}' was not found in the share directory of package '{}' which is at '{}'"
@@ -82,10 +89,26 @@ def get_python_launch_file_paths(*, path):
     return python_launch_file_paths
 
 
-def print_a_python_launch_file(*, python_launch_file_path):
-    """Print the description of a Python launch file to the console."""
+def print_a_python_launch_file(*, python_launch_file_path, output_format='text'):
+    """
+    Print the description of a Python launch file to the console.
+
+    :param output_format: either 'text', 'json' or 'dot' (GraphViz), see
+        :class:`launch.LaunchIntrospector`
+    """
     launch_description = get_launch_description_from_python_launch_file(python_launch_file_path)
-    print(launch.LaunchIntrospector().format_launch_description(launch_description))
+    introspector = launch.LaunchIntrospector()
+    if output_format == 'json':
+        introspector.write_launch_description_json(launch_description, sys.stdout)
+    elif output_format == 'dot':
+        introspector.write_launch_description_dot(launch_description, sys.stdout)
+    elif output_format == 'text':
+        for line in introspector.iterate_launch_description_lines(launch_description):
+            print(line)
+        print()
+        print(introspector.format_launch_description_index(launch_description))
+    else:
+        raise ValueError("unknown output format '{}'".format(output_format))
 
 
 def print_arguments_of_launch_description(*, launch_description):
@@ -134,26 +157,151 @@ def parse_launch_arguments(launch_arguments: List[Text]) -> List[Tuple[Text, Tex
     return parsed_launch_arguments.items()
 
 
-def launch_a_python_launch_file(*, python_launch_file_path, launch_file_arguments, debug=False):
-    """Launch a given Python launch file (by path) and pass it the given launch file arguments."""
-    launch_service = launch.LaunchService(argv=launch_file_arguments, debug=debug)
-    launch_service.include_launch_description(
-        launch_ros.get_default_launch_description(prefix_output_with_name=False))
-    parsed_launch_arguments = parse_launch_arguments(launch_file_arguments)
+def get_default_launch_plan_cache_directory():
+    """Return the default directory for cached launch plans, in the user cache directory."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'ros2launch', 'launch_plans')
+
+
+def _include_a_python_launch_file(*, python_launch_file_path, launch_file_arguments):
     # Include the user provided launch file using IncludeLaunchDescription so that the
     # location of the current launch file is set.
-    launch_description = launch.LaunchDescription([
+    return launch.LaunchDescription([
         launch.actions.IncludeLaunchDescription(
             launch.launch_description_sources.PythonLaunchDescriptionSource(
                 python_launch_file_path
             ),
-            launch_arguments=parsed_launch_arguments,
+            launch_arguments=parse_launch_arguments(launch_file_arguments),
         ),
     ])
-    launch_service.include_launch_description(launch_description)
+
+
+def get_launch_description_from_launch_plan_cache(
+    *, python_launch_file_path, launch_file_arguments, cache_directory=None
+):
+    """
+    Return a launch description which launches the cached launch plan of a launch file.
+
+    If there is no cached launch plan for the launch file with these
+    arguments and environment, or if it is out of date, a new one is created
+    by running the launch file, without launching anything, and cached.
+    None is returned if the launch file can't be replaced by its launch
+    plan, see :class:`launch.LaunchPlan`, in which case the launch file must
+    be included again to be launched, as the actions of the launch
+    description used for planning were already executed.
+    """
+    if cache_directory is None:
+        cache_directory = get_default_launch_plan_cache_directory()
+    key = get_launch_plan_key(
+        launch_file_path=python_launch_file_path, launch_arguments=launch_file_arguments)
+    launch_plan_path = os.path.join(cache_directory, '{}.json'.format(key))
+    launch_plan = launch.LaunchPlan.load(launch_plan_path)
+    if launch_plan is None or not launch_plan.is_up_to_date():
+        launch_plan = launch.LaunchPlan.create(
+            _include_a_python_launch_file(
+                python_launch_file_path=python_launch_file_path,
+                launch_file_arguments=launch_file_arguments),
+            key=key, argv=launch_file_arguments)
+        launch_plan.save(launch_plan_path)
+    if not launch_plan.is_cacheable:
+        return None
+    return launch_plan.to_launch_description()
+
+
+def launch_a_python_launch_file(
+    *, python_launch_file_path, launch_file_arguments, debug=False, use_launch_plan_cache=False
+):
+    """
+    Launch a given Python launch file (by path) and pass it the given launch file arguments.
+
+    :param use_launch_plan_cache: if True, launch the processes from the
+        cached launch plan of the launch file when possible, see
+        :func:`get_launch_description_from_launch_plan_cache`
+    """
+    launch_service = launch.LaunchService(argv=launch_file_arguments, debug=debug)
+    planned_launch_description = None
+    if use_launch_plan_cache:
+        planned_launch_description = get_launch_description_from_launch_plan_cache(
+            python_launch_file_path=python_launch_file_path,
+            launch_file_arguments=launch_file_arguments)
+    launch_service.include_launch_description(
+        launch_ros.get_default_launch_description(prefix_output_with_name=False))
+    if planned_launch_description is not None:
+        launch_service.include_launch_description(planned_launch_description)
+    else:
+        launch_description = _include_a_python_launch_file(
+            python_launch_file_path=python_launch_file_path,
+            launch_file_arguments=launch_file_arguments)
+        # Read and compile the included launch files concurrently, before they are visited.
+        launch.launch_description_sources.prefetch_python_launch_files(launch_description)
+        launch_service.include_launch_description(launch_description)
     return launch_service.run()
 
 
+def _describe_planned_entity(entity):
+    if isinstance(entity, launch.actions.IncludeLaunchDescription):
+        return "IncludeLaunchDescription('{}')".format(
+            entity.launch_description_source.location)
+    if isinstance(entity, launch.actions.ExecuteProcess) and entity.process_details is not None:
+        return "{}('{}')".format(type(entity).__name__, entity.process_details['name'])
+    return type(entity).__name__
+
+
+def dry_run_a_python_launch_file(
+    *, python_launch_file_path, launch_file_arguments, debug=False, max_timings=10
+):
+    """
+    Plan a given Python launch file, without launching anything, and print the plan.
+
+    The launch file is run with :meth:`launch.LaunchService.plan`, and the
+    fully expanded processes, the conditions evaluated, the event handlers
+    registered and the entities which took the longest to visit or expand
+    are printed to the console.
+    Actions which only run in response to events, e.g. the ones given to
+    event handlers, are not run and so are not part of the plan.
+
+    :param max_timings: maximum number of entity timings to print
+    """
+    launch_service = launch.LaunchService(argv=launch_file_arguments, debug=debug)
+    launch_service.include_launch_description(_include_a_python_launch_file(
+        python_launch_file_path=python_launch_file_path,
+        launch_file_arguments=launch_file_arguments))
+    launch_plan = launch_service.plan()
+
+    print('Processes:')
+    for process in launch_plan.processes:
+        print("\n    '{}':".format(process['name']))
+        print('        cmd: {}'.format(' '.join(process['cmd'])))
+        print('        cwd: {}'.format(process['cwd']))
+        if process['env'] is not None:
+            print('        env:')
+            for name, value in sorted(process['env'].items()):
+                print('            {}={}'.format(name, value))
+    if not launch_plan.processes:
+        print('\n  No processes.')
+
+    if launch_plan.conditions:
+        print('\nConditions:')
+        for entity, condition, value in launch_plan.conditions:
+            print('    {} on {}: {}'.format(
+                type(condition).__name__, _describe_planned_entity(entity),
+                'taken' if value else 'not taken'))
+
+    if launch_plan.event_handlers:
+        print('\nEvent handlers:')
+        for event_handler in launch_plan.event_handlers:
+            print('    {}'.format(event_handler.describe()[0]))
+
+    total = sum(seconds for _, phase, seconds in launch_plan.timings if phase == 'visit')
+    print('\nTimings (visiting took {:.3f} s in total, slowest first):'.format(total))
+    timings = sorted(launch_plan.timings, key=lambda timing: timing[2], reverse=True)
+    for entity, phase, seconds in timings[:max_timings]:
+        print('    {:8.3f} ms  {:9}  {}'.format(
+            seconds * 1000, phase, _describe_planned_entity(entity)))
+    return 0
+
+
 class LaunchFileNameCompleter:
     """Callable returning a list of launch file names within a package's share directory."""
 
@@ -165,8 +313,7 @@ class LaunchFileNameCompleter:
         """Return a list of file names for launch files found within the package."""
         package_name = getattr(parsed_args, self.package_name_key)
         try:
-            package_share_directory = get_package_share_directory(package_name)
-            paths = get_python_launch_file_paths(path=package_share_directory)
+            paths_by_name = LaunchFileIndex().get_launch_file_paths(package_name=package_name)
         except PackageNotFoundError:
             return []
-        return [os.path.basename(p) for p in paths]
+        return [name for name, paths in paths_by_name.items() for _ in paths]
@@ -0,0 +1,148 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the LaunchFileIndex class."""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any  # noqa: F401
+from typing import Dict
+from typing import List
+from typing import Text
+
+from ament_index_python.packages import get_package_share_directory
+
+INDEX_FORMAT_VERSION = 1
+
+
+def get_default_index_path() -> Text:
+    """
+    Return the default path of the launch file index of the current workspace.
+
+    The index is stored in the user cache directory, i.e. `$XDG_CACHE_HOME`
+    or `~/.cache`, and there is one index per `AMENT_PREFIX_PATH`.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    workspace = os.environ.get('AMENT_PREFIX_PATH', '')
+    return os.path.join(cache_home, 'ros2launch', 'launch_file_index-{}.json'.format(
+        hashlib.sha256(workspace.encode()).hexdigest()[:16]))
+
+
+def _index_share_directory(share_directory: Text) -> Dict[Text, Any]:
+    directories = {}  # type: Dict[Text, int]
+    launch_files = {}  # type: Dict[Text, List[Text]]
+    pending = [share_directory]
+    while pending:
+        directory = pending.pop()
+        try:
+            # Stat before listing, so that changes made while listing invalidate the entry.
+            directories[directory] = os.stat(directory).st_mtime_ns
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk(), do not descend into symbolic links to directories.
+                if not entry.is_symlink():
+                    pending.append(entry.path)
+            elif entry.name.endswith('.launch.py'):
+                launch_files.setdefault(entry.name, []).append(entry.path)
+    for paths in launch_files.values():
+        paths.sort()
+    return {
+        'share_directory': share_directory,
+        'directories': directories,
+        'launch_files': launch_files,
+    }
+
+
+def _is_up_to_date(entry: Dict[Text, Any], share_directory: Text) -> bool:
+    if entry['share_directory'] != share_directory:
+        return False
+    for directory, mtime_ns in entry['directories'].items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+class LaunchFileIndex:
+    """
+    Persistent index of the Python launch files in the share directory of packages.
+
+    The index maps package names to the names and paths of the files ending
+    in `.launch.py` in their share directory.
+    The entry of a package is rebuilt whenever the share directory of the
+    package changes, or when the modification time of any of the directories
+    below it changes, i.e. when files or directories are added, removed or
+    renamed.
+    Checking an entry only takes a `stat()` call per directory, rather than
+    walking all of the files in the share directory.
+
+    The index is stored as JSON, see :func:`get_default_index_path`.
+    Failing to read or write the index is not an error, the affected package
+    share directories are simply indexed again.
+    """
+
+    def __init__(self, *, index_path: Text = None) -> None:
+        """Constructor."""
+        self.__index_path = get_default_index_path() if index_path is None else index_path
+        self.__entries = self.__load()
+
+    @property
+    def index_path(self) -> Text:
+        """Getter for index_path."""
+        return self.__index_path
+
+    def __load(self) -> Dict[Text, Dict[Text, Any]]:
+        try:
+            with open(self.__index_path, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get('version') != INDEX_FORMAT_VERSION:
+            return {}
+        return index.get('packages', {})
+
+    def __save(self) -> None:
+        directory = os.path.dirname(self.__index_path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Write atomically, as other processes may be reading the index concurrently.
+            with tempfile.NamedTemporaryFile(
+                'w', dir=directory, suffix='.tmp', delete=False
+            ) as f:
+                json.dump({'version': INDEX_FORMAT_VERSION, 'packages': self.__entries}, f)
+            os.replace(f.name, self.__index_path)
+        except OSError:
+            pass
+
+    def get_launch_file_paths(self, *, package_name: Text) -> Dict[Text, List[Text]]:
+        """
+        Return the paths of the Python launch files of a package, by file name.
+
+        :raises: PackageNotFoundError if package is not found
+        """
+        share_directory = get_package_share_directory(package_name)
+        entry = self.__entries.get(package_name)
+        if entry is None or not _is_up_to_date(entry, share_directory):
+            entry = _index_share_directory(share_directory)
+            self.__entries[package_name] = entry
+            self.__save()
+        return entry['launch_files']
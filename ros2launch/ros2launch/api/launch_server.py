@@ -0,0 +1,260 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the LaunchServer and LaunchServerClient classes."""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+from typing import Any  # noqa: F401
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Text
+
+import launch
+from launch.event_handlers.on_process_start import OnProcessStart
+from launch.launch_description_sources import get_launch_description_from_python_launch_file
+from launch.launch_description_sources import prefetch_python_launch_files
+import launch_ros
+
+from .api import parse_launch_arguments
+
+
+def get_default_socket_path() -> Text:
+    """
+    Return the default path of the socket of the launch server of the current user.
+
+    The socket is created in `$XDG_RUNTIME_DIR`, or in the temporary directory if not set.
+    """
+    runtime_directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(runtime_directory, 'ros2launch-server-{}.sock'.format(os.getuid()))
+
+
+class _LaunchServerRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line.decode())
+                response = self.server.launch_server._handle_request(request)
+            except Exception as exc:
+                response = {'status': 'error', 'message': str(exc)}
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+class _ThreadingUnixStreamServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class LaunchServer:
+    """
+    Resident launch service which launches files on request.
+
+    The server keeps a :class:`launch.LaunchService` running, with the
+    default ROS launch description already included, and accepts requests
+    from :class:`LaunchServerClient` instances over a Unix domain socket.
+    Requests are newline delimited JSON objects, with one JSON object sent
+    back as a response to each of them.
+
+    The supported requests are:
+
+    - `{"request": "include", "path": ..., "arguments": [[name, value], ...]}`,
+      which includes the given Python launch file with the given launch arguments
+    - `{"request": "status"}`, which returns the launch files included so far
+      and the running processes
+    - `{"request": "shutdown"}`, which shuts down the launch service, and
+      with it all of the launched processes, and stops the server
+
+    All of the included launch files share the launch service, and so the
+    launch context, e.g. its `argv` and any launch configurations set globally.
+
+    Launch files are loaded, and checked for being given their required
+    launch arguments, before replying to the include request, so that a
+    launch file which can't be loaded is reported to the client as an error.
+    Errors while running an included launch file, e.g. a substitution which
+    can't be performed, still shut down the launch service like
+    :meth:`launch.LaunchService.run` does, along with all of the processes.
+
+    The socket is only accessible by the current user, as any client can
+    make the server launch any launch file.
+    """
+
+    def __init__(
+        self,
+        *,
+        socket_path: Optional[Text] = None,
+        argv: Optional[Iterable[Text]] = None,
+        debug: bool = False
+    ) -> None:
+        """Constructor."""
+        self.__socket_path = get_default_socket_path() if socket_path is None else socket_path
+        self.__launch_service = launch.LaunchService(argv=argv, debug=debug)
+        self.__lock = threading.Lock()
+        self.__includes = []  # type: List[Dict[Text, Any]]
+        self.__processes = {}  # type: Dict[Text, int]
+
+    @property
+    def socket_path(self) -> Text:
+        """Getter for socket_path."""
+        return self.__socket_path
+
+    def __on_process_started(self, event, context):
+        with self.__lock:
+            self.__processes[event.process_name] = event.pid
+
+    def __on_process_exited(self, event, context):
+        with self.__lock:
+            self.__processes.pop(event.process_name, None)
+
+    def _handle_request(self, request: Dict[Text, Any]) -> Dict[Text, Any]:
+        kind = request.get('request')
+        if kind == 'include':
+            path = os.path.abspath(request['path'])
+            arguments = [tuple(argument) for argument in request.get('arguments', [])]
+            # Load the launch file here, rather than when it is included by the launch
+            # service, where failing would shut down the launch service altogether.
+            included_launch_description = get_launch_description_from_python_launch_file(path)
+            argument_names = [name for name, _ in arguments]
+            for argument in included_launch_description.get_launch_arguments():
+                if argument._conditionally_included or argument.default_value is not None:
+                    continue
+                if argument.name not in argument_names:
+                    raise ValueError("missing required launch argument '{}' ({})".format(
+                        argument.name, argument.description))
+            prefetch_python_launch_files(
+                included_launch_description, launch_file_directory=os.path.dirname(path))
+            launch_description = launch.LaunchDescription([
+                launch.actions.IncludeLaunchDescription(
+                    launch.LaunchDescriptionSource(
+                        included_launch_description, location=path,
+                        method='interpreted python launch file'),
+                    launch_arguments=arguments,
+                ),
+            ])
+            self.__launch_service.include_launch_description(launch_description)
+            with self.__lock:
+                self.__includes.append({'path': path, 'arguments': arguments})
+            return {'status': 'ok'}
+        if kind == 'status':
+            with self.__lock:
+                return {
+                    'status': 'ok',
+                    'pid': os.getpid(),
+                    'includes': list(self.__includes),
+                    'processes': dict(self.__processes),
+                }
+        if kind == 'shutdown':
+            self.__launch_service.shutdown()
+            return {'status': 'ok'}
+        raise ValueError("unknown request '{}'".format(kind))
+
+    def run(self) -> int:
+        """
+        Serve requests until a shutdown is requested, or the launch service is interrupted.
+
+        This must be called from the main thread, like :meth:`launch.LaunchService.run`.
+
+        :returns: the return code of the launch service
+        :raises: RuntimeError if another server is already using the socket path
+        """
+        if os.path.exists(self.__socket_path):
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(self.__socket_path)
+            except OSError:
+                # Left behind by a server which didn't exit cleanly.
+                os.unlink(self.__socket_path)
+            else:
+                raise RuntimeError(
+                    "a launch server is already listening on '{}'".format(self.__socket_path))
+        self.__launch_service.include_launch_description(launch.LaunchDescription([
+            launch_ros.get_default_launch_description(prefix_output_with_name=True),
+            launch.actions.RegisterEventHandler(OnProcessStart(
+                on_start=self.__on_process_started)),
+            launch.actions.RegisterEventHandler(launch.event_handlers.OnProcessExit(
+                on_exit=self.__on_process_exited)),
+        ]))
+        server = _ThreadingUnixStreamServer(
+            self.__socket_path, _LaunchServerRequestHandler, bind_and_activate=False)
+        try:
+            server.server_bind()
+            # Remove the permissions of the group and others before connections are accepted.
+            os.chmod(self.__socket_path, 0o600)
+            server.server_activate()
+        except Exception:
+            server.server_close()
+            raise
+        server.launch_server = self
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+        try:
+            return self.__launch_service.run(shutdown_when_idle=False)
+        finally:
+            server.shutdown()
+            server.server_close()
+            server_thread.join()
+            os.unlink(self.__socket_path)
+
+
+class LaunchServerClient:
+    """Client of a :class:`LaunchServer`, see its documentation for the protocol."""
+
+    def __init__(self, *, socket_path: Optional[Text] = None) -> None:
+        """Constructor."""
+        self.__socket_path = get_default_socket_path() if socket_path is None else socket_path
+
+    def request(self, request: Dict[Text, Any]) -> Dict[Text, Any]:
+        """
+        Send a request to the launch server and return its response.
+
+        :raises: RuntimeError if the server can't be reached or the request failed
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(self.__socket_path)
+                sock.sendall(json.dumps(request).encode() + b'\n')
+                with sock.makefile('rb') as f:
+                    line = f.readline()
+        except OSError as exc:
+            raise RuntimeError("failed to reach launch server at '{}': {}".format(
+                self.__socket_path, exc))
+        if not line:
+            raise RuntimeError('launch server closed the connection unexpectedly')
+        response = json.loads(line.decode())
+        if response.get('status') != 'ok':
+            raise RuntimeError('launch server request failed: {}'.format(
+                response.get('message')))
+        return response
+
+    def include(self, *, path: Text, launch_file_arguments: List[Text]) -> None:
+        """Ask the launch server to launch a Python launch file with the given arguments."""
+        self.request({
+            'request': 'include',
+            'path': os.path.abspath(path),
+            'arguments': [list(argument) for argument in parse_launch_arguments(
+                launch_file_arguments)],
+        })
+
+    def status(self) -> Dict[Text, Any]:
+        """Return the launch files included by the launch server and its running processes."""
+        return self.request({'request': 'status'})
+
+    def shutdown(self) -> None:
+        """Ask the launch server to shut down."""
+        self.request({'request': 'shutdown'})
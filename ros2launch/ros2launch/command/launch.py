@@ -19,13 +19,17 @@ import sys
 from ament_index_python.packages import get_package_prefix
 from ament_index_python.packages import PackageNotFoundError
 from ros2cli.command import CommandExtension
+from ros2launch.api import dry_run_a_python_launch_file
 from ros2launch.api import get_share_file_path_from_package
 from ros2launch.api import InvalidPythonLaunchFileError
 from ros2launch.api import launch_a_python_launch_file
 from ros2launch.api import LaunchFileNameCompleter
+from ros2launch.api import LaunchServer
+from ros2launch.api import LaunchServerClient
 from ros2launch.api import MultipleLaunchFilesError
 from ros2launch.api import print_a_python_launch_file
 from ros2launch.api import print_arguments_of_python_launch_file
+from ros2launch.api.launch_server import get_default_socket_path
 from ros2pkg.api import package_name_completer
 
 
@@ -41,11 +45,45 @@ class LaunchCommand(CommandExtension):
         command_group.add_argument(
             '-p', '--print', '--print-description', default=False, action='store_true',
             help='Print the launch description to the console without launching it.')
+        parser.add_argument(
+            '--format', default='text', choices=['text', 'json', 'dot'],
+            help='Format of the launch description printed with --print, where dot is '
+                 'GraphViz (default: text)')
         command_group.add_argument(
             '-s', '--show-args', '--show-arguments', default=False, action='store_true',
             help='Show arguments that may be given to the launch file.')
+        command_group.add_argument(
+            '--dry-run', default=False, action='store_true',
+            help='Evaluate the launch file and print the fully expanded processes, conditions, '
+                 'event handlers and timings, without launching anything.')
+        command_group.add_argument(
+            '--server', default=False, action='store_true',
+            help='Run a resident launch server, which launches the files given to it with '
+                 '--remote, until it is shut down with --server-shutdown.')
+        command_group.add_argument(
+            '--remote', default=False, action='store_true',
+            help='Launch the launch file in the running launch server, instead of in this '
+                 'process.')
+        command_group.add_argument(
+            '--server-status', default=False, action='store_true',
+            help='Show the launch files and processes of the running launch server.')
+        command_group.add_argument(
+            '--server-shutdown', default=False, action='store_true',
+            help='Shut down the running launch server and everything it launched.')
+        parser.add_argument(
+            '--plan-cache', '--use-launch-plan-cache', default=False, action='store_true',
+            help='Launch the processes from the cached launch plan of the launch file, '
+                 'created on first use, instead of evaluating the launch file every time. '
+                 'Launch files whose processes depend on events or timers are always '
+                 'evaluated.')
+        parser.add_argument(
+            '--server-socket', default=None,
+            help='Path of the Unix domain socket of the launch server (default: {})'.format(
+                get_default_socket_path()))
         arg = parser.add_argument(
             'package_name',
+            # Not needed when running or controlling the launch server.
+            nargs='?',
             help='Name of the ROS package which contains the launch file')
         arg.completer = package_name_completer
         arg = parser.add_argument(
@@ -64,6 +102,24 @@ class LaunchCommand(CommandExtension):
 
     def main(self, *, parser, args):
         """Entry point for CLI program."""
+        if args.server:
+            return LaunchServer(
+                socket_path=args.server_socket, argv=args.argv, debug=args.debug).run()
+        if args.server_status:
+            status = LaunchServerClient(socket_path=args.server_socket).status()
+            print('Launch server (pid {}):'.format(status['pid']))
+            for include in status['includes']:
+                print('  included: {} {}'.format(include['path'], ' '.join(
+                    '{}:={}'.format(name, value) for name, value in include['arguments'])))
+            for name, pid in sorted(status['processes'].items()):
+                print('  running: {} (pid {})'.format(name, pid))
+            return 0
+        if args.server_shutdown:
+            LaunchServerClient(socket_path=args.server_socket).shutdown()
+            return 0
+        if args.package_name is None:
+            return 'No launch file supplied'
+
         mode = 'pkg file'
         if args.launch_file_name is None:
             # If only one argument passed, use single file mode.
@@ -106,14 +162,24 @@ class LaunchCommand(CommandExtension):
         launch_arguments.extend(args.launch_arguments)
         try:
             if args.print:
-                return print_a_python_launch_file(python_launch_file_path=path)
+                return print_a_python_launch_file(
+                    python_launch_file_path=path, output_format=args.format)
             elif args.show_args:
                 return print_arguments_of_python_launch_file(python_launch_file_path=path)
+            elif args.dry_run:
+                return dry_run_a_python_launch_file(
+                    python_launch_file_path=path,
+                    launch_file_arguments=launch_arguments,
+                    debug=args.debug)
+            elif args.remote:
+                return LaunchServerClient(socket_path=args.server_socket).include(
+                    path=path, launch_file_arguments=launch_arguments)
             else:
                 return launch_a_python_launch_file(
                     python_launch_file_path=path,
                     launch_file_arguments=launch_arguments,
-                    debug=args.debug
+                    debug=args.debug,
+                    use_launch_plan_cache=args.plan_cache,
                 )
         except SyntaxError:
             print("""
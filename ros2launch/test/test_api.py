@@ -0,0 +1,62 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the ros2 launch API."""
+
+import os
+import textwrap
+
+import pytest
+
+from ros2launch.api import launch_a_python_launch_file
+
+LAUNCH_FILE = textwrap.dedent("""
+    import sys
+
+    from launch import LaunchDescription
+    from launch.actions import DeclareLaunchArgument
+    from launch.actions import ExecuteProcess
+    from launch.actions import RegisterEventHandler
+    from launch.event_handlers import OnProcessExit
+    from launch.substitutions import LaunchConfiguration
+
+
+    def generate_launch_description():
+        return LaunchDescription([
+            DeclareLaunchArgument('output_file'),
+            ExecuteProcess(cmd=[sys.executable, '-c', [
+                'open("', LaunchConfiguration('output_file'), '", "a").write("x")']]),
+        ]{})
+""")
+
+
+@pytest.mark.parametrize('cacheable', [True, False])
+def test_launch_a_python_launch_file_with_launch_plan_cache(tmpdir, monkeypatch, cacheable):
+    """Test that the processes are launched whether the launch plan is cached or not."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir / 'cache'))
+    launch_file_path = str(tmpdir / 'append.launch.py')
+    with open(launch_file_path, 'w') as f:
+        # Event handlers make the launch plan uncacheable.
+        f.write(LAUNCH_FILE.format('' if cacheable else (
+            ' + [RegisterEventHandler(OnProcessExit(on_exit=lambda *args: None))]')))
+    output_file = str(tmpdir / 'output')
+    for expected_output in ('x', 'xx'):
+        assert 0 == launch_a_python_launch_file(
+            python_launch_file_path=launch_file_path,
+            launch_file_arguments=['output_file:=' + output_file],
+            use_launch_plan_cache=True)
+        with open(output_file, 'r') as f:
+            assert f.read() == expected_output
+    assert os.listdir(str(tmpdir / 'cache' / 'ros2launch' / 'launch_plans'))
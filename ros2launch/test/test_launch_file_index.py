@@ -0,0 +1,118 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the LaunchFileIndex class."""
+
+import json
+import os
+
+import pytest
+
+from ros2launch.api import get_share_file_path_from_package
+from ros2launch.api import launch_file_index
+from ros2launch.api import LaunchFileIndex
+from ros2launch.api import MultipleLaunchFilesError
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w'):
+        pass
+
+
+@pytest.fixture
+def share_directory(tmpdir, monkeypatch):
+    """Create a workspace with a package, and return the share directory of the package."""
+    prefix = str(tmpdir.join('install'))
+    _touch(os.path.join(prefix, 'share', 'ament_index', 'resource_index', 'packages', 'pkg'))
+    share_directory = os.path.join(prefix, 'share', 'pkg')
+    _touch(os.path.join(share_directory, 'launch', 'a.launch.py'))
+    _touch(os.path.join(share_directory, 'launch', 'robot.launch.xml'))
+    _touch(os.path.join(share_directory, 'launch', 'sub', 'b.launch.py'))
+    _touch(os.path.join(share_directory, 'config', 'b.launch.py'))
+    monkeypatch.setenv('AMENT_PREFIX_PATH', prefix)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir.join('cache')))
+    return share_directory
+
+
+def test_build_index(share_directory, monkeypatch):
+    index = LaunchFileIndex()
+    assert index.index_path == launch_file_index.get_default_index_path()
+    assert index.get_launch_file_paths(package_name='pkg') == {
+        'a.launch.py': [os.path.join(share_directory, 'launch', 'a.launch.py')],
+        'b.launch.py': [
+            os.path.join(share_directory, 'config', 'b.launch.py'),
+            os.path.join(share_directory, 'launch', 'sub', 'b.launch.py'),
+        ],
+    }
+    with open(index.index_path, 'r') as f:
+        assert json.load(f)['version'] == launch_file_index.INDEX_FORMAT_VERSION
+
+    # The index is reused by other instances, as long as the share directory doesn't change.
+    def index_share_directory(share_directory):
+        raise AssertionError('indexed again')
+
+    monkeypatch.setattr(launch_file_index, '_index_share_directory', index_share_directory)
+    assert sorted(LaunchFileIndex().get_launch_file_paths(package_name='pkg')) == [
+        'a.launch.py', 'b.launch.py']
+
+
+def test_rebuild_index_when_share_directory_changes(share_directory):
+    LaunchFileIndex().get_launch_file_paths(package_name='pkg')
+    launch_directory = os.path.join(share_directory, 'launch', 'sub')
+    new_launch_file = os.path.join(launch_directory, 'c.launch.py')
+    _touch(new_launch_file)
+    # Make sure the modification time changes, whatever its resolution.
+    stat = os.stat(launch_directory)
+    os.utime(launch_directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    paths = LaunchFileIndex().get_launch_file_paths(package_name='pkg')
+    assert paths['c.launch.py'] == [new_launch_file]
+
+
+def test_corrupt_index(share_directory):
+    index_path = launch_file_index.get_default_index_path()
+    os.makedirs(os.path.dirname(index_path))
+    with open(index_path, 'w') as f:
+        f.write('{"version": 1, "packa')
+    assert sorted(LaunchFileIndex().get_launch_file_paths(package_name='pkg')) == [
+        'a.launch.py', 'b.launch.py']
+    # The index is written again.
+    with open(index_path, 'r') as f:
+        assert 'pkg' in json.load(f)['packages']
+
+
+def test_unwritable_index(share_directory, tmpdir):
+    # The parent of the index is a file, so the index can be neither read nor written.
+    index_path = str(tmpdir.join('not_a_directory', 'index.json'))
+    _touch(str(tmpdir.join('not_a_directory')))
+    index = LaunchFileIndex(index_path=index_path)
+    assert sorted(index.get_launch_file_paths(package_name='pkg')) == [
+        'a.launch.py', 'b.launch.py']
+    assert not os.path.isdir(os.path.dirname(index_path))
+
+
+def test_get_share_file_path_from_package(share_directory):
+    assert get_share_file_path_from_package(package_name='pkg', file_name='a.launch.py') == \
+        os.path.join(share_directory, 'launch', 'a.launch.py')
+    with pytest.raises(MultipleLaunchFilesError):
+        get_share_file_path_from_package(package_name='pkg', file_name='b.launch.py')
+    # Files which are not Python launch files are not indexed, but are still found.
+    assert get_share_file_path_from_package(
+        package_name='pkg', file_name='robot.launch.xml'
+    ) == os.path.join(share_directory, 'launch', 'robot.launch.xml')
+    with pytest.raises(FileNotFoundError):
+        get_share_file_path_from_package(package_name='pkg', file_name='missing.launch.xml')
+    with pytest.raises(FileNotFoundError):
+        get_share_file_path_from_package(package_name='pkg', file_name='missing.launch.py')
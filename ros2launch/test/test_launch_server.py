@@ -0,0 +1,192 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the LaunchServer and LaunchServerClient classes."""
+
+import os
+import queue
+import socket
+import stat
+import sys
+import textwrap
+import threading
+import time
+
+from launch.utilities import install_signal_handlers
+
+import pytest
+
+from ros2launch.api import LaunchServer
+from ros2launch.api import LaunchServerClient
+
+LAUNCH_FILE = textwrap.dedent("""
+    import sys
+
+    from launch import LaunchDescription
+    from launch.actions import DeclareLaunchArgument
+    from launch.actions import ExecuteProcess
+    from launch.substitutions import LaunchConfiguration
+
+
+    def generate_launch_description():
+        return LaunchDescription([
+            DeclareLaunchArgument('duration'),
+            ExecuteProcess(
+                cmd=[sys.executable, '-c', ['import time; time.sleep(',
+                                            LaunchConfiguration('duration'), ')']],
+                name='sleeper',
+            ),
+        ])
+""")
+
+FAILING_LAUNCH_FILE = textwrap.dedent("""
+    def generate_launch_description():
+        raise RuntimeError('failing on purpose')
+""")
+
+
+@pytest.fixture
+def socket_path(tmpdir):
+    return str(tmpdir / 'launch_server.sock')
+
+
+@pytest.fixture
+def launch_file(tmpdir):
+    path = str(tmpdir / 'sleeper.launch.py')
+    with open(path, 'w') as f:
+        f.write(LAUNCH_FILE)
+    return path
+
+
+@pytest.fixture
+def launch_server(socket_path):
+    """Run a launch server in a thread, and yield a client and a queue for its return code."""
+    # The signal handlers can only be installed from the main thread.
+    install_signal_handlers()
+    server = LaunchServer(socket_path=socket_path)
+    return_codes = queue.Queue()
+    thread = threading.Thread(target=lambda: return_codes.put(server.run()))
+    thread.start()
+    client = LaunchServerClient(socket_path=socket_path)
+    deadline = time.monotonic() + 10.0
+    while True:
+        try:
+            client.status()
+            break
+        except RuntimeError:
+            if time.monotonic() > deadline or not thread.is_alive():
+                raise
+            time.sleep(0.01)
+    try:
+        yield client, return_codes
+    finally:
+        if thread.is_alive():
+            client.shutdown()
+        thread.join(timeout=10.0)
+
+
+def _wait_for_processes(client, count):
+    deadline = time.monotonic() + 10.0
+    while time.monotonic() < deadline:
+        processes = client.status()['processes']
+        if len(processes) == count:
+            return processes
+        time.sleep(0.01)
+    raise AssertionError('expected {} processes, got {}'.format(count, processes))
+
+
+def test_include_and_status(launch_server, launch_file):
+    client, _ = launch_server
+    status = client.status()
+    assert status['pid'] == os.getpid()
+    assert status['includes'] == []
+    assert status['processes'] == {}
+
+    client.include(path=launch_file, launch_file_arguments=['duration:=30'])
+    processes = _wait_for_processes(client, 1)
+    [(name, pid)] = processes.items()
+    assert name.startswith('sleeper')
+    assert client.status()['includes'] == [
+        {'path': launch_file, 'arguments': [['duration', '30']]}]
+
+    # Processes which exit are no longer reported.
+    client.include(path=launch_file, launch_file_arguments=['duration:=0'])
+    _wait_for_processes(client, 2)
+    assert _wait_for_processes(client, 1) == processes
+
+
+def test_invalid_includes(launch_server, launch_file, tmpdir):
+    client, return_codes = launch_server
+    failing_launch_file = str(tmpdir / 'failing.launch.py')
+    with open(failing_launch_file, 'w') as f:
+        f.write(FAILING_LAUNCH_FILE)
+
+    with pytest.raises(RuntimeError, match='No such file'):
+        client.include(path=str(tmpdir / 'missing.launch.py'), launch_file_arguments=[])
+    with pytest.raises(RuntimeError, match='failing on purpose'):
+        client.include(path=failing_launch_file, launch_file_arguments=[])
+    with pytest.raises(RuntimeError, match="missing required launch argument 'duration'"):
+        client.include(path=launch_file, launch_file_arguments=[])
+    with pytest.raises(RuntimeError, match="unknown request 'foo'"):
+        client.request({'request': 'foo'})
+
+    # None of the failures affected the server.
+    assert return_codes.empty()
+    assert client.status()['includes'] == []
+    client.include(path=launch_file, launch_file_arguments=['duration:=30'])
+    _wait_for_processes(client, 1)
+
+
+def test_shutdown(launch_server, launch_file, socket_path):
+    client, return_codes = launch_server
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    client.include(path=launch_file, launch_file_arguments=['duration:=30'])
+    _wait_for_processes(client, 1)
+
+    client.shutdown()
+    assert return_codes.get(timeout=10.0) == 0
+    assert not os.path.exists(socket_path)
+    with pytest.raises(RuntimeError, match='failed to reach launch server'):
+        client.status()
+
+
+def test_socket_in_use(launch_server, socket_path):
+    with pytest.raises(RuntimeError, match='already listening'):
+        LaunchServer(socket_path=socket_path).run()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs Unix domain sockets')
+def test_stale_socket(socket_path):
+    # Left behind by a server which didn't exit cleanly.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(socket_path)
+    assert os.path.exists(socket_path)
+
+    install_signal_handlers()
+    server = LaunchServer(socket_path=socket_path)
+    return_codes = queue.Queue()
+    thread = threading.Thread(target=lambda: return_codes.put(server.run()))
+    thread.start()
+    client = LaunchServerClient(socket_path=socket_path)
+    deadline = time.monotonic() + 10.0
+    while True:
+        try:
+            client.shutdown()
+            break
+        except RuntimeError:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    thread.join(timeout=10.0)
+    assert return_codes.get(block=False) == 0
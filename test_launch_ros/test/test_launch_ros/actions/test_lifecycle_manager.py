@@ -0,0 +1,229 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the LifecycleManager action."""
+
+import threading
+
+from launch import LaunchDescription
+from launch import LaunchService
+from launch.actions import EmitEvent
+from launch.actions import OpaqueFunction
+from launch.actions import RegisterEventHandler
+from launch.event_handler import EventHandler
+from launch.event_handlers import OnShutdown
+from launch_ros.actions import LifecycleManager
+from launch_ros.actions import LifecycleNode
+from launch_ros.actions.lifecycle_manager import _sort_topologically
+from launch_ros.events.lifecycle import ChangeState
+from launch_ros.events.lifecycle import ChangeStateCompleted
+from launch_ros.events.lifecycle import StateTransition
+
+import lifecycle_msgs.msg
+
+import pytest
+
+_GOAL_STATES = {
+    lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE:
+        lifecycle_msgs.msg.State.PRIMARY_STATE_INACTIVE,
+    lifecycle_msgs.msg.Transition.TRANSITION_ACTIVATE:
+        lifecycle_msgs.msg.State.PRIMARY_STATE_ACTIVE,
+}
+
+
+def test_sort_topologically():
+    levels = _sort_topologically({
+        'a': [],
+        'b': ['a'],
+        'c': ['a', 'e'],
+        'd': ['b', 'c'],
+    })
+    # Nodes which only appear as dependencies are sorted as well.
+    assert [sorted(level) for level in levels] == [['a', 'e'], ['b', 'c'], ['d']]
+    assert _sort_topologically({}) == []
+
+
+def test_sort_topologically_rejects_cycles():
+    with pytest.raises(ValueError, match='cycle'):
+        _sort_topologically({'a': ['a']})
+    with pytest.raises(ValueError, match='cycle, between 3 lifecycle nodes'):
+        _sort_topologically({'a': [], 'b': ['a', 'd'], 'c': ['b'], 'd': ['c']})
+    with pytest.raises(ValueError):
+        LifecycleManager(lifecycle_nodes={'a': ['b'], 'b': ['a']})
+
+
+def _create_lifecycle_node(name):
+    node = LifecycleNode(package='pkg', node_executable='exe', node_name=name)
+    # Set what executing the action would, without launching anything.
+    node._Node__final_node_name = name
+    return node
+
+
+def _state_transition(node, goal_state_id):
+    msg = lifecycle_msgs.msg.TransitionEvent()
+    msg.goal_state.id = goal_state_id
+    return StateTransition(action=node, msg=msg)
+
+
+def _manage(lifecycle_nodes, respond, *, transition_timeout=10.0):
+    """
+    Run a LifecycleManager, with fake lifecycle nodes which respond to ChangeState events.
+
+    The respond callable is given each lifecycle node and transition id, and
+    returns the state the lifecycle node ends up in, None if it does not
+    respond at all, and whether the change state service call succeeded.
+
+    :returns: the transitions made, as (node name, transition id) pairs, and
+        the reasons of the shutdowns
+    """
+    transitions = []
+    shutdown_reasons = []
+
+    def on_change_state(context):
+        event = context.locals.event
+        actions = []
+        results = []
+        for node in nodes:
+            if not event.lifecycle_node_matcher(node):
+                continue
+            transitions.append((node.node_name, event.transition_id))
+            goal_state_id, success = respond(node, event.transition_id)
+            if goal_state_id is None:
+                continue
+            actions.append(EmitEvent(event=_state_transition(node, goal_state_id)))
+            results.append((node, success))
+        if results:
+            actions.append(EmitEvent(event=ChangeStateCompleted(
+                change_state_event=event, results=results)))
+        return actions
+
+    nodes = set(lifecycle_nodes)
+    for node_dependencies in lifecycle_nodes.values():
+        nodes.update(node_dependencies)
+    ld = LaunchDescription([
+        RegisterEventHandler(EventHandler(
+            matcher=lambda event: isinstance(event, ChangeState),
+            entities=OpaqueFunction(function=on_change_state),
+        )),
+        RegisterEventHandler(OnShutdown(
+            on_shutdown=lambda event, context: shutdown_reasons.append(event.reason),
+        )),
+        LifecycleManager(
+            lifecycle_nodes=lifecycle_nodes, transition_timeout=transition_timeout),
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    thread = threading.Thread(target=ls.run)
+    thread.start()
+    thread.join(timeout=10.0)
+    assert not thread.is_alive(), 'the launch service did not finish'
+    return transitions, shutdown_reasons
+
+
+def _succeed(node, transition_id):
+    return _GOAL_STATES[transition_id], True
+
+
+def test_lifecycle_manager_activates_in_dependency_order():
+    a, b, c, d = [_create_lifecycle_node(name) for name in 'abcd']
+    transitions, shutdown_reasons = _manage({b: [a], c: [a], d: [b, c]}, _succeed)
+    configure = lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE
+    activate = lifecycle_msgs.msg.Transition.TRANSITION_ACTIVATE
+    assert sorted(transitions) == sorted(
+        (node.node_name, transition_id)
+        for node in (a, b, c, d) for transition_id in (configure, activate))
+    # Each lifecycle node is configured and activated after its dependencies are active.
+    for node, dependencies in ((a, []), (b, [a]), (c, [a]), (d, [b, c])):
+        configured_at = transitions.index((node.node_name, configure))
+        assert configured_at < transitions.index((node.node_name, activate))
+        for dependency in dependencies:
+            assert transitions.index((dependency.node_name, activate)) < configured_at
+    assert shutdown_reasons == ['idle']
+
+
+def test_lifecycle_manager_records_transition_latencies():
+    a = _create_lifecycle_node('a')
+    manager = LifecycleManager(lifecycle_nodes={a: []})
+    ld = LaunchDescription([
+        RegisterEventHandler(EventHandler(
+            matcher=lambda event: isinstance(event, ChangeState),
+            entities=OpaqueFunction(function=lambda context: [
+                EmitEvent(event=_state_transition(
+                    a, _GOAL_STATES[context.locals.event.transition_id])),
+            ]),
+        )),
+        manager,
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    assert ls.run() == 0
+    assert sorted(manager.transition_latencies) == ['a']
+    assert sorted(manager.transition_latencies['a']) == [
+        'TRANSITION_ACTIVATE', 'TRANSITION_CONFIGURE']
+    assert all(latency >= 0.0 for latency in manager.transition_latencies['a'].values())
+
+
+def test_lifecycle_manager_shuts_down_when_a_call_fails():
+    a, b = _create_lifecycle_node('a'), _create_lifecycle_node('b')
+
+    def respond(node, transition_id):
+        # The state doesn't change when the change state service call fails.
+        if node is a and transition_id == lifecycle_msgs.msg.Transition.TRANSITION_ACTIVATE:
+            return lifecycle_msgs.msg.State.TRANSITION_STATE_ACTIVATING, False
+        return _succeed(node, transition_id)
+
+    transitions, shutdown_reasons = _manage({b: [a]}, respond)
+    # The lifecycle nodes depending on the failed one are left alone.
+    assert transitions == [
+        ('a', lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE),
+        ('a', lifecycle_msgs.msg.Transition.TRANSITION_ACTIVATE),
+    ]
+    assert len(shutdown_reasons) == 1
+    assert "transition 'TRANSITION_ACTIVATE' of lifecycle node 'a' failed" in \
+        shutdown_reasons[0]
+    assert 'change state service call failed' in shutdown_reasons[0]
+
+
+def test_lifecycle_manager_shuts_down_when_a_transition_ends_in_another_state():
+    a = _create_lifecycle_node('a')
+
+    def respond(node, transition_id):
+        return lifecycle_msgs.msg.State.PRIMARY_STATE_UNCONFIGURED, True
+
+    transitions, shutdown_reasons = _manage({a: []}, respond)
+    assert transitions == [('a', lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE)]
+    assert len(shutdown_reasons) == 1
+    assert "transition 'TRANSITION_CONFIGURE' of lifecycle node 'a' failed" in \
+        shutdown_reasons[0]
+    assert "transition ended in state 'PRIMARY_STATE_UNCONFIGURED'" in shutdown_reasons[0]
+
+
+def test_lifecycle_manager_shuts_down_when_a_transition_times_out():
+    a, b = _create_lifecycle_node('a'), _create_lifecycle_node('b')
+
+    def respond(node, transition_id):
+        if node is a:
+            return None, False
+        return _succeed(node, transition_id)
+
+    transitions, shutdown_reasons = _manage({a: [], b: []}, respond, transition_timeout=0.2)
+    # The lifecycle nodes which don't depend on the stuck one are still activated.
+    assert sorted(transitions) == sorted([
+        ('a', lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE),
+        ('b', lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE),
+        ('b', lifecycle_msgs.msg.Transition.TRANSITION_ACTIVATE),
+    ])
+    assert shutdown_reasons == [
+        "transition 'TRANSITION_CONFIGURE' of lifecycle node 'a' timed out after 0.2 s"]
@@ -0,0 +1,182 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the state transitions of the LifecycleNode action."""
+
+import threading
+
+from launch import LaunchDescription
+from launch import LaunchService
+from launch.actions import EmitEvent
+from launch.actions import OpaqueFunction
+from launch.actions import RegisterEventHandler
+from launch.actions import TimerAction
+from launch.event_handler import EventHandler
+from launch.events import Shutdown
+from launch_ros.actions import LifecycleNode
+from launch_ros.events.lifecycle import ChangeState
+from launch_ros.events.lifecycle import ChangeStateCompleted
+
+import lifecycle_msgs.msg
+import lifecycle_msgs.srv
+
+
+class StubFuture:
+    """Future like the ones of rclpy, completed from another thread."""
+
+    def __init__(self):
+        self.__callbacks = []
+        self.__result = None
+        self.__exception = None
+
+    def add_done_callback(self, callback):
+        self.__callbacks.append(callback)
+
+    def result(self):
+        return self.__result
+
+    def exception(self):
+        return self.__exception
+
+    def complete(self, result=None, exception=None):
+        self.__result = result
+        self.__exception = exception
+        for callback in self.__callbacks:
+            callback(self)
+
+
+class StubClient:
+    """Change state service client which responds after a delay, if ever."""
+
+    def __init__(self, calls, *, success=True, exception=None, delay=0.05):
+        self.srv_name = 'change_state'
+        self.__calls = calls
+        self.__success = success
+        self.__exception = exception
+        self.__delay = delay
+
+    def service_is_ready(self):
+        return True
+
+    def call_async(self, request):
+        future = StubFuture()
+        self.__calls.start()
+        if self.__delay is not None:
+            def respond():
+                self.__calls.stop()
+                response = lifecycle_msgs.srv.ChangeState.Response()
+                response.success = self.__success
+                future.complete(response, self.__exception)
+            threading.Timer(self.__delay, respond).start()
+        return future
+
+
+class Calls:
+    """Count the calls in progress, and their maximum."""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.in_progress = 0
+        self.max_in_progress = 0
+
+    def start(self):
+        with self.__lock:
+            self.in_progress += 1
+            self.max_in_progress = max(self.max_in_progress, self.in_progress)
+
+    def stop(self):
+        with self.__lock:
+            self.in_progress -= 1
+
+
+def _create_lifecycle_node(name, client):
+    node = LifecycleNode(package='pkg', node_executable='exe', node_name=name)
+    # Set what executing the action would, without launching anything.
+    node._Node__final_node_name = name
+    node._LifecycleNode__rclpy_change_state_client = client
+    return node
+
+
+def _change_states(nodes, change_state_event, *, actions=()):
+    """Emit the event, as handled by the given nodes, and return the completion events."""
+    completed_events = []
+    ld = LaunchDescription([
+        RegisterEventHandler(EventHandler(
+            matcher=lambda event: isinstance(event, ChangeState),
+            entities=[OpaqueFunction(function=node._on_change_state_event) for node in nodes],
+        )),
+        RegisterEventHandler(EventHandler(
+            matcher=lambda event: isinstance(event, ChangeStateCompleted),
+            entities=OpaqueFunction(
+                function=lambda context: completed_events.append(context.locals.event)),
+        )),
+        EmitEvent(event=change_state_event),
+        *actions,
+    ])
+    ls = LaunchService()
+    ls.include_launch_description(ld)
+    thread = threading.Thread(target=ls.run)
+    thread.start()
+    thread.join(timeout=10.0)
+    assert not thread.is_alive(), 'the launch service did not finish'
+    return completed_events
+
+
+def test_change_state_completed():
+    calls = Calls()
+    nodes = [
+        _create_lifecycle_node('succeeding', StubClient(calls)),
+        _create_lifecycle_node('failing', StubClient(calls, success=False)),
+        _create_lifecycle_node('raising', StubClient(calls, exception=RuntimeError('dead'))),
+        _create_lifecycle_node('ignored', StubClient(calls)),
+    ]
+    event = ChangeState(
+        lifecycle_node_matcher=lambda node: node.node_name != 'ignored',
+        transition_id=lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE)
+    completed_events = _change_states(nodes, event)
+    # One completion event per ChangeState event, with the result of each targeted node.
+    assert len(completed_events) == 1
+    completed_event = completed_events[0]
+    assert completed_event.change_state_event is event
+    assert completed_event.results == [(nodes[0], True), (nodes[1], False), (nodes[2], False)]
+    assert not completed_event.succeeded
+    assert calls.max_in_progress == 3
+
+
+def test_max_concurrent_transitions():
+    for max_concurrent_transitions, expected_max_in_progress in ((None, 5), (2, 2), (1, 1)):
+        calls = Calls()
+        nodes = [_create_lifecycle_node('node_{}'.format(i), StubClient(calls)) for i in range(5)]
+        completed_events = _change_states(nodes, ChangeState(
+            lifecycle_node_matcher=lambda node: True,
+            transition_id=lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE,
+            max_concurrent_transitions=max_concurrent_transitions))
+        assert len(completed_events) == 1
+        assert completed_events[0].succeeded
+        assert calls.max_in_progress == expected_max_in_progress
+
+
+def test_change_state_abandoned_on_shutdown():
+    calls = Calls()
+    # The service never responds, e.g. because the node died.
+    nodes = [_create_lifecycle_node('unresponsive', StubClient(calls, delay=None))]
+    completed_events = _change_states(nodes, ChangeState(
+        lifecycle_node_matcher=lambda node: True,
+        transition_id=lifecycle_msgs.msg.Transition.TRANSITION_CONFIGURE,
+    ), actions=[TimerAction(period=0.2, actions=[EmitEvent(event=Shutdown())])])
+    assert calls.in_progress == 1
+    # The transition is reported as failed, rather than blocking the shutdown.
+    assert len(completed_events) == 1
+    assert completed_events[0].results == [(nodes[0], False)]
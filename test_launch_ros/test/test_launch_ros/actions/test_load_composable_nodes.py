@@ -0,0 +1,129 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the LoadComposableNodes Action."""
+
+import threading
+
+import composition_interfaces.srv
+from launch import LaunchDescription
+from launch import LaunchService
+import launch_ros
+from launch_ros.actions import LoadComposableNodes
+from launch_ros.descriptions import ComposableNode
+import rclpy
+import rclpy.context
+import rclpy.executors
+from rclpy.parameter import Parameter
+
+
+class StandInContainer:
+    """
+    Local stand-in for a component container, which records the load requests it receives.
+
+    It runs in this process, with its own rclpy context, as the launch_ros
+    node uses the default one.
+    """
+
+    def __init__(self, *, node_name, node_namespace):
+        self.requests = []
+        self.__context = rclpy.context.Context()
+        rclpy.init(context=self.__context)
+        self.__node = rclpy.create_node(
+            node_name, namespace=node_namespace, context=self.__context)
+        self.__service = self.__node.create_service(
+            composition_interfaces.srv.LoadNode, '~/_container/load_node', self.__load_node)
+        self.__executor = rclpy.executors.SingleThreadedExecutor(context=self.__context)
+        self.__executor.add_node(self.__node)
+        self.__thread = threading.Thread(target=self.__spin)
+
+    def __load_node(self, request, response):
+        self.requests.append(request)
+        response.success = True
+        response.full_node_name = '{}/{}'.format(
+            request.node_namespace.rstrip('/'), request.node_name or 'default_name')
+        response.unique_id = len(self.requests)
+        return response
+
+    def __spin(self):
+        while self.__context.ok():
+            self.__executor.spin_once(timeout_sec=0.1)
+
+    def __enter__(self):
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        rclpy.shutdown(context=self.__context)
+        self.__thread.join()
+        self.__node.destroy_node()
+
+
+def _get_parameters(parameter_msgs):
+    return {
+        msg.name: Parameter.from_parameter_msg(msg).value for msg in parameter_msgs
+    }
+
+
+def _run(actions):
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription(
+        [launch_ros.get_default_launch_description()] + actions))
+    assert 0 == ls.run()
+
+
+def test_load_composable_nodes(tmp_path):
+    """Test loading composable nodes into a stand-in container."""
+    param_file_path = tmp_path / 'params.yaml'
+    param_file_path.write_text(
+        '/**:\n'
+        '  ros__parameters:\n'
+        '    shared: 1\n'
+        'my_ns:\n'
+        '  talker:\n'
+        '    ros__parameters:\n'
+        '      from_file: file\n'
+        'other_node:\n'
+        '  ros__parameters:\n'
+        '    ignored: true\n'
+    )
+    with StandInContainer(node_name='container', node_namespace='/test') as container:
+        _run([LoadComposableNodes(
+            target_container='/test/container',
+            composable_node_descriptions=[
+                ComposableNode(
+                    package='composition', node_plugin='composition::Talker',
+                    node_name='talker', node_namespace='my_ns',
+                    parameters=[param_file_path, {'param': 'value', 'group': {'nested': 2.0}}],
+                    remappings=[('chatter', 'new_chatter')],
+                    extra_arguments=[{'use_intra_process_comms': True}],
+                ),
+                ComposableNode(package='composition', node_plugin='composition::Listener'),
+            ],
+        )])
+    requests = sorted(container.requests, key=lambda request: request.plugin_name)
+    assert [request.plugin_name for request in requests] == [
+        'composition::Listener', 'composition::Talker']
+    listener, talker = requests
+    assert listener.package_name == 'composition'
+    assert listener.node_name == ''
+    assert listener.node_namespace == ''
+    assert listener.parameters == []
+    assert listener.remap_rules == []
+    assert talker.node_name == 'talker'
+    assert talker.node_namespace == '/my_ns'
+    assert _get_parameters(talker.parameters) == {
+        'shared': 1, 'from_file': 'file', 'param': 'value', 'group.nested': 2.0}
+    assert talker.remap_rules == ['chatter:=new_chatter']
+    assert _get_parameters(talker.extra_arguments) == {'use_intra_process_comms': True}
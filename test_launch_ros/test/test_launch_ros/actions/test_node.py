@@ -20,7 +20,9 @@ import unittest
 
 from launch import LaunchDescription
 from launch import LaunchService
+from launch.actions import RegisterEventHandler
 from launch.actions import Shutdown
+from launch.event_handlers.on_process_start import OnProcessStart
 from launch.substitutions import EnvironmentVariable
 import launch_ros.actions.node
 import yaml
@@ -154,29 +156,49 @@ class TestNode(unittest.TestCase):
                 }
             }],
         )
-        self._assert_launch_no_errors([node_action])
+        # The generated parameter files are removed at shutdown, so read them once started.
+        expanded_parameters_dicts = []
+
+        def on_start(event, context):
+            for param_file_path in node_action._Node__expanded_parameter_files:
+                with open(param_file_path, 'r') as h:
+                    expanded_parameters_dicts.append(yaml.safe_load(h))
+
+        self._assert_launch_no_errors([
+            node_action,
+            RegisterEventHandler(OnProcessStart(target_action=node_action, on_start=on_start)),
+        ])
 
         # Check the expanded parameters (will be written to a file).
         expanded_parameter_files = node_action._Node__expanded_parameter_files
         assert len(expanded_parameter_files) == 1
-        with open(expanded_parameter_files[0], 'r') as h:
-            expanded_parameters_dict = yaml.load(h)
-            assert expanded_parameters_dict == {
-                '/my_ns': {
-                    'my_node': {
-                        'ros__parameters': {
-                            'param1': 'param1_value',
-                            'param2': 'param2_value',
-                            'param_group1': {
-                                'list_params': [1.2, 3.4],
-                                'param_group2': {
-                                    'param2_values': ['param2_value'],
-                                }
+        assert not os.path.exists(expanded_parameter_files[0])
+        assert len(expanded_parameters_dicts) == 1
+        assert expanded_parameters_dicts[0] == {
+            '/my_ns': {
+                'my_node': {
+                    'ros__parameters': {
+                        'param1': 'param1_value',
+                        'param2': 'param2_value',
+                        'param_group1': {
+                            'list_params': [1.2, 3.4],
+                            'param_group2': {
+                                'param2_values': ['param2_value'],
                             }
                         }
                     }
                 }
             }
+        }
+
+    def test_launch_nodes_with_identical_parameter_dicts(self):
+        """Test that nodes with identical parameters share one parameter file."""
+        node_actions = [self._create_node(parameters=[{'param': 'value'}]) for _ in range(3)]
+        self._assert_launch_no_errors(node_actions)
+        expanded_parameter_files = {
+            node_action._Node__expanded_parameter_files[0] for node_action in node_actions}
+        assert len(expanded_parameter_files) == 1
+        assert not os.path.exists(expanded_parameter_files.pop())
 
     def test_create_node_with_invalid_parameters(self):
         """Test launching a node with invalid parameters."""
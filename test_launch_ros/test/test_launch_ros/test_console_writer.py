@@ -0,0 +1,86 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ConsoleWriter class."""
+
+import asyncio
+import time
+
+from launch_ros.utilities import ConsoleWriter
+import pytest
+
+CHUNKS = [
+    'first line\nsecond line\n',
+    'no line ending',
+    '',
+    '\n\nblank lines\r\nand carriage returns\rü\n',
+]
+
+
+def _print_like_before(chunks, prefix):
+    for text in chunks:
+        if prefix is None:
+            print(text, end='')
+        else:
+            for line in text.splitlines():
+                print('{}{}'.format(prefix, line))
+
+
+@pytest.mark.parametrize('prefix', [None, '[talker-1] '])
+def test_output_is_the_same_as_printing(capsys, prefix):
+    _print_like_before(CHUNKS, prefix)
+    expected = capsys.readouterr().out
+
+    console_writer = ConsoleWriter(flush_period=0)
+    for text in CHUNKS:
+        console_writer.write(text, prefix=prefix)
+    assert capsys.readouterr().out == expected
+
+
+def test_output_is_buffered_until_flushed(capsys):
+    console_writer = ConsoleWriter(flush_period=60, use_thread=True)
+    console_writer.write('some output\n', prefix='[talker-1] ')
+    print('printed')
+    assert capsys.readouterr().out == 'printed\n'
+    console_writer.flush()
+    assert capsys.readouterr().out == '[talker-1] some output\n'
+
+
+def test_flush_on_the_asyncio_loop(capsys):
+    console_writer = ConsoleWriter(flush_period=0.01)
+
+    async def write_and_wait():
+        console_writer.write('first\n')
+        console_writer.write('second\n')
+        assert capsys.readouterr().out == ''
+        await asyncio.sleep(0.1)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(write_and_wait())
+    finally:
+        loop.close()
+    assert capsys.readouterr().out == 'first\nsecond\n'
+
+
+def test_flush_on_a_thread(capsys):
+    console_writer = ConsoleWriter(flush_period=0.01, use_thread=True)
+    console_writer.write('first\n', prefix='[talker-1] ')
+    console_writer.write('second\n', prefix='[listener-2] ')
+    deadline = time.monotonic() + 10
+    output = ''
+    while time.monotonic() < deadline and output.count('\n') < 2:
+        time.sleep(0.01)
+        output += capsys.readouterr().out
+    assert output == '[talker-1] first\n[listener-2] second\n'
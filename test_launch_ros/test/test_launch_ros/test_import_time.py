@@ -0,0 +1,49 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for the time it takes to import the launch_ros package."""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+BENCHMARK = textwrap.dedent("""
+    import json
+    import sys
+    import time
+    sys.path[:0] = {sys_path!r}
+    start = time.perf_counter()
+    import launch_ros
+    launch_ros.actions.Node
+    launch_ros.get_default_launch_description()
+    import_time = time.perf_counter() - start
+    print(json.dumps({{
+        'import_time': import_time,
+        'imported_modules': sorted(sys.modules),
+    }}))
+""")
+
+
+def test_import_time():
+    """Test that rclpy and unused actions are not imported until needed."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', BENCHMARK.format(sys_path=sys.path)])
+    result = json.loads(output.decode())
+    print('import launch_ros: {:.1f} ms'.format(result['import_time'] * 1000))
+    assert 'launch_ros.actions.node' in result['imported_modules']
+    assert 'rclpy' not in result['imported_modules']
+    assert 'yaml' not in result['imported_modules']
+    assert 'launch_ros.actions.lifecycle_node' not in result['imported_modules']
+    assert 'lifecycle_msgs' not in result['imported_modules']